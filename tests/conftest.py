@@ -0,0 +1,55 @@
+import pathlib
+from collections.abc import Iterator
+from threading import Event
+
+import pytest
+from rich.progress import Progress
+
+from tidal_dl_ng.config import Settings
+from tidal_dl_ng.download import Download
+from tidal_dl_ng.helper.decorator import SingletonMeta
+from tidal_dl_ng.helper.wrapper import LoggerWrapped
+from tidal_dl_ng.model.cfg import Settings as ModelSettings
+
+
+@pytest.fixture(autouse=True)
+def settings(tmp_path: pathlib.Path) -> Iterator[ModelSettings]:
+    """Run every test with fresh process-wide singletons and default settings.
+
+    The settings are neither read from nor written to the config of the user. Tests can change them through the
+    yielded data, like the preferences dialog does.
+    """
+    instances: dict = dict(SingletonMeta._instances)
+    config: Settings = object.__new__(Settings)
+    config.cls_model = ModelSettings
+    config.path_base = str(tmp_path)
+    config.file_path = str(tmp_path / "settings.json")
+    config.data = ModelSettings()
+
+    SingletonMeta._instances.clear()
+    SingletonMeta._instances[Settings] = config
+
+    yield config.data
+
+    SingletonMeta._instances.clear()
+    SingletonMeta._instances.update(instances)
+
+
+@pytest.fixture
+def download(tmp_path: pathlib.Path) -> Download:
+    """Download into `tmp_path` without a TIDAL session. Log messages are collected in `messages` of the logger."""
+    messages: list[str] = []
+    fn_logger: LoggerWrapped = LoggerWrapped(messages.append)
+    fn_logger.messages = messages
+    event_run: Event = Event()
+
+    event_run.set()
+
+    return Download(
+        session=None,
+        path_base=str(tmp_path),
+        fn_logger=fn_logger,
+        progress=Progress(disable=True),
+        event_abort=Event(),
+        event_run=event_run,
+    )
@@ -0,0 +1,114 @@
+import pathlib
+from concurrent import futures
+from threading import Event
+
+import pytest
+
+from tidal_dl_ng.helper.cover import CoverCache
+from tidal_dl_ng.helper.decorator import SingletonMeta
+
+
+class _Fetch:
+    def __init__(self, data: bytes = b"cover", event_release: Event | None = None):
+        self.calls: int = 0
+        self.data = data
+        self.event_release = event_release
+
+    def __call__(self) -> bytes:
+        self.calls += 1
+
+        if self.event_release:
+            self.event_release.wait()
+
+        return self.data
+
+
+def _restart(**kwargs) -> CoverCache:
+    # Like a new process: Drop the cache in memory.
+    SingletonMeta._instances.pop(CoverCache, None)
+
+    return CoverCache(**kwargs)
+
+
+def test_fetches_once():
+    cache = CoverCache(items_max=2)
+    fetch = _Fetch()
+
+    assert cache.get((1, 1280), fetch) == b"cover"
+    assert cache.get((1, 1280), fetch) == b"cover"
+    assert fetch.calls == 1
+
+
+def test_evicts_least_recently_used():
+    cache = CoverCache(items_max=2)
+    fetch = _Fetch()
+
+    cache.get(1, fetch)
+    cache.get(2, fetch)
+    cache.get(1, fetch)
+    cache.get(3, fetch)
+
+    assert list(cache.items) == [1, 3]
+
+
+def test_concurrent_requests_share_fetch():
+    event_release = Event()
+    fetch = _Fetch(event_release=event_release)
+    cache = CoverCache(items_max=2)
+
+    with futures.ThreadPoolExecutor(4) as executor:
+        futures_get: list[futures.Future] = [executor.submit(cache.get, 1, fetch) for _ in range(4)]
+
+        event_release.set()
+
+        assert [future.result() for future in futures_get] == [b"cover"] * 4
+
+    assert fetch.calls == 1
+    assert not cache.fetches
+
+
+def test_failed_fetch_is_retried():
+    cache = CoverCache(items_max=2)
+    fetch = _Fetch(data=b"")
+
+    assert cache.get(1, fetch) == b""
+    assert cache.get(1, fetch) == b""
+    assert fetch.calls == 2
+
+
+def test_fetch_error_is_raised_and_retried():
+    cache = CoverCache(items_max=2)
+
+    def fn_fetch() -> bytes:
+        raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        cache.get(1, fn_fetch)
+
+    assert cache.get(1, _Fetch()) == b"cover"
+
+
+def test_disk_tier_survives_restart(tmp_path: pathlib.Path):
+    path_dir: pathlib.Path = tmp_path / "covers"
+    CoverCache(items_max=2, path_dir=path_dir).get((1, 1280), _Fetch())
+    fetch = _Fetch(data=b"other")
+
+    # Memory tier disabled: Read from disk.
+    cache = _restart(items_max=0, path_dir=path_dir)
+
+    assert cache.get((1, 1280), fetch) == b"cover"
+    assert cache.get((1, 1280), fetch) == b"cover"
+    assert fetch.calls == 0
+    assert not cache.items
+    # Temp files are renamed into place.
+    assert len(list(path_dir.iterdir())) == 1
+
+
+def test_disk_tier_from_settings(settings, monkeypatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr("tidal_dl_ng.helper.cover.path_config_base", lambda: str(tmp_path))
+
+    assert CoverCache().path_dir is None
+
+    settings.cover_cache_disk = True
+
+    assert _restart().path_dir.is_relative_to(tmp_path)
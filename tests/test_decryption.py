@@ -0,0 +1,34 @@
+import os
+
+import pytest
+from Crypto.Cipher import AES
+
+from tidal_dl_ng.helper.decryption import decryptor_ctr
+
+KEY: bytes = bytes(range(16))
+NONCE: bytes = bytes(range(8))
+PLAIN: bytes = os.urandom(1000)
+
+
+def _encrypt(data: bytes) -> bytes:
+    return AES.new(KEY, AES.MODE_CTR, nonce=NONCE, initial_value=0).encrypt(data)
+
+
+@pytest.mark.parametrize("offset", [0, 1, 7, 15, 16, 17, 33, 999])
+def test_decrypts_from_offset(offset: int):
+    encrypted = _encrypt(PLAIN)
+
+    assert decryptor_ctr(KEY, NONCE, offset).decrypt(encrypted[offset:]) == PLAIN[offset:]
+
+
+def test_decrypts_consecutive_chunks_of_odd_size():
+    encrypted = _encrypt(PLAIN)
+    decryptor = decryptor_ctr(KEY, NONCE, 5)
+    chunks: list[bytes] = []
+    position = 5
+
+    for size in (3, 11, 29, 1, 100):
+        chunks.append(decryptor.decrypt(encrypted[position : position + size]))
+        position += size
+
+    assert b"".join(chunks) == PLAIN[5:position]
@@ -0,0 +1,218 @@
+import http.server
+import os
+import pathlib
+from collections.abc import Iterator
+from threading import Thread
+from types import SimpleNamespace
+
+import pytest
+from rich.progress import TaskID
+from tidalapi import Album, Video
+from tidalapi.exceptions import TooManyRequests
+
+from tidal_dl_ng.constants import (
+    RANGE_PART_SIZE_MIN,
+    THROTTLE_ATTEMPTS_MAX,
+    DownloadEngine,
+    MediaType,
+    QueueDownloadStatus,
+)
+from tidal_dl_ng.download import Download
+from tidal_dl_ng.helper.jobs import JobQueue
+
+DATA: bytes = os.urandom(3 * RANGE_PART_SIZE_MIN + 123)
+MESSAGE_THROTTLED: str = "Too many requests against TIDAL backend. Item failed, it is retried later."
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Whether `Range` headers are honoured, although byte ranges are always advertised.
+    ranges_supported: bool = True
+    # Set per server: Requested ranges and URL of the stream.
+    ranges: list[str | None]
+    url: str
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(DATA)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        byte_range: str | None = self.headers.get("Range")
+        self.ranges.append(byte_range)
+
+        if byte_range and self.ranges_supported:
+            start, end = (int(value) for value in byte_range.removeprefix("bytes=").split("-"))
+            data: bytes = DATA[start : end + 1]
+
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(DATA)}")
+        else:
+            data = DATA
+
+            self.send_response(200)
+
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def server() -> Iterator[type[_Handler]]:
+    handler: type[_Handler] = type("Handler", (_Handler,), {"ranges": []})
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    handler.url = f"http://127.0.0.1:{httpd.server_address[1]}/stream"
+
+    Thread(target=httpd.serve_forever, daemon=True).start()
+
+    yield handler
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(params=list(DownloadEngine))
+def download_stream(request, settings, download: Download, server: type[_Handler]) -> Download:
+    # Single URL stream of the test server, split into three byte ranges.
+    settings.download_engine = request.param
+    settings.downloads_simultaneous_per_track_max = 3
+    download._get_media_urls = lambda media, stream_manifest=None: [server.url]
+
+    return download
+
+
+def _video() -> Video:
+    video: Video = Video.__new__(Video)
+    video.name = "Title"
+    video.artists = []
+
+    return video
+
+
+def test_downloads_byte_ranges(download_stream: Download, server: type[_Handler], tmp_path: pathlib.Path):
+    result, path_file = download_stream._download(_video(), tmp_path / "video.ts")
+
+    assert result
+    assert path_file.read_bytes() == DATA
+    assert len(server.ranges) == 3
+    assert all(server.ranges)
+
+
+def test_falls_back_to_single_stream(download_stream: Download, server: type[_Handler], tmp_path: pathlib.Path):
+    server.ranges_supported = False
+
+    result, path_file = download_stream._download(_video(), tmp_path / "video.ts")
+
+    assert result
+    assert path_file.read_bytes() == DATA
+    # The whole file once more, without a range.
+    assert server.ranges[-1] is None
+    assert server.ranges.count(None) == 1
+    assert any("Byte range requests not honoured" in message for message in download_stream.fn_logger.messages)
+
+
+@pytest.fixture
+def download_lists(download: Download, monkeypatch) -> Download:
+    # Albums 1, 2, ... with three items each: 101, 102, 103, 201, ...
+    def fn_validate(media, media_id, media_type, video_download) -> Album:
+        album: Album = Album.__new__(Album)
+        album.id = media_id if media_id is not None else media
+
+        return album
+
+    def fn_context(media: Album, file_template: str, video_download: bool) -> tuple[str, str, str, list, bool]:
+        items: list[SimpleNamespace] = [SimpleNamespace(id=media.id * 100 + number) for number in range(1, 4)]
+
+        return str(media.id), f"Album {media.id}", f"Album {media.id}", items, True
+
+    monkeypatch.setattr(download, "_validate_and_prepare_media", fn_validate)
+    monkeypatch.setattr(download, "_setup_collection_download_context", fn_context)
+    # Job queues in memory.
+    monkeypatch.setattr(download, "_path_jobs", lambda media: None)
+    download.settings.data.playlist_create = False
+
+    return download
+
+
+def test_items_many_downloads_all_lists(download_lists: Download, monkeypatch):
+    items_started: list[int] = []
+    items_failing: set[int] = {102, 201}
+
+    def fn_item(media: SimpleNamespace, futures_postprocess: list, **kwargs) -> tuple[bool, str]:
+        items_started.append(media.id)
+
+        if media.id in items_failing:
+            items_failing.discard(media.id)
+
+            return False, f"{media.id}.flac"
+
+        return True, f"{media.id}.flac"
+
+    monkeypatch.setattr(download_lists, "item", fn_item)
+
+    download_lists.items_many("{album_title}", [1, 2], MediaType.ALBUM, download_delay=False)
+
+    # Failed items are retried once all lists have been dispatched.
+    assert sorted(items_started[:6]) == [101, 102, 103, 201, 202, 203]
+    assert sorted(items_started[6:]) == [102, 201]
+    assert [(task.completed, task.total) for task in download_lists.progress.tasks] == [(3, 3), (3, 3)]
+    assert download_lists.fn_logger.messages[-2:] == ["Finished list 'Album 1'.", "Finished list 'Album 2'."]
+
+
+class _JobThrottled:
+    # Throttled the given number of times, then downloaded.
+    def __init__(self, throttles: int):
+        self.calls: int = 0
+        self.throttles = throttles
+
+    def __call__(self) -> tuple[bool, str]:
+        self.calls += 1
+
+        if self.calls <= self.throttles:
+            raise TooManyRequests
+
+        return True, "track.flac"
+
+
+@pytest.mark.parametrize("throttles", [0, 2])
+def test_dispatch_requeues_throttled_jobs(download: Download, throttles: int):
+    job = _JobThrottled(throttles)
+    progress_task: TaskID = download.progress.add_task("List", total=1)
+
+    download._jobs_dispatch([(job, progress_task)], False, download.progress)
+
+    assert job.calls == throttles + 1
+    assert download.progress.tasks[progress_task].completed == 1
+    assert MESSAGE_THROTTLED not in download.fn_logger.messages
+
+
+def test_dispatch_gives_up_on_throttled_job(download: Download):
+    job = _JobThrottled(THROTTLE_ATTEMPTS_MAX)
+    progress_task: TaskID = download.progress.add_task("List", total=1)
+
+    download._jobs_dispatch([(job, progress_task)], False, download.progress)
+
+    # Left to the retry pass.
+    assert job.calls == THROTTLE_ATTEMPTS_MAX
+    assert download.progress.tasks[progress_task].completed == 1
+    assert MESSAGE_THROTTLED in download.fn_logger.messages
+
+
+def test_throttled_job_is_failed_and_refunds_token(download: Download):
+    jobs = JobQueue(None, ["1"])
+    download.rate_limiter.try_acquire()
+    tokens: float = download.rate_limiter.tokens
+
+    def fn_item(futures_postprocess: list) -> tuple[bool, str]:
+        raise TooManyRequests
+
+    with pytest.raises(TooManyRequests):
+        download._job_run(jobs, "1", [], fn_item, paced=True)
+
+    assert jobs.todo("1")
+    assert jobs.data.items["1"].status == QueueDownloadStatus.Failed
+    assert download.rate_limiter.tokens == pytest.approx(tokens + 1, abs=0.01)
@@ -0,0 +1,138 @@
+import os
+import pathlib
+import struct
+
+import pytest
+
+from tidal_dl_ng.helper.exceptions import Mp4LayoutUnsupported
+from tidal_dl_ng.helper.flac import (
+    TFHD_DEFAULT_BASE_IS_MOOF,
+    TRUN_DATA_OFFSET,
+    TRUN_SAMPLE_DURATION,
+    TRUN_SAMPLE_SIZE,
+    flac_extract,
+)
+
+TRACK_ID: int = 1
+SAMPLE_RATE: int = 44100
+SAMPLE_DURATION: int = 4096
+FRAMES: list[bytes] = [b"\xff\xf8" + os.urandom(size) for size in (100, 57, 211)]
+
+
+def _box(box_type: bytes, *payload: bytes) -> bytes:
+    data: bytes = b"".join(payload)
+
+    return struct.pack(">I4s", 8 + len(data), box_type) + data
+
+
+def _full_box(box_type: bytes, flags: int, *payload: bytes) -> bytes:
+    return _box(box_type, struct.pack(">I", flags), *payload)
+
+
+def _streaminfo(samples_total: int, last: bool = True) -> bytes:
+    # Block sizes, frame sizes, packed sample rate / channels (2) / bits per sample (16) / total samples, MD5.
+    packed: int = (SAMPLE_RATE << 44) | (1 << 41) | (15 << 36) | samples_total
+    header: bytes = bytes([0x80 if last else 0x00]) + (34).to_bytes(3, "big")
+
+    return header + struct.pack(">HH", 4096, 4096) + bytes(6) + struct.pack(">Q", packed) + bytes(16)
+
+
+def _moov(stbl_tables: bytes = b"", mvex: bytes = b"") -> bytes:
+    dfla: bytes = _full_box(b"dfLa", 0, _streaminfo(0))
+    stsd: bytes = _full_box(b"stsd", 0, struct.pack(">I", 1), _box(b"fLaC", bytes(28), dfla))
+    stbl: bytes = _box(b"stbl", stsd, stbl_tables)
+    mdia: bytes = _box(b"mdia", _full_box(b"mdhd", 0, struct.pack(">III", 0, 0, SAMPLE_RATE)), _box(b"minf", stbl))
+    trak: bytes = _box(b"trak", _full_box(b"tkhd", 0, struct.pack(">III", 0, 0, TRACK_ID)), mdia)
+
+    return _box(b"moov", trak, mvex)
+
+
+def _mp4_fragmented() -> bytes:
+    trex: bytes = _full_box(b"trex", 0, struct.pack(">IIIII", TRACK_ID, 1, SAMPLE_DURATION, 0, 0))
+    moov: bytes = _moov(mvex=_box(b"mvex", trex))
+    samples: bytes = b"".join(struct.pack(">II", SAMPLE_DURATION, len(frame)) for frame in FRAMES)
+
+    def fn_moof(offset_data: int) -> bytes:
+        tfhd: bytes = _full_box(b"tfhd", TFHD_DEFAULT_BASE_IS_MOOF, struct.pack(">I", TRACK_ID))
+        trun: bytes = _full_box(
+            b"trun",
+            TRUN_DATA_OFFSET | TRUN_SAMPLE_DURATION | TRUN_SAMPLE_SIZE,
+            struct.pack(">Ii", len(FRAMES), offset_data),
+            samples,
+        )
+
+        return _box(b"moof", _full_box(b"mfhd", 0, struct.pack(">I", 1)), _box(b"traf", tfhd, trun))
+
+    # The frames start right after the header of the `mdat`, which follows the `moof`.
+    moof: bytes = fn_moof(len(fn_moof(0)) + 8)
+
+    return moov + moof + _box(b"mdat", *FRAMES)
+
+
+def _mp4_plain() -> bytes:
+    def fn_moov(offset_mdat: int) -> bytes:
+        # First chunk holds two samples, the second one the rest.
+        stsz: bytes = _full_box(
+            b"stsz", 0, struct.pack(">II", 0, len(FRAMES)), *(struct.pack(">I", len(frame)) for frame in FRAMES)
+        )
+        stsc: bytes = _full_box(b"stsc", 0, struct.pack(">IIIIIII", 2, 1, 2, 1, 2, 1, 1))
+        stco: bytes = _full_box(
+            b"stco",
+            0,
+            struct.pack(">III", 2, offset_mdat, offset_mdat + len(FRAMES[0]) + len(FRAMES[1])),
+        )
+        stts: bytes = _full_box(b"stts", 0, struct.pack(">III", 1, len(FRAMES), SAMPLE_DURATION))
+
+        return _moov(stbl_tables=stsz + stsc + stco + stts)
+
+    moov: bytes = fn_moov(len(fn_moov(0)) + 8)
+
+    return moov + _box(b"mdat", *FRAMES)
+
+
+def _flac_expected(padding: int = 0) -> bytes:
+    streaminfo: bytes = _streaminfo(SAMPLE_DURATION * len(FRAMES), last=not padding)
+    block_padding: bytes = bytes([0x81]) + padding.to_bytes(3, "big") + bytes(padding) if padding else b""
+
+    return b"fLaC" + streaminfo + block_padding + b"".join(FRAMES)
+
+
+@pytest.mark.parametrize("fn_mp4", [_mp4_fragmented, _mp4_plain])
+def test_extracts_frames_and_fills_in_total_samples(tmp_path: pathlib.Path, fn_mp4):
+    path_src = tmp_path / "track.mp4"
+    path_src.write_bytes(fn_mp4())
+
+    path_dst = flac_extract(path_src, tmp_path / "track.flac")
+
+    assert path_dst.read_bytes() == _flac_expected()
+
+
+def test_reserves_padding(tmp_path: pathlib.Path):
+    path_src = tmp_path / "track.mp4"
+    path_src.write_bytes(_mp4_fragmented())
+
+    path_dst = flac_extract(path_src, tmp_path / "track.flac", padding=1024)
+
+    assert path_dst.read_bytes() == _flac_expected(padding=1024)
+
+
+def test_rejects_encrypted_frames(tmp_path: pathlib.Path):
+    path_src = tmp_path / "track.mp4"
+    path_dst = tmp_path / "track.flac"
+    data = bytearray(_mp4_fragmented())
+    # Without a frame sync code, the data is not FLAC (e.g. still encrypted).
+    data[-sum(len(frame) for frame in FRAMES)] = 0x00
+    path_src.write_bytes(bytes(data))
+
+    with pytest.raises(Mp4LayoutUnsupported):
+        flac_extract(path_src, path_dst)
+
+    assert not path_dst.exists()
+
+
+def test_rejects_file_without_flac_track(tmp_path: pathlib.Path):
+    path_src = tmp_path / "track.mp4"
+    path_src.write_bytes(_box(b"ftyp", b"isom") + _box(b"mdat", *FRAMES))
+
+    with pytest.raises(Mp4LayoutUnsupported):
+        flac_extract(path_src, tmp_path / "track.flac")
@@ -0,0 +1,154 @@
+import os
+import pathlib
+from concurrent import futures
+from threading import Event, Thread
+
+from tidalapi import Track
+from tidalapi.media import Quality
+
+from tidal_dl_ng.constants import COVER_NAME, EXTENSION_LYRICS
+from tidal_dl_ng.download import Download
+from tidal_dl_ng.helper.inflight import InFlight
+
+KEY: tuple[int, Quality] = (1, Quality.high_lossless)
+
+
+def _track() -> Track:
+    track: Track = Track.__new__(Track)
+    track.id = KEY[0]
+    track.name = "Title"
+    track.version = None
+    track.artists = []
+
+    return track
+
+
+def _download_finished(path_dir: pathlib.Path) -> pathlib.Path:
+    # Track of the owner with its sidecar files.
+    path_file: pathlib.Path = path_dir / "owner" / "track.flac"
+    path_file.parent.mkdir(parents=True)
+    path_file.write_bytes(b"audio")
+    path_file.with_suffix(EXTENSION_LYRICS).write_text("lyrics", encoding="utf-8")
+    (path_file.parent / COVER_NAME).write_bytes(b"cover")
+
+    return path_file
+
+
+def _join_background(download: Download, path_dst: pathlib.Path, monkeypatch) -> tuple[Thread, list[bool | None]]:
+    # Join the running download in another thread and return, once it has claimed the key.
+    results: list[bool | None] = []
+    event_claimed = Event()
+    fn_claim = download.inflight.claim
+
+    def fn_claim_signaled(key: tuple[int, Quality]) -> tuple[bool, futures.Future]:
+        result: tuple[bool, futures.Future] = fn_claim(key)
+        event_claimed.set()
+
+        return result
+
+    monkeypatch.setattr(download.inflight, "claim", fn_claim_signaled)
+
+    thread = Thread(target=lambda: results.append(download._inflight_join(_track(), KEY, path_dst)))
+    thread.start()
+    event_claimed.wait()
+    monkeypatch.setattr(download.inflight, "claim", fn_claim)
+
+    return thread, results
+
+
+def test_second_claim_joins_first():
+    inflight = InFlight()
+
+    is_owner, flight = inflight.claim(KEY)
+    is_owner_other, flight_other = inflight.claim(KEY)
+
+    assert is_owner
+    assert not is_owner_other
+    assert flight_other is flight
+
+    inflight.finish(KEY, pathlib.Path("track.flac"))
+
+    assert flight.result(timeout=0) == pathlib.Path("track.flac")
+    # Done: The next request downloads on its own.
+    assert inflight.claim(KEY)[0]
+
+
+def test_failed_download_hands_over_ownership():
+    inflight = InFlight()
+    _, flight = inflight.claim(KEY)
+
+    inflight.finish(KEY, None)
+
+    assert flight.result(timeout=0) is None
+    assert inflight.claim(KEY)[0]
+
+
+def test_join_waits_and_links_result(download: Download, tmp_path: pathlib.Path, monkeypatch):
+    download.inflight.claim(KEY)
+    path_dst: pathlib.Path = tmp_path / "list" / "track.m4a"
+    thread, results = _join_background(download, path_dst, monkeypatch)
+    path_file: pathlib.Path = _download_finished(tmp_path)
+    download.inflight.finish(KEY, path_file)
+    thread.join()
+
+    # The final extension of the other download is used.
+    path_dst = path_dst.with_suffix(".flac")
+
+    assert results == [True]
+    assert os.path.samefile(path_dst, path_file)
+    assert path_dst.with_suffix(EXTENSION_LYRICS).read_text(encoding="utf-8") == "lyrics"
+    assert (path_dst.parent / COVER_NAME).read_bytes() == b"cover"
+
+
+def test_join_takes_over_failed_download(download: Download, tmp_path: pathlib.Path, monkeypatch):
+    download.inflight.claim(KEY)
+    thread, results = _join_background(download, tmp_path / "track.m4a", monkeypatch)
+    download.inflight.finish(KEY, None)
+    thread.join()
+
+    # The caller owns the download now.
+    assert results == [None]
+    assert not download.inflight.claim(KEY)[0]
+
+
+def test_pipelined_join_links_without_waiting(download: Download, tmp_path: pathlib.Path):
+    download.inflight.claim(KEY)
+    path_dst: pathlib.Path = tmp_path / "list" / "track.flac"
+    futures_postprocess: list[futures.Future] = []
+
+    assert download._inflight_join(_track(), KEY, path_dst, futures_postprocess)
+    assert len(futures_postprocess) == 1
+    assert not futures_postprocess[0].done()
+
+    download.inflight.finish(KEY, _download_finished(tmp_path))
+
+    assert futures_postprocess[0].result(timeout=0)
+    assert path_dst.read_bytes() == b"audio"
+
+
+def test_pipelined_join_fails_with_other_download(download: Download, tmp_path: pathlib.Path):
+    download.inflight.claim(KEY)
+    path_dst: pathlib.Path = tmp_path / "list" / "track.flac"
+    futures_postprocess: list[futures.Future] = []
+
+    download._inflight_join(_track(), KEY, path_dst, futures_postprocess)
+    download.inflight.finish(KEY, None)
+
+    # Left to a retry.
+    assert not futures_postprocess[0].result(timeout=0)
+    assert not path_dst.exists()
+
+
+def test_waiting_requests_get_result_once_post_processed(download: Download, tmp_path: pathlib.Path):
+    download.inflight.claim(KEY)
+    _, flight = download.inflight.claim(KEY)
+    future_postprocess: futures.Future = futures.Future()
+    path_file: pathlib.Path = tmp_path / "track.flac"
+
+    download._inflight_finish(KEY, path_file, [future_postprocess])
+
+    assert not flight.done()
+
+    future_postprocess.set_result(True)
+
+    assert flight.result(timeout=0) == path_file
@@ -0,0 +1,95 @@
+import pathlib
+
+from tidal_dl_ng.constants import QueueDownloadStatus
+from tidal_dl_ng.helper.jobs import JobQueue, job_key
+
+KEYS: list[str] = ["1", "2", "3"]
+
+
+def test_resumes_states_of_former_run(tmp_path: pathlib.Path):
+    path_file = tmp_path / "jobs.json"
+    jobs = JobQueue(path_file, KEYS)
+    jobs.status_set("1", QueueDownloadStatus.Finished, tmp_path / "1.flac")
+    jobs.status_set("2", QueueDownloadStatus.Failed)
+    jobs.status_set("3", QueueDownloadStatus.Downloading)
+    jobs.close()
+
+    jobs = JobQueue(path_file, KEYS)
+
+    assert not jobs.todo("1")
+    assert jobs.todo("2")
+    # Running when the process died: Pending again.
+    assert jobs.todo("3")
+    assert jobs.count_todo() == 2
+    assert jobs.paths_file() == [tmp_path / "1.flac"]
+
+
+def test_resume_disabled(tmp_path: pathlib.Path):
+    path_file = tmp_path / "jobs.json"
+    jobs = JobQueue(path_file, KEYS)
+    jobs.status_set("1", QueueDownloadStatus.Finished)
+    jobs.close()
+
+    jobs = JobQueue(path_file, KEYS, resume=False)
+
+    assert jobs.count_todo() == len(KEYS)
+
+
+def test_new_items_are_pending(tmp_path: pathlib.Path):
+    path_file = tmp_path / "jobs.json"
+    jobs = JobQueue(path_file, KEYS)
+    jobs.status_set("1", QueueDownloadStatus.Finished)
+    jobs.close()
+
+    jobs = JobQueue(path_file, [*KEYS, "4"])
+
+    assert jobs.todo("4")
+    assert jobs.count_todo() == len(KEYS)
+
+
+def test_close_removes_finished_queue(tmp_path: pathlib.Path):
+    path_file = tmp_path / "jobs.json"
+    jobs = JobQueue(path_file, KEYS)
+
+    for key in KEYS:
+        jobs.status_set(key, QueueDownloadStatus.Finished)
+
+    assert path_file.exists()
+
+    jobs.close()
+
+    assert not path_file.exists()
+
+
+def test_ignores_corrupt_queue(tmp_path: pathlib.Path):
+    path_file = tmp_path / "jobs.json"
+    path_file.write_text("{not json", encoding="utf-8")
+
+    jobs = JobQueue(path_file, KEYS)
+
+    assert jobs.count_todo() == len(KEYS)
+
+
+def test_in_memory_queue():
+    jobs = JobQueue(None, KEYS)
+    jobs.status_set("1", QueueDownloadStatus.Skipped)
+    jobs.close()
+
+    assert jobs.count_todo() == len(KEYS) - 1
+
+
+def test_duplicated_items_have_own_states(tmp_path: pathlib.Path):
+    # The same track twice in a playlist.
+    keys: list[str] = [job_key(position, item_id) for position, item_id in enumerate([5, 5, 7])]
+    path_file = tmp_path / "jobs.json"
+    jobs = JobQueue(path_file, keys)
+    jobs.status_set(keys[0], QueueDownloadStatus.Finished, tmp_path / "a.flac")
+    jobs.status_set(keys[1], QueueDownloadStatus.Finished, tmp_path / "b.flac")
+    jobs.status_set(keys[2], QueueDownloadStatus.Failed)
+    jobs.close()
+
+    jobs = JobQueue(path_file, keys)
+
+    assert jobs.count_todo() == 1
+    assert jobs.todo(keys[2])
+    assert jobs.paths_file() == [tmp_path / "a.flac", tmp_path / "b.flac"]
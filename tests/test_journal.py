@@ -0,0 +1,104 @@
+import hashlib
+import pathlib
+
+from tidal_dl_ng.helper import journal as journal_module
+from tidal_dl_ng.helper.journal import DownloadJournal
+
+SEGMENTS: list[bytes] = [bytes([i]) * (100 + i) for i in range(5)]
+
+
+def _journal_written(path_dir: pathlib.Path, count: int) -> tuple[DownloadJournal, pathlib.Path]:
+    path_data = path_dir / "data"
+    path_data.write_bytes(b"".join(SEGMENTS[:count]))
+    journal = DownloadJournal(path_dir / "journal.json")
+    journal.load("fingerprint", len(SEGMENTS))
+
+    for index in range(count):
+        journal.segment_add(index, len(SEGMENTS[index]), hashlib.sha256(SEGMENTS[index]).hexdigest())
+
+    journal.flush()
+
+    return journal, path_data
+
+
+def test_resume_point_after_reload(tmp_path: pathlib.Path):
+    _, path_data = _journal_written(tmp_path, 3)
+    journal = DownloadJournal(tmp_path / "journal.json")
+
+    journal.load("fingerprint", len(SEGMENTS))
+    journal.verify(path_data)
+
+    assert journal.resume_point() == (3, sum(len(segment) for segment in SEGMENTS[:3]))
+
+
+def test_load_resets_other_stream(tmp_path: pathlib.Path):
+    _journal_written(tmp_path, 3)
+    journal = DownloadJournal(tmp_path / "journal.json")
+
+    journal.load("other", len(SEGMENTS))
+
+    assert journal.resume_point() == (0, 0)
+
+    journal.load("fingerprint", len(SEGMENTS) + 1)
+
+    assert journal.resume_point() == (0, 0)
+
+
+def test_load_ignores_corrupt_journal(tmp_path: pathlib.Path):
+    path_journal = tmp_path / "journal.json"
+    path_journal.write_text("{not json", encoding="utf-8")
+    journal = DownloadJournal(path_journal)
+
+    journal.load("fingerprint", len(SEGMENTS))
+
+    assert journal.resume_point() == (0, 0)
+
+
+def test_verify_drops_from_first_mismatch(tmp_path: pathlib.Path):
+    journal, path_data = _journal_written(tmp_path, 4)
+    data = bytearray(path_data.read_bytes())
+    data[len(SEGMENTS[0]) + 1] ^= 0xFF
+    path_data.write_bytes(bytes(data))
+
+    journal.verify(path_data)
+
+    assert journal.resume_point() == (1, len(SEGMENTS[0]))
+
+
+def test_verify_drops_truncated_segment(tmp_path: pathlib.Path):
+    journal, path_data = _journal_written(tmp_path, 3)
+    path_data.write_bytes(path_data.read_bytes()[:-1])
+
+    journal.verify(path_data)
+
+    assert journal.resume_point()[0] == 2
+
+
+def test_verify_without_data_file(tmp_path: pathlib.Path):
+    journal, path_data = _journal_written(tmp_path, 3)
+    path_data.unlink()
+
+    journal.verify(path_data)
+
+    assert journal.resume_point() == (0, 0)
+
+
+def test_segments_are_saved_in_batches(tmp_path: pathlib.Path, monkeypatch):
+    monkeypatch.setattr(journal_module, "SAVE_SEGMENTS", 2)
+    monkeypatch.setattr(journal_module, "SAVE_INTERVAL_SEC", 3600.0)
+    path_journal = tmp_path / "journal.json"
+    journal = DownloadJournal(path_journal)
+    journal.load("fingerprint", len(SEGMENTS))
+
+    for index in range(3):
+        journal.segment_add(index, len(SEGMENTS[index]), hashlib.sha256(SEGMENTS[index]).hexdigest())
+
+    journal_saved = DownloadJournal(path_journal)
+    journal_saved.load("fingerprint", len(SEGMENTS))
+
+    assert journal_saved.resume_point()[0] == 2
+
+    journal.flush()
+    journal_saved.load("fingerprint", len(SEGMENTS))
+
+    assert journal_saved.resume_point()[0] == 3
@@ -0,0 +1,78 @@
+import errno
+import os
+import pathlib
+
+import pytest
+
+from tidal_dl_ng.constants import EXTENSION_PART
+from tidal_dl_ng.helper.path import file_move
+
+
+@pytest.fixture
+def path_src(tmp_path: pathlib.Path) -> pathlib.Path:
+    path_file: pathlib.Path = tmp_path / "staging" / "track.flac"
+    path_file.parent.mkdir()
+    path_file.write_bytes(b"audio")
+
+    return path_file
+
+
+def _cross_device(monkeypatch, path_src: pathlib.Path, error: int = errno.EXDEV) -> None:
+    # Renaming the source fails like on another file system, renaming within the destination directory works.
+    fn_replace = os.replace
+
+    def fn_replace_cross_device(src: os.PathLike, dst: os.PathLike) -> None:
+        if pathlib.Path(src) == path_src:
+            raise OSError(error, os.strerror(error))
+
+        fn_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", fn_replace_cross_device)
+
+
+def test_renames_on_same_device(path_src: pathlib.Path, tmp_path: pathlib.Path):
+    path_dst: pathlib.Path = tmp_path / "track.flac"
+
+    assert file_move(path_src, path_dst)
+    assert path_dst.read_bytes() == b"audio"
+    assert not path_src.exists()
+
+
+def test_copies_across_devices(monkeypatch, path_src: pathlib.Path, tmp_path: pathlib.Path):
+    path_dst: pathlib.Path = tmp_path / "track.flac"
+    path_dst.write_bytes(b"old")
+    _cross_device(monkeypatch, path_src)
+
+    assert not file_move(path_src, path_dst)
+    assert path_dst.read_bytes() == b"audio"
+    assert not path_src.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["staging", "track.flac"]
+
+
+def test_failed_copy_leaves_no_partial_file(monkeypatch, path_src: pathlib.Path, tmp_path: pathlib.Path):
+    path_dst: pathlib.Path = tmp_path / "track.flac"
+    _cross_device(monkeypatch, path_src)
+
+    def fn_copy(src: pathlib.Path, dst: pathlib.Path) -> None:
+        dst.write_bytes(b"au")
+
+        raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+
+    monkeypatch.setattr("shutil.copy2", fn_copy)
+
+    with pytest.raises(OSError):
+        file_move(path_src, path_dst)
+
+    assert not path_dst.exists()
+    assert not path_dst.with_name(path_dst.name + EXTENSION_PART).exists()
+    # The source is kept for a retry.
+    assert path_src.read_bytes() == b"audio"
+
+
+def test_other_errors_are_raised(monkeypatch, path_src: pathlib.Path, tmp_path: pathlib.Path):
+    _cross_device(monkeypatch, path_src, errno.EACCES)
+
+    with pytest.raises(PermissionError):
+        file_move(path_src, tmp_path / "track.flac")
+
+    assert path_src.exists()
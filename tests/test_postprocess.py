@@ -0,0 +1,77 @@
+import os
+from concurrent import futures
+from threading import Event, Thread
+
+import pytest
+
+from tidal_dl_ng.helper import postprocess as postprocess_module
+from tidal_dl_ng.helper.postprocess import QUEUE_JOBS_PER_WORKER, PostProcessPool
+
+
+@pytest.fixture(autouse=True)
+def timeout(monkeypatch) -> None:
+    # Check the abort event often.
+    monkeypatch.setattr(postprocess_module, "WAIT_TIMEOUT_SEC", 0.01)
+
+
+def _pool_full(pool: PostProcessPool) -> tuple[Event, list[futures.Future]]:
+    # Fill the queue with jobs, which block until the returned event is set.
+    event_release = Event()
+    futures_job: list[futures.Future] = [
+        pool.submit(event_release.wait) for _ in range(pool.workers * QUEUE_JOBS_PER_WORKER)
+    ]
+
+    return event_release, futures_job
+
+
+def test_runs_jobs():
+    pool = PostProcessPool(workers=2)
+
+    assert pool.submit(lambda: 42).result() == 42
+
+
+def test_blocks_while_queue_is_full():
+    pool = PostProcessPool(workers=1)
+    event_release, futures_job = _pool_full(pool)
+    futures_submitted: list[futures.Future] = []
+    thread = Thread(target=lambda: futures_submitted.append(pool.submit(lambda: True)))
+
+    thread.start()
+    thread.join(timeout=0.1)
+
+    # Back pressure: Waits for a free place in the queue.
+    assert thread.is_alive()
+
+    event_release.set()
+    thread.join()
+
+    assert futures_submitted[0].result()
+    assert all(future.result() for future in futures_job)
+
+
+def test_abort_while_queue_is_full():
+    pool = PostProcessPool(workers=1)
+    event_release, _ = _pool_full(pool)
+    event_abort = Event()
+    event_abort.set()
+
+    assert pool.submit(lambda: True, event_abort) is None
+
+    event_release.set()
+
+
+def test_failed_job_frees_its_place():
+    pool = PostProcessPool(workers=1)
+
+    def fn_job() -> None:
+        raise OSError
+
+    for _ in range(QUEUE_JOBS_PER_WORKER + 1):
+        with pytest.raises(OSError):
+            pool.submit(fn_job).result()
+
+
+def test_workers_from_settings(settings):
+    settings.downloads_postprocess_max = 0
+
+    assert PostProcessPool().workers == (os.cpu_count() or 1)
@@ -0,0 +1,112 @@
+from concurrent import futures
+
+import pytest
+
+from tidal_dl_ng.helper import prefetch as prefetch_module
+from tidal_dl_ng.helper.prefetch import LookAhead
+
+ITEMS: list[str] = ["a", "b", "c", "d", "e"]
+
+
+class _Clock:
+    now: float = 1000.0
+
+    @classmethod
+    def monotonic(cls) -> float:
+        return cls.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch) -> type[_Clock]:
+    monkeypatch.setattr(prefetch_module, "time", _Clock)
+
+    return _Clock
+
+
+class _Fetch:
+    def __init__(self):
+        self.calls: list[tuple[int, str]] = []
+
+    def __call__(self, position: int, item: str) -> str:
+        self.calls.append((position, item))
+
+        return item.upper()
+
+
+def _fetched(look_ahead: LookAhead) -> None:
+    # Wait until the requests in the background are done.
+    futures.wait([future for _, future in look_ahead.fetches.values()])
+
+
+def test_resolves_next_items():
+    fetch = _Fetch()
+    look_ahead = LookAhead(ITEMS, fetch, depth=2, ttl=60.0)
+
+    # The first item is never requested ahead.
+    assert look_ahead.take(0) is None
+
+    _fetched(look_ahead)
+
+    assert sorted(fetch.calls) == [(1, "b"), (2, "c")]
+    assert look_ahead.take(1) == "B"
+
+    _fetched(look_ahead)
+
+    assert sorted(fetch.calls) == [(1, "b"), (2, "c"), (3, "d")]
+
+
+def test_stops_at_end_of_list():
+    fetch = _Fetch()
+    look_ahead = LookAhead(ITEMS, fetch, depth=10, ttl=60.0)
+
+    look_ahead.take(3)
+    _fetched(look_ahead)
+
+    # Taken items are never requested again.
+    assert fetch.calls == [(4, "e")]
+    assert look_ahead.take(4) == "E"
+    assert look_ahead.take(2) is None
+    assert fetch.calls == [(4, "e")]
+
+
+def test_drops_expired_data(clock):
+    look_ahead = LookAhead(ITEMS, _Fetch(), depth=2, ttl=60.0)
+    look_ahead.take(0)
+
+    clock.now += 59.0
+
+    assert look_ahead.take(1) == "B"
+
+    clock.now += 1.0
+
+    assert look_ahead.take(2) is None
+
+
+def test_disabled():
+    fetch = _Fetch()
+    look_ahead = LookAhead(ITEMS, fetch, depth=0, ttl=60.0)
+
+    assert look_ahead.take(0) is None
+    assert look_ahead.take(1) is None
+    assert not look_ahead.fetches
+    assert fetch.calls == []
+
+
+def test_failed_request_is_left_to_caller():
+    def fn_fetch(position: int, item: str) -> str:
+        raise ConnectionError
+
+    look_ahead = LookAhead(ITEMS, fn_fetch, depth=1, ttl=60.0)
+    look_ahead.take(0)
+
+    assert look_ahead.take(1) is None
+
+
+def test_cancel_drops_requests():
+    look_ahead = LookAhead(ITEMS, _Fetch(), depth=2, ttl=60.0)
+    look_ahead.take(0)
+
+    look_ahead.cancel()
+
+    assert not look_ahead.fetches
+    assert look_ahead.take(1) is None
@@ -0,0 +1,187 @@
+from threading import Event
+
+import pytest
+
+from tidal_dl_ng.helper import ratelimit as ratelimit_module
+from tidal_dl_ng.helper.ratelimit import RateLimiter, ThrottleController
+
+
+class _Clock:
+    now: float = 1000.0
+
+    @classmethod
+    def monotonic(cls) -> float:
+        return cls.now
+
+    @classmethod
+    def sleep(cls, seconds: float) -> None:
+        cls.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch, settings) -> type[_Clock]:
+    settings.download_delay_sec_min = 1.0
+    settings.download_delay_sec_max = 1.0
+    settings.downloads_concurrent_max = 3
+    monkeypatch.setattr(ratelimit_module, "time", _Clock)
+
+    return _Clock
+
+
+def test_burst_up_to_capacity(clock):
+    limiter = RateLimiter(delay_min=2.0, delay_max=2.0, capacity=2)
+
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() == pytest.approx(2.0)
+
+
+def test_refills_one_token_per_interval(clock):
+    limiter = RateLimiter(delay_min=2.0, delay_max=2.0, capacity=2)
+    limiter.try_acquire()
+    limiter.try_acquire()
+
+    clock.now += 2.0
+
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() == pytest.approx(2.0)
+
+
+def test_full_bucket_does_not_collect_tokens(clock):
+    limiter = RateLimiter(delay_min=2.0, delay_max=2.0, capacity=2)
+
+    clock.now += 100.0
+
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() > 0.0
+
+
+def test_refund_gives_token_back(clock):
+    limiter = RateLimiter(delay_min=2.0, delay_max=2.0, capacity=1)
+    limiter.try_acquire()
+    limiter.refund()
+
+    assert limiter.try_acquire() == 0.0
+
+    # Never more than the capacity.
+    limiter.refund()
+    limiter.refund()
+
+    assert limiter.tokens == 1
+
+
+def test_acquire_waits_for_token(clock):
+    limiter = RateLimiter(delay_min=2.0, delay_max=2.0, capacity=1)
+    limiter.acquire()
+    time_start: float = clock.now
+
+    assert limiter.acquire()
+    assert clock.now - time_start == pytest.approx(2.0)
+
+
+def test_defaults_from_settings(clock):
+    limiter = RateLimiter()
+
+    assert (limiter.delay_min, limiter.delay_max, limiter.capacity) == (1.0, 1.0, 3)
+
+
+def test_backoff_grows_with_consecutive_throttles(clock):
+    throttle = ThrottleController(backoff_min=2.0, backoff_max=5.0, limit_max=3)
+
+    assert throttle.throttled() == pytest.approx(2.0)
+
+    clock.now += 2.0
+
+    assert throttle.throttled() == pytest.approx(4.0)
+
+    clock.now += 4.0
+
+    # Capped by the max. backoff.
+    assert throttle.throttled() == pytest.approx(5.0)
+
+
+def test_retry_after_takes_precedence(clock):
+    throttle = ThrottleController(backoff_min=2.0, backoff_max=5.0, limit_max=3)
+
+    assert throttle.throttled(retry_after=30.0) == pytest.approx(30.0)
+
+
+def test_throttles_during_pause_extend_it(clock):
+    throttle = ThrottleController(backoff_min=2.0, backoff_max=60.0, limit_max=3)
+    throttle.throttled()
+    clock.now += 1.0
+
+    # Reported by another worker for the same throttle: Not counted as a consecutive throttle.
+    assert throttle.throttled() == pytest.approx(2.0)
+    assert throttle.throttles == 1
+
+
+def test_success_ramps_limit_back_up(clock):
+    throttle = ThrottleController(backoff_min=2.0, backoff_max=60.0, limit_max=3)
+
+    assert throttle.limit(5) == 3
+
+    throttle.throttled()
+
+    assert throttle.limit(5) == 1
+
+    throttle.success()
+
+    assert throttle.limit(5) == 2
+    assert throttle.limit(1) == 1
+
+    throttle.success()
+    throttle.success()
+
+    assert throttle.limit(5) == 3
+    assert throttle.throttles == 0
+
+
+def test_wait_until_pause_is_over(clock):
+    throttle = ThrottleController(backoff_min=2.0, backoff_max=60.0, limit_max=3)
+
+    assert throttle.time_wait() == 0.0
+
+    throttle.throttled()
+    time_start: float = clock.now
+
+    assert throttle.wait()
+    assert clock.now - time_start == pytest.approx(2.0)
+    assert throttle.time_wait() == 0.0
+
+
+def test_wait_aborted(clock):
+    throttle = ThrottleController(backoff_min=2.0, backoff_max=60.0, limit_max=3)
+    event_abort = Event()
+    event_abort.set()
+    throttle.throttled()
+
+    assert not throttle.wait(event_abort)
+
+
+def test_limiter_follows_changed_settings(clock, settings):
+    limiter = RateLimiter()
+    settings.download_delay_sec_min = 5.0
+    settings.download_delay_sec_max = 5.0
+    settings.downloads_concurrent_max = 1
+
+    assert limiter.try_acquire() == 0.0
+    assert limiter.try_acquire() == pytest.approx(5.0)
+
+
+def test_throttle_follows_changed_settings(clock, settings):
+    throttle = ThrottleController()
+
+    assert throttle.limit(10) == 3
+
+    settings.downloads_concurrent_max = 6
+
+    assert throttle.limit(10) == 6
+
+    throttle.throttled()
+
+    for _ in range(5):
+        throttle.success()
+
+    assert throttle.limit(10) == 6
@@ -0,0 +1,57 @@
+import os
+import pathlib
+import sys
+
+import pytest
+
+from tidal_dl_ng.helper.remux import RemuxPipe
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="The FFmpeg stand-in is a script with a shebang.")
+
+# Stand-in for FFmpeg: Copy the input into the output file (last argument) or fail without reading the input.
+FFMPEG_FAKE: str = """
+import shutil, sys
+
+if "fail" in sys.argv[0]:
+    sys.exit(1)
+
+with open(sys.argv[-1], "wb") as f:
+    shutil.copyfileobj(sys.stdin.buffer, f)
+"""
+
+
+def _ffmpeg(path_dir: pathlib.Path, name: str = "ffmpeg") -> str:
+    path_binary: pathlib.Path = path_dir / name
+    path_binary.write_text(f"#!{sys.executable}\n{FFMPEG_FAKE}", encoding="utf-8")
+    path_binary.chmod(0o755)
+
+    return str(path_binary)
+
+
+def test_pipes_stream_into_output(tmp_path: pathlib.Path):
+    path_out: pathlib.Path = tmp_path / "video.mp4"
+    data: bytes = os.urandom(256 * 1024)
+
+    with RemuxPipe(_ffmpeg(tmp_path), path_out, "mpegts") as remux:
+        for offset in range(0, len(data), 1000):
+            assert remux.write(data[offset : offset + 1000]) == len(data[offset : offset + 1000])
+
+        remux.flush()
+
+        assert not remux.seekable()
+
+    assert remux.error is None
+    assert path_out.read_bytes() == data
+
+
+def test_failed_ffmpeg_drops_data(tmp_path: pathlib.Path):
+    path_out: pathlib.Path = tmp_path / "video.mp4"
+    # More than fits into the pipe, so writing fails once FFmpeg has quit.
+    data: bytes = bytes(4 * 1024 * 1024)
+
+    with RemuxPipe(_ffmpeg(tmp_path, "ffmpeg_fail"), path_out, "mpegts") as remux:
+        assert remux.write(data) == len(data)
+        assert remux.write(data) == len(data)
+
+    assert remux.error is not None
+    assert not path_out.exists()
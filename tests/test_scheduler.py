@@ -0,0 +1,149 @@
+import time
+from threading import Event, Thread
+
+import pytest
+
+from tidal_dl_ng.helper import scheduler as scheduler_module
+from tidal_dl_ng.helper.scheduler import ADAPTIVE_INTERVAL_SEC, ADAPTIVE_LIMIT_START, ConnectionScheduler
+
+
+class _Clock:
+    now: float = 1000.0
+
+    @classmethod
+    def monotonic(cls) -> float:
+        return cls.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch) -> type[_Clock]:
+    monkeypatch.setattr(scheduler_module, "time", _Clock)
+
+    return _Clock
+
+
+def _acquire_waiting(scheduler: ConnectionScheduler, track_id: int, event_abort: Event) -> Event:
+    # Request a slot in the background and wait until the request is queued.
+    event_granted = Event()
+    waiters: int = len(scheduler.waiters)
+
+    def fn_acquire() -> None:
+        if scheduler.acquire(track_id, event_abort):
+            event_granted.set()
+
+    Thread(target=fn_acquire, daemon=True).start()
+
+    while len(scheduler.waiters) == waiters and not event_granted.is_set():
+        time.sleep(0.01)
+
+    return event_granted
+
+
+def test_grants_up_to_limit():
+    scheduler = ConnectionScheduler(limit=2)
+    track = scheduler.track_register(10)
+    event_abort = Event()
+
+    assert scheduler.acquire(track)
+    assert scheduler.acquire(track)
+
+    event_granted = _acquire_waiting(scheduler, track, event_abort)
+
+    assert not event_granted.is_set()
+
+    scheduler.release(track)
+
+    assert event_granted.wait(timeout=5)
+    assert scheduler.limits().slots_used == 2
+
+
+def test_fair_share_prefers_track_below_share():
+    scheduler = ConnectionScheduler(limit=4)
+    track_a = scheduler.track_register(10)
+    event_abort = Event()
+
+    for _ in range(4):
+        assert scheduler.acquire(track_a)
+
+    track_b = scheduler.track_register(10)
+    granted_a = _acquire_waiting(scheduler, track_a, event_abort)
+    granted_b = _acquire_waiting(scheduler, track_b, event_abort)
+
+    # Track A is above its share of 4 / 2, although it has been waiting longer.
+    scheduler.release(track_a)
+
+    assert granted_b.wait(timeout=5)
+    assert not granted_a.is_set()
+
+    # No other track is below its share, so the free slot is not left idle.
+    scheduler.release(track_a)
+
+    assert granted_a.wait(timeout=5)
+
+    event_abort.set()
+
+
+def test_track_slots_max():
+    scheduler = ConnectionScheduler(limit=4)
+    track = scheduler.track_register(1)
+    event_abort = Event()
+
+    assert scheduler.acquire(track)
+
+    event_granted = _acquire_waiting(scheduler, track, event_abort)
+
+    assert not event_granted.is_set()
+
+    event_abort.set()
+
+    assert not scheduler.acquire(track, event_abort)
+
+
+def test_congestion_halves_limit_once_per_interval():
+    scheduler = ConnectionScheduler(limit=10, adaptive=True)
+
+    assert scheduler.limit == ADAPTIVE_LIMIT_START
+
+    scheduler.congestion()
+    scheduler.congestion()
+
+    assert scheduler.limit == ADAPTIVE_LIMIT_START // 2
+    assert scheduler.decreases == 1
+
+    _Clock.now += ADAPTIVE_INTERVAL_SEC
+    scheduler.congestion()
+
+    assert scheduler.limit == ADAPTIVE_LIMIT_START // 4
+
+
+def test_additive_increase_and_step_back():
+    scheduler = ConnectionScheduler(limit=ADAPTIVE_LIMIT_START + 1, adaptive=True)
+
+    # Saturated and faster than before: One more slot.
+    scheduler.saturated = True
+    _Clock.now += ADAPTIVE_INTERVAL_SEC
+    scheduler.bytes_add(1_000_000)
+
+    assert scheduler.limit == ADAPTIVE_LIMIT_START + 1
+
+    # Never above the configured limit.
+    scheduler.saturated = True
+    _Clock.now += ADAPTIVE_INTERVAL_SEC
+    scheduler.bytes_add(2_000_000)
+
+    assert scheduler.limit == ADAPTIVE_LIMIT_START + 1
+
+    # The last step made it slower: Step back.
+    scheduler.increased = True
+    _Clock.now += ADAPTIVE_INTERVAL_SEC
+    scheduler.bytes_add(1_000)
+
+    assert scheduler.limit == ADAPTIVE_LIMIT_START
+
+
+def test_fixed_limit_ignores_congestion():
+    scheduler = ConnectionScheduler(limit=10)
+    scheduler.congestion()
+    scheduler.bytes_add(1_000_000)
+
+    assert scheduler.limit == 10
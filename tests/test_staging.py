@@ -0,0 +1,67 @@
+import pathlib
+
+import pytest
+
+from tidal_dl_ng.constants import STAGING_DIR_NAME
+from tidal_dl_ng.helper import staging as staging_module
+from tidal_dl_ng.helper.staging import StagingMemory
+
+
+@pytest.fixture(autouse=True)
+def path_memory(monkeypatch, tmp_path: pathlib.Path) -> pathlib.Path:
+    # Stand-in for the RAM file system.
+    monkeypatch.setattr(staging_module, "path_staging_memory_default", lambda: tmp_path)
+
+    return tmp_path
+
+
+def test_reserves_within_budget():
+    staging = StagingMemory(size_item_max=100, budget=250)
+
+    assert staging.reserve(100) == 100
+    assert staging.reserve(50, copies=2) == 100
+    # Budget exceeded: Stage on disk instead.
+    assert staging.reserve(100) == 0
+
+    staging.release(100)
+
+    assert staging.reserve(100) == 100
+    assert staging.used == 200
+
+
+def test_rejects_large_or_unknown_items():
+    staging = StagingMemory(size_item_max=100, budget=1000)
+
+    assert staging.reserve(101) == 0
+    assert staging.reserve(0) == 0
+    assert staging.used == 0
+
+
+def test_disabled_tier():
+    staging = StagingMemory(size_item_max=0, budget=1000)
+
+    assert staging.reserve(1) == 0
+
+
+def test_release_never_goes_negative():
+    staging = StagingMemory(size_item_max=100, budget=1000)
+    staging.release(100)
+
+    assert staging.used == 0
+
+
+def test_mkdtemp_below_staging_root(path_memory: pathlib.Path):
+    staging = StagingMemory(size_item_max=100, budget=1000)
+
+    path_dir = staging.mkdtemp()
+
+    assert path_dir.is_dir()
+    assert path_dir.parent == path_memory / STAGING_DIR_NAME
+
+
+def test_defaults_from_settings(settings):
+    settings.staging_memory_item_max_mb = 1
+    settings.staging_memory_budget_mb = 2
+    staging = StagingMemory()
+
+    assert (staging.size_item_max, staging.budget) == (1024 * 1024, 2 * 1024 * 1024)
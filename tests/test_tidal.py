@@ -0,0 +1,100 @@
+from concurrent import futures
+from threading import Event
+
+import pytest
+from tidalapi import Album, Track
+
+from tidal_dl_ng.helper.tidal import AlbumCache
+
+
+def _album(album_id: int, num_tracks: int | None = None) -> Album:
+    # Without the number of tracks, the album is embedded in track data and incomplete.
+    album: Album = Album.__new__(Album)
+    album.id = album_id
+    album.num_tracks = num_tracks
+
+    return album
+
+
+def _track(album: Album | None) -> Track:
+    track: Track = Track.__new__(Track)
+    track.album = album
+
+    return track
+
+
+class _Session:
+    def __init__(self, event_release: Event | None = None, fails: int = 0):
+        self.requests: list[int] = []
+        self.event_release = event_release
+        self.fails = fails
+
+    def album(self, album_id: int) -> Album:
+        self.requests.append(album_id)
+
+        if self.event_release:
+            self.event_release.wait()
+
+        if self.fails:
+            self.fails -= 1
+
+            raise ConnectionError
+
+        return _album(album_id, num_tracks=10)
+
+
+def test_completes_embedded_album():
+    session = _Session()
+    cache = AlbumCache(session)
+
+    track: Track = cache.track_complete(_track(_album(1)))
+
+    assert track.album.num_tracks == 10
+    assert session.requests == [1]
+
+
+def test_keeps_complete_and_missing_album():
+    session = _Session()
+    cache = AlbumCache(session)
+    album: Album = _album(1, num_tracks=3)
+
+    assert cache.track_complete(_track(album)).album is album
+    assert cache.track_complete(_track(None)).album is None
+    assert session.requests == []
+
+
+def test_known_albums_are_not_requested():
+    session = _Session()
+    album: Album = _album(1, num_tracks=3)
+    cache = AlbumCache(session, [album])
+
+    assert cache.track_complete(_track(_album(1))).album is album
+    assert session.requests == []
+
+
+def test_tracks_of_same_album_share_request():
+    event_release = Event()
+    session = _Session(event_release)
+    cache = AlbumCache(session)
+
+    with futures.ThreadPoolExecutor(4) as executor:
+        futures_track: list[futures.Future] = [
+            executor.submit(cache.track_complete, _track(_album(1))) for _ in range(4)
+        ]
+
+        event_release.set()
+        albums: list[Album] = [future.result().album for future in futures_track]
+
+    assert session.requests == [1]
+    assert all(album is albums[0] for album in albums)
+
+
+def test_failed_request_is_retried():
+    session = _Session(fails=1)
+    cache = AlbumCache(session)
+
+    with pytest.raises(ConnectionError):
+        cache.track_complete(_track(_album(1)))
+
+    assert cache.track_complete(_track(_album(1))).album.num_tracks == 10
+    assert session.requests == [1, 1]
@@ -0,0 +1,153 @@
+import io
+import os
+
+from tidal_dl_ng.helper.writer import SegmentWriter
+
+
+class _Pipe(io.BytesIO):
+    # Target, which cannot be rolled back (like a pipe into a remuxing process).
+    def seekable(self) -> bool:
+        return False
+
+
+class _Xor:
+    # Stand-in for a stream cipher: The keystream byte depends on the absolute offset only.
+    def __init__(self, offset: int):
+        self.offset = offset
+
+    def decrypt(self, data: bytes) -> bytes:
+        result = bytes(b ^ ((self.offset + i) % 251) for i, b in enumerate(data))
+        self.offset += len(data)
+
+        return result
+
+
+def _segments(count: int = 4, size: int = 10) -> list[bytes]:
+    return [bytes([i]) * size for i in range(count)]
+
+
+def test_writes_out_of_order_segments_in_order():
+    target = io.BytesIO()
+    segments = _segments()
+    writer = SegmentWriter(target, window=len(segments))
+
+    for index in (2, 0, 3, 1):
+        writer.write(index, segments[index])
+        writer.finish(index)
+
+    assert writer.is_complete(len(segments))
+    assert target.getvalue() == b"".join(segments)
+
+
+def test_unseekable_target_buffers_head_segment():
+    target = _Pipe()
+    segments = _segments()
+    writer = SegmentWriter(target, window=len(segments))
+
+    writer.write(0, segments[0])
+
+    assert target.getvalue() == b""
+
+    writer.finish(0)
+
+    for index in (3, 1, 2):
+        writer.write(index, segments[index])
+        writer.finish(index)
+
+    assert target.getvalue() == b"".join(segments)
+
+
+def test_discard_rolls_back_head_segment():
+    target = io.BytesIO()
+    segments = _segments()
+    written: list[tuple[int, int]] = []
+    writer = SegmentWriter(
+        target, window=len(segments), fn_segment_written=lambda index, size, checksum: written.append((index, size))
+    )
+
+    writer.write(0, segments[0])
+    writer.finish(0)
+    writer.write(1, b"garbage")
+    writer.discard(1)
+    writer.write(1, segments[1])
+    writer.finish(1)
+
+    assert target.getvalue() == b"".join(segments[:2])
+    assert written == [(0, 10), (1, 10)]
+
+
+def test_discard_drops_buffered_segment():
+    target = io.BytesIO()
+    segments = _segments()
+    writer = SegmentWriter(target, window=len(segments))
+
+    writer.write(2, b"garbage")
+    writer.discard(2)
+
+    for index in range(len(segments)):
+        writer.write(index, segments[index])
+        writer.finish(index)
+
+    assert target.getvalue() == b"".join(segments)
+
+
+def test_failed_segment_stops_reporting():
+    target = io.BytesIO()
+    segments = _segments()
+    written: list[int] = []
+    writer = SegmentWriter(
+        target, window=len(segments), fn_segment_written=lambda index, size, checksum: written.append(index)
+    )
+
+    writer.write(0, segments[0])
+    writer.finish(0)
+    writer.finish(1, success=False)
+
+    for index in (2, 3):
+        writer.write(index, segments[index])
+        writer.finish(index)
+
+    assert writer.is_complete(len(segments))
+    assert written == [0]
+
+
+def test_window_limits_segments_ahead():
+    writer = SegmentWriter(io.BytesIO(), window=2)
+
+    assert writer.window_contains(1)
+    assert not writer.window_contains(2)
+
+    writer.write(0, b"data")
+    writer.finish(0)
+
+    assert writer.window_contains(2)
+
+
+def test_decryptor_is_recreated_at_rolled_back_offset():
+    plain = os.urandom(40)
+    encrypted = _Xor(0).decrypt(plain)
+    target = io.BytesIO()
+    writer = SegmentWriter(target, window=4, fn_decryptor=_Xor)
+
+    writer.write(0, encrypted[:20])
+    writer.finish(0)
+    writer.write(1, encrypted[20:27])
+    writer.discard(1)
+    writer.write(1, encrypted[20:])
+    writer.finish(1)
+
+    assert target.getvalue() == plain
+
+
+def test_resume_starts_at_offset():
+    segments = _segments()
+    target = io.BytesIO(b"".join(segments[:2]))
+    target.seek(0, io.SEEK_END)
+    writer = SegmentWriter(target, window=4, index_start=2, offset_start=20)
+
+    for index in (3, 2):
+        writer.write(index, segments[index])
+        writer.finish(index)
+
+    assert writer.is_complete(len(segments))
+    assert target.getvalue() == b"".join(segments)
@@ -23,6 +23,7 @@ from tidal_dl_ng.config import HandlingApp, Settings, Tidal
 from tidal_dl_ng.constants import CTX_TIDAL, MediaType
 from tidal_dl_ng.download import Download
 from tidal_dl_ng.helper.path import get_format_template, path_file_settings
+from tidal_dl_ng.helper.stats import ThroughputColumn
 from tidal_dl_ng.helper.tidal import (
     all_artist_album_ids,
     get_tidal_media_id,
@@ -127,21 +128,21 @@ def _handle_album_playlist_mix_artist(
     else:
         item_ids.append(item_id)
 
-    for _item_id in item_ids:
-        if handling_app.event_abort.is_set():
-            return False
+    if handling_app.event_abort.is_set():
+        return False
 
-        dl.items(
-            media_id=_item_id,
-            media_type=media_type,
-            file_template=file_template,
-            video_download=settings.data.video_download,
-            download_delay=settings.data.download_delay,
-            quality_audio=settings.data.quality_audio,
-            quality_video=settings.data.quality_video,
-        )
+    # All albums of an artist share one job dispatcher, so the workers stay busy at album boundaries.
+    dl.items_many(
+        file_template=file_template,
+        medias=item_ids,
+        media_type=media_type,
+        video_download=settings.data.video_download,
+        download_delay=settings.data.download_delay,
+        quality_audio=settings.data.quality_audio,
+        quality_video=settings.data.quality_video,
+    )
 
-    return True
+    return not handling_app.event_abort.is_set()
 
 
 def _process_url(
@@ -226,6 +227,7 @@ def _download(ctx: typer.Context, urls: list[str], try_login: bool = True) -> bo
         SpinnerColumn(),
         BarColumn(),
         TaskProgressColumn(),
+        ThroughputColumn(),
         refresh_per_second=20,
         auto_refresh=True,
         expand=True,
@@ -237,6 +239,7 @@ def _download(ctx: typer.Context, urls: list[str], try_login: bool = True) -> bo
         SpinnerColumn(),
         BarColumn(),
         TaskProgressColumn(),
+        ThroughputColumn(),
         refresh_per_second=20,
         auto_refresh=True,
         expand=True,
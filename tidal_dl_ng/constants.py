@@ -2,6 +2,21 @@ from enum import StrEnum
 
 CTX_TIDAL: str = "tidal"
 REQUESTS_TIMEOUT_SEC: int = 45
+# Failed segment downloads are retried (transient errors only) up to this number of attempts in total.
+SEGMENT_ATTEMPTS_MAX: int = 4
+# Base and cap in seconds of the exponential backoff between segment download attempts.
+SEGMENT_RETRY_DELAY_SEC: float = 1.0
+SEGMENT_RETRY_DELAY_MAX_SEC: float = 30.0
+# Seconds to block while waiting (e.g. for a free connection slot) before the abort event is checked again.
+WAIT_TIMEOUT_SEC: float = 0.5
+# Stream manifests resolved ahead of their download are discarded after this time, since their signed URLs expire.
+STREAM_PREFETCH_TTL_SEC: float = 300.0
+# Base and cap in seconds of the exponential backoff after API throttling (HTTP 429) without a `Retry-After` header.
+THROTTLE_BACKOFF_SEC: float = 2.0
+THROTTLE_BACKOFF_MAX_SEC: float = 120.0
+# Throttled API requests of single items are attempted up to this number of times in total. Items of lists are
+# requeued instead.
+THROTTLE_ATTEMPTS_MAX: int = 4
 EXTENSION_LYRICS: str = ".lrc"
 UNIQUIFY_THRESHOLD: int = 99
 FILENAME_SANITIZE_PLACEHOLDER: str = "_"
@@ -9,7 +24,30 @@ COVER_NAME: str = "cover.jpg"
 BLOCK_SIZE: int = 4096
 BLOCKS: int = 1024
 CHUNK_SIZE: int = BLOCK_SIZE * BLOCKS
+# Single URL streams are only split into parallel byte range requests, if each part is at least this big.
+RANGE_PART_SIZE_MIN: int = CHUNK_SIZE
 PLAYLIST_EXTENSION: str = ".m3u"
+STAGING_DIR_NAME: str = ".tidal-dl-ng"
+# RAM file system to stage small items in.
+PATH_STAGING_MEMORY: str = "/dev/shm"  # noqa: S108
+# Highest bitrate of lossy (AAC) streams. Used to estimate the size of a track before it is downloaded.
+BITRATE_LOSSY_MAX_BPS: int = 320000
+JOURNAL_NAME: str = "journal.json"
+# Resumable items are staged in directories with these prefixes, all other items in temp directories with
+# `STAGING_TEMP_PREFIX`. Directories left behind (e.g. after a crash) are removed, if untouched for this long.
+STAGING_RESUME_PREFIXES: tuple[str, ...] = ("track_", "video_")
+STAGING_TEMP_PREFIX: str = "tmp_"
+STAGING_RESUME_MAX_AGE_SEC: int = 7 * 24 * 60 * 60
+# Job queues of list downloads are kept in this directory of the staging root.
+JOBS_DIR_NAME: str = "jobs"
+# Failed items of a list are retried this many times, after all other items are done.
+JOBS_RETRIES: int = 1
+# Room reserved for tags in extracted FLAC files, so tags are written in place instead of rewriting the whole file:
+# Text tags, embedded cover (upper bound of its JPEG size in bits per pixel) and lyrics (upper bound per second).
+PADDING_TAGS_SIZE: int = 8192
+PADDING_COVER_BITS_PER_PIXEL: int = 4
+PADDING_LYRICS_BYTES_PER_SEC: int = 40
+EXTENSION_PART: str = ".part"
 PLAYLIST_PREFIX: str = "_"
 FILENAME_LENGTH_MAX: int = 255
 FORMAT_TEMPLATE_EXPLICIT: str = " (Explicit)"
@@ -40,6 +78,11 @@ class CoverDimensions(StrEnum):
     PxORIGIN = "origin"
 
 
+class DownloadEngine(StrEnum):
+    THREADS = "threads"
+    ASYNCIO = "asyncio"
+
+
 class TidalLists(StrEnum):
     Playlists = "Playlists"
     Favorites = "Favorites"
@@ -8,23 +8,29 @@ Classes:
     Download: Main class for managing downloads, segment merging, file operations, and metadata.
 """
 
+import asyncio
+import contextlib
+import math
 import os
 import pathlib
 import random
 import shutil
 import tempfile
 import time
-from collections.abc import Callable
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
 from concurrent import futures
+from contextlib import nullcontext
+from functools import partial
 from threading import Event
+from typing import Any, BinaryIO
 from uuid import uuid4
 
+import httpx
 import m3u8
 import requests
 from ffmpeg import FFmpeg
 from pathvalidate import sanitize_filename
-from requests.adapters import HTTPAdapter, Retry
-from requests.exceptions import HTTPError
 from rich.progress import Progress, TaskID
 from tidalapi import Album, Mix, Playlist, Session, Track, UserPlaylist, Video
 from tidalapi.exceptions import TooManyRequests
@@ -32,26 +38,64 @@ from tidalapi.media import AudioExtensions, Codec, Quality, Stream, StreamManife
 
 from tidal_dl_ng.config import Settings
 from tidal_dl_ng.constants import (
+    BITRATE_LOSSY_MAX_BPS,
     CHUNK_SIZE,
     COVER_NAME,
     EXTENSION_LYRICS,
+    EXTENSION_PART,
+    JOBS_DIR_NAME,
+    JOBS_RETRIES,
+    JOURNAL_NAME,
+    PADDING_COVER_BITS_PER_PIXEL,
+    PADDING_LYRICS_BYTES_PER_SEC,
+    PADDING_TAGS_SIZE,
     PLAYLIST_EXTENSION,
     PLAYLIST_PREFIX,
+    RANGE_PART_SIZE_MIN,
     REQUESTS_TIMEOUT_SEC,
+    SEGMENT_ATTEMPTS_MAX,
+    SEGMENT_RETRY_DELAY_MAX_SEC,
+    SEGMENT_RETRY_DELAY_SEC,
+    STAGING_DIR_NAME,
+    STAGING_RESUME_MAX_AGE_SEC,
+    STAGING_RESUME_PREFIXES,
+    STAGING_TEMP_PREFIX,
+    STREAM_PREFETCH_TTL_SEC,
+    THROTTLE_ATTEMPTS_MAX,
+    WAIT_TIMEOUT_SEC,
     AudioExtensionsValid,
     CoverDimensions,
+    DownloadEngine,
     MediaType,
     QualityVideo,
+    QueueDownloadStatus,
 )
-from tidal_dl_ng.helper.decryption import decrypt_file, decrypt_security_token
-from tidal_dl_ng.helper.exceptions import MediaMissing
+from tidal_dl_ng.helper.cover import CoverCache
+from tidal_dl_ng.helper.decryption import decrypt_file, decrypt_security_token, decryptor_ctr
+from tidal_dl_ng.helper.exceptions import DownloadAborted, MediaMissing, Mp4LayoutUnsupported, RangeNotSupported
+from tidal_dl_ng.helper.flac import flac_extract
+from tidal_dl_ng.helper.http import SessionHttp, SessionHttpAsync, error_is_congestion, error_is_transient
+from tidal_dl_ng.helper.inflight import InFlight
+from tidal_dl_ng.helper.jobs import JobQueue, ListDownload, job_key
+from tidal_dl_ng.helper.journal import DownloadJournal
 from tidal_dl_ng.helper.path import (
     check_file_exists,
+    file_link,
+    file_move,
     format_path_media,
     path_file_sanitize,
+    path_same_device,
     url_to_filename,
 )
+from tidal_dl_ng.helper.postprocess import PostProcessPool
+from tidal_dl_ng.helper.prefetch import LookAhead, PrefetchPool
+from tidal_dl_ng.helper.ratelimit import RateLimiter, ThrottleController
+from tidal_dl_ng.helper.remux import RemuxPipe
+from tidal_dl_ng.helper.scheduler import ConnectionScheduler
+from tidal_dl_ng.helper.staging import StagingMemory
+from tidal_dl_ng.helper.stats import DownloadStats, throughput_format
 from tidal_dl_ng.helper.tidal import (
+    AlbumCache,
     instantiate_media,
     items_results_all,
     name_builder_album_artist,
@@ -59,15 +103,23 @@ from tidal_dl_ng.helper.tidal import (
     name_builder_item,
     name_builder_title,
 )
+from tidal_dl_ng.helper.writer import SegmentWriter
 from tidal_dl_ng.metadata import Metadata
-from tidal_dl_ng.model.downloader import DownloadSegmentResult
+from tidal_dl_ng.model.downloader import (
+    ConcurrencyLimits,
+    DownloadSegmentResult,
+    Job,
+    SegmentStats,
+    TrackExtras,
+    TrackStats,
+)
 from tidal_dl_ng.model.gui_data import ProgressBars
 
 
-# TODO: Set appropriate client string and use it for video download.
+# TODO: Set appropriate client string.
 # https://github.com/globocom/m3u8#using-different-http-clients
 class RequestsClient:
-    """HTTP client for downloading text content from a URI."""
+    """HTTP client for downloading text content from a URI using the shared connection pool."""
 
     def download(
         self, uri: str, timeout: int = REQUESTS_TIMEOUT_SEC, headers: dict | None = None, verify_ssl: bool = True
@@ -86,9 +138,8 @@ class RequestsClient:
         if not headers:
             headers = {}
 
-        o = requests.get(uri, timeout=timeout, headers=headers)
-
-        return o.text, o.url
+        with SessionHttp().session.get(uri, timeout=timeout, headers=headers, verify=verify_ssl) as o:
+            return o.text, o.url
 
 
 # TODO: Use pathlib.Path everywhere
@@ -97,6 +148,16 @@ class Download:
 
     settings: Settings
     session: Session
+    session_http: requests.Session
+    scheduler: ConnectionScheduler
+    postprocess_pool: PostProcessPool
+    cover_cache: CoverCache
+    rate_limiter: RateLimiter
+    inflight: InFlight
+    throttle: ThrottleController
+    prefetch_pool: PrefetchPool
+    staging_memory: StagingMemory
+    stats: DownloadStats
     skip_existing: bool = False
     fn_logger: Callable
     progress_gui: ProgressBars
@@ -132,6 +193,26 @@ class Download:
         """
         self.settings = Settings()
         self.session = session
+        # Pooled keep-alive HTTP session, which is shared by all downloads of this process.
+        self.session_http = SessionHttp().session
+        # Connection slots are shared by all downloads of this process.
+        self.scheduler = ConnectionScheduler()
+        # Downloaded items of lists are post-processed in a separate pool, shared by all downloads of this process.
+        self.postprocess_pool = PostProcessPool()
+        # Cover images are cached, so tracks of the same album share them.
+        self.cover_cache = CoverCache()
+        # Download starts of all workers are paced by one rate limiter.
+        self.rate_limiter = RateLimiter()
+        # If the TIDAL API throttles requests, all API requests of this process back off together.
+        self.throttle = ThrottleController()
+        # Identical tracks, which are requested at once, are downloaded once.
+        self.inflight = InFlight()
+        # Lyrics and covers are fetched in the background, while the audio is downloading.
+        self.prefetch_pool = PrefetchPool()
+        # Small items are staged in RAM within a process wide budget.
+        self.staging_memory = StagingMemory()
+        # Throughput metrics of all downloads of this instance.
+        self.stats = DownloadStats()
         self.skip_existing = skip_existing
         self.fn_logger = fn_logger
         self.progress_gui = progress_gui
@@ -141,16 +222,24 @@ class Download:
         self.event_abort = event_abort
         self.event_run = event_run
 
-        if not self.settings.data.path_binary_ffmpeg and (
-            self.settings.data.video_convert_mp4 or self.settings.data.extract_flac
-        ):
+        # Finished items are only renamed into place, if they are staged on the same drive.
+        if not path_same_device(self._path_staging_root(), pathlib.Path(self.path_base)):
+            self.fn_logger.warning(
+                f"Staging directory '{self._path_staging_root()}' is on another drive than '{self.path_base}'. "
+                "Every downloaded file is copied once more. Set `path_staging` to a directory on the same drive or "
+                "leave it empty."
+            )
+
+        # Partial downloads, which have not been resumed for a long time, are not going to be resumed anymore.
+        self._staging_prune()
+
+        # FLAC is extracted in-process. FFmpeg is only needed for videos (and as a fallback for unusual MP4 layouts).
+        if not self.settings.data.path_binary_ffmpeg and self.settings.data.video_convert_mp4:
             self.settings.data.video_convert_mp4 = False
-            self.settings.data.extract_flac = False
 
             self.fn_logger.error(
-                "FFmpeg path is not set. Videos can be downloaded but will not be processed. FLAC cannot be "
-                "extracted from MP4 containers. Make sure FFmpeg is installed. The path to the FFmpeg binary must "
-                "be set in (`path_binary_ffmpeg`)."
+                "FFmpeg path is not set. Videos can be downloaded but will not be processed. Make sure FFmpeg is "
+                "installed. The path to the FFmpeg binary must be set in (`path_binary_ffmpeg`)."
             )
 
     def _get_media_urls(
@@ -172,7 +261,7 @@ class Download:
             return stream_manifest.get_urls()
         elif isinstance(media, Video):
             quality_video = self.settings.data.quality_video
-            m3u8_variant: m3u8.M3U8 = m3u8.load(media.get_url())
+            m3u8_variant: m3u8.M3U8 = m3u8.load(media.get_url(), http_client=RequestsClient())
             # Find the desired video resolution or the next best one.
             m3u8_playlist, _ = self._extract_video_stream(m3u8_variant, int(quality_video))
 
@@ -180,11 +269,45 @@ class Download:
         else:
             return []
 
+    def _stream_probe(self, url: str) -> tuple[int, bool]:
+        """Request the headers of a single URL stream to get its size and check for HTTP range support.
+
+        Args:
+            url (str): URL of the stream.
+
+        Returns:
+            tuple[int, bool]: (Size in bytes, whether the server accepts byte range requests)
+        """
+        with self.session_http.head(url, timeout=REQUESTS_TIMEOUT_SEC) as r:
+            size: int = int(r.headers.get("content-length", 0))
+            ranges_accepted: bool = r.headers.get("accept-ranges", "").lower() == "bytes"
+
+        return size, ranges_accepted
+
+    def _byte_ranges_compute(self, size: int) -> list[tuple[int, int]]:
+        """Split a stream of `size` bytes into byte ranges, which can be downloaded concurrently.
+
+        Args:
+            size (int): Size of the stream in bytes.
+
+        Returns:
+            list[tuple[int, int]]: Inclusive (first byte, last byte) ranges. Empty, if splitting is not worth it.
+        """
+        parts: int = min(self.settings.data.downloads_simultaneous_per_track_max, size // RANGE_PART_SIZE_MIN)
+
+        if parts < 2:
+            return []
+
+        part_size: int = math.ceil(size / parts)
+
+        return [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
     def _setup_progress(
         self,
         media_name: str,
         urls: list[str],
         progress_to_stdout: bool,
+        size_total: int = 0,
     ) -> tuple[TaskID, int | float | None, int | None]:
         """Set up the progress bar/task and compute progress total and block size.
 
@@ -192,6 +315,7 @@ class Download:
             media_name (str): Name of the media item.
             urls (list[str]): List of segment URLs.
             progress_to_stdout (bool): Whether to show progress in stdout.
+            size_total (int, optional): Size in bytes of a single URL stream (see `_stream_probe`). Defaults to 0.
 
         Returns:
             tuple[TaskID, int | float | None, int | None]: (TaskID, progress_total, block_size)
@@ -205,15 +329,9 @@ class Download:
             progress_total: int = urls_count
             block_size: int | None = None
         elif urls_count == 1:
-            try:
-                # Get file size and compute progress steps
-                r = requests.head(urls[0], timeout=REQUESTS_TIMEOUT_SEC)
-
-                total_size_in_bytes: int = int(r.headers.get("content-length", 0))
-                block_size = 1048576
-                progress_total = total_size_in_bytes / block_size
-            finally:
-                r.close()
+            # Compute progress steps from file size
+            block_size = 1048576
+            progress_total = size_total / block_size
         else:
             raise ValueError
 
@@ -232,6 +350,10 @@ class Download:
         block_size: int | None,
         p_task: TaskID,
         progress_to_stdout: bool,
+        target: BinaryIO | None = None,
+        fn_decryptor: Callable | None = None,
+        byte_ranges: list[tuple[int, int]] | None = None,
+        journal: DownloadJournal | None = None,
     ) -> tuple[bool, list[DownloadSegmentResult]]:
         """Download all segments with progress reporting and abort handling.
 
@@ -241,52 +363,225 @@ class Download:
             block_size (int | None): Block size for streaming.
             p_task (TaskID): Progress bar task ID.
             progress_to_stdout (bool): Whether to show progress in stdout.
+            target (BinaryIO | None, optional): If given, segments are written in order directly into this stream
+                instead of separate segment files. Defaults to None.
+            fn_decryptor (Callable | None, optional): Decryptor factory (see `SegmentWriter`) to decrypt segments
+                inline while writing them into `target`. Defaults to None.
+            byte_ranges (list[tuple[int, int]] | None, optional): If given, the single URL in `urls` is downloaded
+                as concurrent byte ranges, each handled as a segment. Requires `target`. Defaults to None.
+            journal (DownloadJournal | None, optional): If given, segments already journaled are skipped and newly
+                written segments are journaled. Requires `target`. Defaults to None.
 
         Returns:
             tuple[bool, list[DownloadSegmentResult]]: (result_segments, list of segment results)
         """
         result_segments: bool = True
         dl_segment_results: list[DownloadSegmentResult] = []
+        workers_max: int = self.settings.data.downloads_simultaneous_per_track_max
+        # Either one segment per URL or one segment per byte range of the single URL.
+        segments: list[tuple[str, tuple[int, int] | None]] = (
+            [(urls[0], byte_range) for byte_range in byte_ranges] if byte_ranges else [(url, None) for url in urls]
+        )
+        # Sometimes it happens, if a track is very short (< 8 seconds or so), that the last URL in `urls` is
+        # invalid (HTTP Error 500) and not necessary. File won't be corrupt, so this segment is optional.
+        index_optional: int = len(urls) - 1 if len(urls) > 1 and not byte_ranges else -1
+        writer: SegmentWriter | None = None
+        index_start: int = 0
+
+        if target:
+            offset_start: int = 0
+
+            # Continue right after the segments, which have already been written (e.g. by an interrupted run).
+            if journal:
+                index_start, offset_start = journal.resume_point()
+
+                if index_start:
+                    self.fn_logger.debug(f"Resuming download at chunk {index_start + 1} of {len(segments)}.")
+                    self.progress.advance(p_task, offset_start / block_size if block_size else index_start)
+
+            # Start with an empty (rest of the) target file. A pipe is empty anyway.
+            if target.seekable():
+                target.seek(offset_start)
+                target.truncate()
+
+            # Allow twice as many segments in flight as workers, so buffered out-of-order segments stay bounded.
+            writer = SegmentWriter(
+                target,
+                window=workers_max * 2,
+                fn_decryptor=fn_decryptor,
+                fn_segment_written=journal.segment_add if journal else None,
+                index_start=index_start,
+                offset_start=offset_start,
+            )
 
-        # Download segments until progress is finished.
-        # TODO: Compute download speed (https://github.com/Textualize/rich/blob/master/examples/downloader.py)
-        while not self.progress.tasks[p_task].finished:
-            with futures.ThreadPoolExecutor(
-                max_workers=self.settings.data.downloads_simultaneous_per_track_max
-            ) as executor:
-                # Dispatch all download tasks to worker threads
-                l_futures: list[futures.Future] = [
-                    executor.submit(self._download_segment, url, path_base, block_size, p_task, progress_to_stdout)
-                    for url in urls
-                ]
-
-                # Report results as they become available
-                for future in futures.as_completed(l_futures):
-                    # Retrieve result
-                    result_dl_segment: DownloadSegmentResult = future.result()
+        segments_pending: list[tuple[int, str, tuple[int, int] | None, bool]] = [
+            (index, url, byte_range, index == index_optional)
+            for index, (url, byte_range) in enumerate(segments)
+            if index >= index_start
+        ]
+        # Either a thread per simultaneous segment download or coroutines on the shared event loop.
+        fn_fetch: Callable[..., Iterable[DownloadSegmentResult]] = (
+            self._segments_fetch_async
+            if self.settings.data.download_engine == DownloadEngine.ASYNCIO
+            else self._segments_fetch_threads
+        )
 
-                    dl_segment_results.append(result_dl_segment)
+        # Register at the process wide scheduler, so connection slots are shared fairly with other items.
+        id_scheduler: int = self.scheduler.track_register(workers_max)
 
-                    # Check for a link that was skipped
-                    if not result_dl_segment.result and (result_dl_segment.url is not urls[-1]):
-                        # Sometimes it happens, if a track is very short (< 8 seconds or so), that the last URL in `urls` is
-                        # invalid (HTTP Error 500) and not necessary. File won't be corrupt.
-                        # If this is NOT the case, but any other URL has resulted in an error,
-                        # mark the whole thing as corrupt.
-                        result_segments = False
+        try:
+            # Failed segments are retried individually, so every segment is dispatched only once.
+            for result_dl_segment in fn_fetch(
+                segments_pending, path_base, block_size, p_task, progress_to_stdout, writer, id_scheduler
+            ):
+                dl_segment_results.append(result_dl_segment)
 
-                        self.fn_logger.error("Something went wrong while downloading. File is corrupt!")
+                # Any failed segment, except the optional one, corrupts the file.
+                if not result_dl_segment.result and result_dl_segment.index != index_optional:
+                    result_segments = False
+        finally:
+            self.scheduler.track_unregister(id_scheduler)
 
-                    # If app is terminated (CTRL+C)
-                    if self.event_abort.is_set():
-                        # Cancel all not yet started tasks
-                        for f in l_futures:
-                            f.cancel()
+        # If app is terminated (CTRL+C)
+        if self.event_abort.is_set():
+            return False, dl_segment_results
 
-                        return False, dl_segment_results
+        if not result_segments:
+            self._segments_failure_report(dl_segment_results, len(segments), index_optional)
 
         return result_segments, dl_segment_results
 
+    def _segments_failure_report(
+        self, dl_segment_results: list[DownloadSegmentResult], segments_count: int, index_optional: int
+    ) -> None:
+        """Log every segment, which could not be downloaded, with the reason.
+
+        Args:
+            dl_segment_results (list[DownloadSegmentResult]): Results of all segments.
+            segments_count (int): Total number of segments.
+            index_optional (int): Index of the optional segment (may fail), or -1.
+        """
+        for result in sorted(dl_segment_results, key=lambda x: x.index):
+            if not result.result and result.index != index_optional:
+                self.fn_logger.error(
+                    f"Chunk {result.index + 1} of {segments_count} failed after {result.attempts} attempt(s): "
+                    f"{result.error!r}"
+                )
+
+        self.fn_logger.error("Something went wrong while downloading. File is corrupt!")
+
+    def _segments_fetch_threads(
+        self,
+        segments: list[tuple[int, str, tuple[int, int] | None, bool]],
+        path_base: pathlib.Path,
+        block_size: int | None,
+        p_task: TaskID,
+        progress_to_stdout: bool,
+        writer: SegmentWriter | None,
+        id_scheduler: int,
+    ) -> Iterator[DownloadSegmentResult]:
+        """Download segments with a pool of worker threads.
+
+        Args:
+            segments (list[tuple[int, str, tuple[int, int] | None, bool]]): (Index, URL, byte range, optional) of
+                each segment.
+            path_base (pathlib.Path): Base path for segment files.
+            block_size (int | None): Block size for streaming.
+            p_task (TaskID): Progress bar task ID.
+            progress_to_stdout (bool): Whether to show progress in stdout.
+            writer (SegmentWriter | None): Ordered writer, if segments are written directly.
+            id_scheduler (int): ID of the item at the connection scheduler.
+
+        Yields:
+            DownloadSegmentResult: Result of each segment, in the order of completion.
+        """
+        with futures.ThreadPoolExecutor(
+            max_workers=self.settings.data.downloads_simultaneous_per_track_max
+        ) as executor:
+            # Dispatch all download tasks to worker threads
+            l_futures: list[futures.Future] = [
+                executor.submit(
+                    self._download_segment,
+                    url,
+                    path_base,
+                    block_size,
+                    p_task,
+                    progress_to_stdout,
+                    index,
+                    writer,
+                    byte_range,
+                    id_scheduler,
+                    optional,
+                )
+                for index, url, byte_range, optional in segments
+            ]
+
+            for future in futures.as_completed(l_futures):
+                yield future.result()
+
+                # If app is terminated (CTRL+C)
+                if self.event_abort.is_set():
+                    # Cancel all not yet started tasks
+                    for f in l_futures:
+                        f.cancel()
+
+                    return
+
+    def _segments_fetch_async(
+        self,
+        segments: list[tuple[int, str, tuple[int, int] | None, bool]],
+        path_base: pathlib.Path,
+        block_size: int | None,
+        p_task: TaskID,
+        progress_to_stdout: bool,
+        writer: SegmentWriter | None,
+        id_scheduler: int,
+    ) -> list[DownloadSegmentResult]:
+        """Download segments as coroutines on the shared event loop of the asyncio engine.
+
+        Concurrency is limited by the process wide `ConnectionScheduler`, so no thread pool per item is needed.
+
+        Args:
+            segments (list[tuple[int, str, tuple[int, int] | None, bool]]): (Index, URL, byte range, optional) of
+                each segment.
+            path_base (pathlib.Path): Base path for segment files.
+            block_size (int | None): Block size for streaming.
+            p_task (TaskID): Progress bar task ID.
+            progress_to_stdout (bool): Whether to show progress in stdout.
+            writer (SegmentWriter | None): Ordered writer, if segments are written directly.
+            id_scheduler (int): ID of the item at the connection scheduler.
+
+        Returns:
+            list[DownloadSegmentResult]: Result of each segment.
+        """
+        engine: SessionHttpAsync = SessionHttpAsync()
+
+        async def fetch_all() -> list[DownloadSegmentResult]:
+            # Wakes up segments waiting for the reorder window of the writer, whenever a segment is finished.
+            window_changed: asyncio.Condition = asyncio.Condition()
+
+            return await asyncio.gather(
+                *(
+                    self._download_segment_async(
+                        engine,
+                        window_changed,
+                        url,
+                        path_base,
+                        block_size,
+                        p_task,
+                        progress_to_stdout,
+                        index,
+                        writer,
+                        byte_range,
+                        id_scheduler,
+                        optional,
+                    )
+                    for index, url, byte_range, optional in segments
+                )
+            )
+
+        return engine.run(fetch_all())
+
     def _download_postprocess(
         self,
         result_segments: bool,
@@ -294,6 +589,8 @@ class Download:
         dl_segment_results: list[DownloadSegmentResult],
         media: Track | Video,
         stream_manifest: StreamManifest | None = None,
+        merge: bool = True,
+        decrypted: bool = False,
     ) -> tuple[bool, pathlib.Path]:
         """Merge segments, decrypt if needed, and return the final file path.
 
@@ -303,6 +600,9 @@ class Download:
             dl_segment_results (list[DownloadSegmentResult]): List of segment download results.
             media (Track | Video): The media item.
             stream_manifest (StreamManifest | None, optional): Stream manifest for tracks. Defaults to None.
+            merge (bool, optional): Whether segment files need to be merged into `path_file`. Set to False, if
+                segments were already written directly into `path_file`. Defaults to True.
+            decrypted (bool, optional): Whether the segments were already decrypted inline. Defaults to False.
 
         Returns:
             tuple[bool, pathlib.Path]: (Success, path to downloaded or decrypted file)
@@ -312,14 +612,17 @@ class Download:
 
         # Only if no error happened while downloading.
         if result_segments:
-            # Bring list into right order, so segments can be easily merged.
-            dl_segment_results.sort(key=lambda x: x.id_segment)
+            if merge:
+                # Bring list into right order, so segments can be easily merged.
+                dl_segment_results.sort(key=lambda x: x.id_segment)
 
-            result_merge = self._segments_merge(path_file, dl_segment_results)
+                result_merge = self._segments_merge(path_file, dl_segment_results)
+            else:
+                result_merge = True
 
             if not result_merge:
                 self.fn_logger.error(f"Something went wrong while writing to {media.name}. File is corrupt!")
-            elif isinstance(media, Track) and stream_manifest.is_encrypted:
+            elif isinstance(media, Track) and stream_manifest.is_encrypted and not decrypted:
                 key, nonce = decrypt_security_token(stream_manifest.encryption_key)
                 tmp_path_file_decrypted = path_file.with_suffix(".decrypted")
 
@@ -332,6 +635,7 @@ class Download:
         media: Track | Video,
         path_file: pathlib.Path,
         stream_manifest: StreamManifest | None = None,
+        journal: DownloadJournal | None = None,
     ) -> tuple[bool, pathlib.Path]:
         """Download a media item (track or video), handling segments and merging.
 
@@ -339,6 +643,8 @@ class Download:
             media (Track | Video): The media item to download.
             path_file (pathlib.Path): Path to the output file.
             stream_manifest (StreamManifest | None, optional): Stream manifest for tracks. Defaults to None.
+            journal (DownloadJournal | None, optional): Journal to resume a partial download in `path_file` from.
+                Only used if segments are written directly. Defaults to None.
 
         Returns:
             tuple[bool, pathlib.Path]: (Success, path to downloaded or decrypted file)
@@ -359,20 +665,177 @@ class Download:
             self.progress_gui.item_name.emit(media_name[:30])
 
         try:
-            p_task, progress_total, block_size = self._setup_progress(media_name, urls, progress_to_stdout)
+            size_total, ranges_accepted = self._stream_probe(urls[0]) if len(urls) == 1 else (0, False)
+            p_task, progress_total, block_size = self._setup_progress(media_name, urls, progress_to_stdout, size_total)
         except Exception:
             return False, path_file
 
-        result_segments, dl_segment_results = self._download_segments(
-            urls, path_file.parent, block_size, p_task, progress_to_stdout
+        self.stats.track_begin(p_task, media_name)
+
+        # Segments are either written in order directly into the target file or into separate segment files, which
+        # are merged afterward.
+        segments_write_direct: bool = self.settings.data.segments_write_direct
+        fn_decryptor: Callable | None = None
+        # Single URL streams are fetched as concurrent byte ranges, if the server supports it.
+        byte_ranges: list[tuple[int, int]] = (
+            self._byte_ranges_compute(size_total) if ranges_accepted and segments_write_direct else []
+        )
+
+        # Encrypted streams are decrypted inline while writing, so no separate decrypted copy is needed.
+        if segments_write_direct and isinstance(media, Track) and stream_manifest.is_encrypted:
+            key, nonce = decrypt_security_token(stream_manifest.encryption_key)
+            fn_decryptor = partial(decryptor_ctr, key, nonce)
+
+        remux: RemuxPipe | None = self._remux_create(media, path_file) if segments_write_direct else None
+
+        # A pipe cannot be resumed.
+        if not segments_write_direct or remux:
+            journal = None
+        elif journal:
+            # Only trust the journal, if the stream has the same layout and the journaled data is intact.
+            journal.load(
+                fingerprint=f"{len(urls)}:{size_total}:{len(byte_ranges)}",
+                segments_count=len(byte_ranges) or len(urls),
+            )
+            journal.verify(path_file)
+
+        # Keep the already downloaded data, if the download is resumed.
+        mode_open: str = "r+b" if journal and path_file.exists() else "wb"
+        target_open: contextlib.AbstractContextManager = (
+            remux or path_file.open(mode_open) if segments_write_direct else nullcontext()
         )
 
+        with target_open as f_target:
+            result_segments, dl_segment_results = self._download_segments(
+                urls,
+                path_file.parent,
+                block_size,
+                p_task,
+                progress_to_stdout,
+                f_target,
+                fn_decryptor,
+                byte_ranges,
+                journal,
+            )
+
+            # Fall back to a single connection, if the server has ignored the range requests after all.
+            if (
+                byte_ranges
+                and not result_segments
+                and not self.event_abort.is_set()
+                and any(isinstance(r.error, RangeNotSupported) for r in dl_segment_results)
+            ):
+                self.fn_logger.debug(f"Byte range requests not honoured. Using a single stream for '{media_name}'.")
+                self.progress.reset(p_task, total=progress_total)
+
+                if journal:
+                    journal.load(fingerprint=f"{len(urls)}:{size_total}:0", segments_count=len(urls))
+
+                result_segments, dl_segment_results = self._download_segments(
+                    urls,
+                    path_file.parent,
+                    block_size,
+                    p_task,
+                    progress_to_stdout,
+                    f_target,
+                    fn_decryptor,
+                    None,
+                    journal,
+                )
+
+        # Persist the segments journaled since the last save, so an interrupted download resumes after them.
+        if journal:
+            journal.flush()
+
+        self._track_stats_log(self.stats.track_end(p_task))
+
+        result_segments, path_file = self._remux_finish(remux, result_segments, path_file, media_name)
+
         result_merge, tmp_path_file_decrypted = self._download_postprocess(
-            result_segments, path_file, dl_segment_results, media, stream_manifest
+            result_segments,
+            path_file,
+            dl_segment_results,
+            media,
+            stream_manifest,
+            merge=not segments_write_direct,
+            decrypted=fn_decryptor is not None,
         )
 
         return result_merge, tmp_path_file_decrypted
 
+    def _remux_enabled(self, media: Track | Video) -> bool:
+        """Check, if a media item is converted to MP4 while it is downloading.
+
+        Args:
+            media (Track | Video): The media item.
+
+        Returns:
+            bool: Whether the item is piped into FFmpeg instead of being written to a file.
+        """
+        return bool(
+            isinstance(media, Video)
+            and self.settings.data.video_convert_mp4
+            and self.settings.data.video_convert_stream
+        )
+
+    def _remux_create(self, media: Track | Video, path_file: pathlib.Path) -> RemuxPipe | None:
+        """Prepare the conversion of a video to MP4 while it is downloading, if enabled.
+
+        The ordered TS stream is piped into FFmpeg, so only the MP4 file is written to disk.
+
+        Args:
+            media (Track | Video): The media item.
+            path_file (pathlib.Path): Path to the output file. The MP4 file is written next to it.
+
+        Returns:
+            RemuxPipe | None: Stream to write the segments into, or None if the item is not converted on the fly.
+        """
+        if not self._remux_enabled(media):
+            return None
+
+        return RemuxPipe(self.settings.data.path_binary_ffmpeg, path_file.with_suffix(AudioExtensions.MP4), "mpegts")
+
+    def _remux_finish(
+        self, remux: RemuxPipe | None, result_segments: bool, path_file: pathlib.Path, media_name: str
+    ) -> tuple[bool, pathlib.Path]:
+        """Check the result of a conversion while downloading.
+
+        Args:
+            remux (RemuxPipe | None): The finished conversion, if any.
+            result_segments (bool): Whether all segments were downloaded successfully.
+            path_file (pathlib.Path): Path to the downloaded file.
+            media_name (str): Name of the item for logging.
+
+        Returns:
+            tuple[bool, pathlib.Path]: (Success, path to the converted or downloaded file)
+        """
+        if not remux:
+            return result_segments, path_file
+
+        if result_segments and remux.error:
+            self.fn_logger.error(f"Converting '{media_name}' to MP4 failed: {remux.error!r}")
+
+            return False, remux.path_out
+
+        return result_segments, remux.path_out
+
+    def _track_stats_log(self, track: TrackStats | None) -> None:
+        """Log the throughput metrics of a downloaded track.
+
+        Args:
+            track (TrackStats | None): Metrics of the track.
+        """
+        if not track or not track.segments:
+            return
+
+        # Waiting for connections hints at too low limits, a high TTFB at CDN latency and long writes at the disk.
+        self.fn_logger.debug(
+            f"Downloaded '{track.name}': {track.size / 1048576:.1f} MiB in {track.duration:.1f} s "
+            f"({throughput_format(track.throughput)}), {track.segments} chunks, "
+            f"avg. time to first byte {track.ttfb_avg * 1000:.0f} ms, "
+            f"waiting for connections {track.time_wait_sum:.1f} s, writing {track.time_write_sum:.1f} s."
+        )
+
     def _segments_merge(self, path_file: pathlib.Path, dl_segment_results: list[DownloadSegmentResult]) -> bool:
         """Merge downloaded segments into a single file and clean up segment files.
 
@@ -404,9 +867,19 @@ class Download:
         return result
 
     def _download_segment(
-        self, url: str, path_base: pathlib.Path, block_size: int | None, p_task: TaskID, progress_to_stdout: bool
+        self,
+        url: str,
+        path_base: pathlib.Path,
+        block_size: int | None,
+        p_task: TaskID,
+        progress_to_stdout: bool,
+        index: int = 0,
+        writer: SegmentWriter | None = None,
+        byte_range: tuple[int, int] | None = None,
+        id_scheduler: int | None = None,
+        optional: bool = False,
     ) -> DownloadSegmentResult:
-        """Download a single segment of a media file.
+        """Download a single segment of a media file. Transient errors are retried with backoff.
 
         Args:
             url (str): URL of the segment.
@@ -414,157 +887,607 @@ class Download:
             block_size (int | None): Block size for streaming.
             p_task (TaskID): Progress bar task ID.
             progress_to_stdout (bool): Whether to show progress in stdout.
+            index (int, optional): Position of the segment within the media file. Defaults to 0.
+            writer (SegmentWriter | None, optional): If given, the segment is written through the ordered writer
+                instead of a separate segment file. Defaults to None.
+            byte_range (tuple[int, int] | None, optional): Inclusive byte range of `url` to download as this
+                segment. Defaults to None.
+            id_scheduler (int | None, optional): ID of the item at the connection scheduler. If given, a connection
+                slot is acquired for the request. Defaults to None.
+            optional (bool, optional): The segment may fail without corrupting the file. It is not retried.
+                Defaults to False.
 
         Returns:
             DownloadSegmentResult: Result of the segment download.
         """
         result: bool = False
-        path_segment: pathlib.Path = path_base / url_to_filename(url)
-        # Calculate the segment ID based on the file name within the URL.
-        filename_stem: str = str(path_segment.stem).split("_")[-1]
-        # CAUTION: This is a workaround, so BTS (LOW quality) track will work. They usually have only ONE link.
-        id_segment: int = int(filename_stem) if filename_stem.isdecimal() else 0
-        error: HTTPError | None = None
+        path_segment, id_segment = self._segment_identify(url, path_base)
+        error: Exception | None = None
+        stats: SegmentStats = SegmentStats()
+        attempts: int = 0
 
         # If app is terminated (CTRL+C)
-        if self.event_abort.is_set():
+        if self.event_abort.is_set() or (writer and not writer.acquire(index, self.event_abort)):
             return DownloadSegmentResult(
-                result=False, url=url, path_segment=path_segment, id_segment=id_segment, error=error
+                result=False, url=url, path_segment=path_segment, id_segment=id_segment, index=index
             )
 
-        if not self.event_run.is_set():
-            self.event_run.wait()
+        # Retry only this segment. While retrying, it keeps its position in the writer, so nothing else is lost.
+        while True:
+            if not self.event_run.is_set():
+                self.event_run.wait()
 
-        # Retry download on failed segments, with an exponential delay between retries
-        with requests.Session() as s:
-            retries = Retry(total=5, backoff_factor=1)  # , status_forcelist=[ 502, 503, 504 ])
+            attempts += 1
+            result, error, stats = self._segment_attempt(
+                url, path_segment, block_size, p_task, index, writer, byte_range, id_scheduler
+            )
+            delay: float | None = None if result else self._segment_retry_delay(error, attempts, optional)
 
-            s.mount("https://", HTTPAdapter(max_retries=retries))
+            # Wait before the next attempt, unless the app is terminated meanwhile.
+            if delay is None or self.event_abort.wait(delay):
+                break
 
-            try:
-                # Create the request object with stream=True, so the content won't be loaded into memory at once.
-                r = s.get(url, stream=True, timeout=REQUESTS_TIMEOUT_SEC)
+        self._segment_finish(p_task, block_size, progress_to_stdout, index, writer, byte_range, result, stats)
+
+        return DownloadSegmentResult(
+            result=result,
+            url=url,
+            path_segment=path_segment,
+            id_segment=id_segment,
+            error=error,
+            index=index,
+            attempts=attempts,
+            stats=stats,
+        )
+
+    def _segment_attempt(
+        self,
+        url: str,
+        path_segment: pathlib.Path,
+        block_size: int | None,
+        p_task: TaskID,
+        index: int,
+        writer: SegmentWriter | None,
+        byte_range: tuple[int, int] | None,
+        id_scheduler: int | None,
+    ) -> tuple[bool, Exception | None, SegmentStats]:
+        """Try to download a segment once.
+
+        Args:
+            url (str): URL of the segment.
+            path_segment (pathlib.Path): Path of the segment file, if no writer is used.
+            block_size (int | None): Block size for streaming.
+            p_task (TaskID): Progress bar task ID.
+            index (int): Position of the segment within the media file.
+            writer (SegmentWriter | None): Ordered writer, if segments are written directly.
+            byte_range (tuple[int, int] | None): Inclusive byte range of `url` to download, if any.
+            id_scheduler (int | None): ID of the item at the connection scheduler, if any.
+
+        Returns:
+            tuple[bool, Exception | None, SegmentStats]: (Success, error of the failed attempt, metrics)
+        """
+        headers: dict[str, str] = {"Range": f"bytes={byte_range[0]}-{byte_range[1]}"} if byte_range else {}
+        blocks_advanced: int = 0
+        stats: SegmentStats = SegmentStats()
+        time_start: float = time.perf_counter()
+
+        # Wait for a free connection slot of the process wide scheduler.
+        if id_scheduler is not None and not self.scheduler.acquire(id_scheduler, self.event_abort):
+            return False, None, stats
+
+        time_request: float = time.perf_counter()
+        stats.time_wait = time_request - time_start
+
+        # Failed requests are retried by the pooled session, with an exponential delay between retries.
+        try:
+            # Create the request object with stream=True, so the content won't be loaded into memory at once.
+            # The response is closed by the context manager, so the connection is released back into the pool.
+            with self.session_http.get(url, stream=True, timeout=REQUESTS_TIMEOUT_SEC, headers=headers) as r:
+                stats.ttfb = time.perf_counter() - time_request
 
                 r.raise_for_status()
+                self._range_response_check(r, byte_range)
 
                 # Write the content to disk. If `chunk_size` is set to `None` the whole file will be written at once.
-                with path_segment.open("wb") as f:
+                with nullcontext() if writer else path_segment.open("wb") as f:
+                    fn_write: Callable = partial(writer.write, index) if writer else f.write
+
                     for data in r.iter_content(chunk_size=block_size):
-                        f.write(data)
-                        # Advance progress bar.
-                        self.progress.advance(p_task)
+                        blocks_advanced += self._segment_data_write(fn_write, data, stats, p_task, block_size)
+        except Exception as e:
+            self._segment_attempt_failed(p_task, index, writer, blocks_advanced, e)
 
-                result = True
-            except Exception:
-                self.progress.advance(p_task)
+            return False, e, stats
+        finally:
+            if id_scheduler is not None:
+                self.scheduler.release(id_scheduler)
 
-        # To send the progress to the GUI, we need to emit the percentage.
-        if not progress_to_stdout:
-            self.progress_gui.item.emit(self.progress.tasks[p_task].percentage)
+        stats.duration = time.perf_counter() - time_request
 
-        return DownloadSegmentResult(
-            result=result, url=url, path_segment=path_segment, id_segment=id_segment, error=error
-        )
+        return True, None, stats
 
-    def extension_guess(
-        self, quality_audio: Quality, metadata_tags: list[str], is_video: bool
-    ) -> AudioExtensions | VideoExtensions:
-        """Guess the file extension for a media item based on quality and type.
+    async def _download_segment_async(
+        self,
+        engine: SessionHttpAsync,
+        window_changed: asyncio.Condition,
+        url: str,
+        path_base: pathlib.Path,
+        block_size: int | None,
+        p_task: TaskID,
+        progress_to_stdout: bool,
+        index: int = 0,
+        writer: SegmentWriter | None = None,
+        byte_range: tuple[int, int] | None = None,
+        id_scheduler: int | None = None,
+        optional: bool = False,
+    ) -> DownloadSegmentResult:
+        """Download a single segment of a media file as a coroutine (asyncio engine, see `_download_segment`).
 
         Args:
-            quality_audio (Quality): Audio quality.
-            metadata_tags (list[str]): Metadata tags for the media.
-            is_video (bool): Whether the media is a video.
+            engine (SessionHttpAsync): Engine with the HTTP client.
+            window_changed (asyncio.Condition): Notified whenever a segment of `writer` is finished.
+            url (str): URL of the segment.
+            path_base (pathlib.Path): Base path for segment file.
+            block_size (int | None): Block size for streaming.
+            p_task (TaskID): Progress bar task ID.
+            progress_to_stdout (bool): Whether to show progress in stdout.
+            index (int, optional): Position of the segment within the media file. Defaults to 0.
+            writer (SegmentWriter | None, optional): If given, the segment is written through the ordered writer
+                instead of a separate segment file. Defaults to None.
+            byte_range (tuple[int, int] | None, optional): Inclusive byte range of `url` to download as this
+                segment. Defaults to None.
+            id_scheduler (int | None, optional): ID of the item at the connection scheduler. If given, a connection
+                slot is acquired for the request. Defaults to None.
+            optional (bool, optional): The segment may fail without corrupting the file. It is not retried.
+                Defaults to False.
 
         Returns:
-            AudioExtensions | VideoExtensions: Guessed file extension.
+            DownloadSegmentResult: Result of the segment download.
         """
-        result: AudioExtensions | VideoExtensions
+        result: bool = False
+        path_segment, id_segment = self._segment_identify(url, path_base)
+        error: Exception | None = None
+        stats: SegmentStats = SegmentStats()
+        attempts: int = 0
 
-        if is_video:
-            result = AudioExtensions.MP4 if self.settings.data.video_convert_mp4 else VideoExtensions.TS
-        else:
-            result = (
-                AudioExtensions.FLAC
-                if (
-                    self.settings.data.extract_flac
-                    and quality_audio in (Quality.hi_res_lossless, Quality.high_lossless)
-                )
-                or ("HIRES_LOSSLESS" not in metadata_tags and quality_audio not in (Quality.low_96k, Quality.low_320k))
-                or quality_audio == Quality.high_lossless
-                else AudioExtensions.M4A
+        # If app is terminated (CTRL+C)
+        if self.event_abort.is_set() or not await self._segment_acquire_async(index, writer, window_changed):
+            return DownloadSegmentResult(
+                result=False, url=url, path_segment=path_segment, id_segment=id_segment, index=index
             )
 
-        return result
+        # Retry only this segment. While retrying, it keeps its position in the writer, so nothing else is lost.
+        while True:
+            # Wait while downloads are paused, without blocking the event loop.
+            while not self.event_run.is_set():
+                await asyncio.sleep(WAIT_TIMEOUT_SEC)
 
-    def item(
-        self,
-        file_template: str,
-        media_id: str | None = None,
-        media_type: MediaType | None = None,
-        media: Track | Video | None = None,
-        video_download: bool = True,
-        download_delay: bool = False,
-        quality_audio: Quality | None = None,
-        quality_video: QualityVideo | None = None,
-        is_parent_album: bool = False,
-        list_position: int = 0,
-        list_total: int = 0,
-    ) -> tuple[bool, pathlib.Path | str]:
-        """Download a single media item, handling file naming, skipping, and post-processing.
+            attempts += 1
+            result, error, stats = await self._segment_attempt_async(
+                engine, url, path_segment, block_size, p_task, index, writer, byte_range, id_scheduler
+            )
+            delay: float | None = None if result else self._segment_retry_delay(error, attempts, optional)
 
-        Args:
-            file_template (str): Template for file naming.
-            media_id (str | None, optional): Media ID. Defaults to None.
-            media_type (MediaType | None, optional): Media type. Defaults to None.
-            media (Track | Video | None, optional): Media item. Defaults to None.
-            video_download (bool, optional): Whether to allow video downloads. Defaults to True.
-            download_delay (bool, optional): Whether to delay between downloads. Defaults to False.
-            quality_audio (Quality | None, optional): Audio quality. Defaults to None.
-            quality_video (QualityVideo | None, optional): Video quality. Defaults to None.
-            is_parent_album (bool, optional): Whether this is a parent album. Defaults to False.
-            list_position (int, optional): Position in list. Defaults to 0.
-            list_total (int, optional): Total items in list. Defaults to 0.
+            if delay is None:
+                break
 
-        Returns:
-            tuple[bool, pathlib.Path | str]: (Downloaded, path to file)
-        """
-        # Step 1: Validate and prepare media
-        validated_media = self._validate_and_prepare_media(media, media_id, media_type, video_download)
-        if validated_media is None or not isinstance(validated_media, Track | Video):
-            return False, ""
+            await asyncio.sleep(delay)
 
-        media = validated_media
+            # The app was terminated meanwhile.
+            if self.event_abort.is_set():
+                break
 
-        # Step 2: Create file paths and determine skip logic
-        path_media_dst, file_extension_dummy, skip_file, skip_download = self._prepare_file_paths_and_skip_logic(
-            media, file_template, quality_audio, list_position, list_total
+        # Finishing a segment flushes the buffered segments after it through the writer, off the event loop as well.
+        await asyncio.to_thread(
+            self._segment_finish, p_task, block_size, progress_to_stdout, index, writer, byte_range, result, stats
         )
 
-        if skip_file:
-            self.fn_logger.debug(f"Download skipped, since file exists: '{path_media_dst}'")
-
-            return True, path_media_dst
+        if writer:
+            async with window_changed:
+                window_changed.notify_all()
 
-        # Step 3: Handle quality settings
-        quality_audio_old, quality_video_old = self._adjust_quality_settings(quality_audio, quality_video)
-
-        # Step 4: Download and process media
-        download_success = self._download_and_process_media(
-            media, path_media_dst, skip_download, is_parent_album, file_extension_dummy
+        return DownloadSegmentResult(
+            result=result,
+            url=url,
+            path_segment=path_segment,
+            id_segment=id_segment,
+            error=error,
+            index=index,
+            attempts=attempts,
+            stats=stats,
         )
 
-        # Step 5: Post-processing
-        self._perform_post_processing(
-            media,
-            path_media_dst,
-            quality_audio,
-            quality_video,
-            quality_audio_old,
-            quality_video_old,
-            download_delay,
-            skip_file,
+    async def _segment_attempt_async(
+        self,
+        engine: SessionHttpAsync,
+        url: str,
+        path_segment: pathlib.Path,
+        block_size: int | None,
+        p_task: TaskID,
+        index: int,
+        writer: SegmentWriter | None,
+        byte_range: tuple[int, int] | None,
+        id_scheduler: int | None,
+    ) -> tuple[bool, Exception | None, SegmentStats]:
+        """Try to download a segment once as a coroutine (see `_segment_attempt`).
+
+        Args:
+            engine (SessionHttpAsync): Engine with the HTTP client.
+            url (str): URL of the segment.
+            path_segment (pathlib.Path): Path of the segment file, if no writer is used.
+            block_size (int | None): Block size for streaming.
+            p_task (TaskID): Progress bar task ID.
+            index (int): Position of the segment within the media file.
+            writer (SegmentWriter | None): Ordered writer, if segments are written directly.
+            byte_range (tuple[int, int] | None): Inclusive byte range of `url` to download, if any.
+            id_scheduler (int | None): ID of the item at the connection scheduler, if any.
+
+        Returns:
+            tuple[bool, Exception | None, SegmentStats]: (Success, error of the failed attempt, metrics)
+        """
+        headers: dict[str, str] = {"Range": f"bytes={byte_range[0]}-{byte_range[1]}"} if byte_range else {}
+        blocks_advanced: int = 0
+        stats: SegmentStats = SegmentStats()
+        time_start: float = time.perf_counter()
+
+        # Wait for a free connection slot of the process wide scheduler.
+        if id_scheduler is not None and not await self.scheduler.acquire_async(id_scheduler, self.event_abort):
+            return False, None, stats
+
+        time_request: float = time.perf_counter()
+        stats.time_wait = time_request - time_start
+
+        try:
+            # Only stream the body, so the content won't be loaded into memory at once.
+            async with engine.client.stream("GET", url, headers=headers) as r:
+                stats.ttfb = time.perf_counter() - time_request
+
+                r.raise_for_status()
+                self._range_response_check(r, byte_range)
+
+                # Writing can block (disk, decryption, journal, a full remuxing pipe), so it is done in a worker
+                # thread. Otherwise, it would stall the downloads of all items, which share the event loop.
+                with nullcontext() if writer else path_segment.open("wb") as f:
+                    fn_write: Callable = partial(writer.write, index) if writer else f.write
+
+                    async for data in r.aiter_bytes(chunk_size=block_size):
+                        blocks_advanced += await asyncio.to_thread(
+                            self._segment_data_write, fn_write, data, stats, p_task, block_size
+                        )
+        except Exception as e:
+            await asyncio.to_thread(self._segment_attempt_failed, p_task, index, writer, blocks_advanced, e)
+
+            return False, e, stats
+        finally:
+            if id_scheduler is not None:
+                self.scheduler.release(id_scheduler)
+
+        stats.duration = time.perf_counter() - time_request
+
+        return True, None, stats
+
+    async def _segment_acquire_async(
+        self, index: int, writer: SegmentWriter | None, window_changed: asyncio.Condition
+    ) -> bool:
+        """Wait until the segment with `index` is within the reorder window of `writer` (see `SegmentWriter.acquire`).
+
+        Args:
+            index (int): Segment index.
+            writer (SegmentWriter | None): Ordered writer, if segments are written directly.
+            window_changed (asyncio.Condition): Notified whenever a segment of `writer` is finished.
+
+        Returns:
+            bool: True if the segment can be downloaded, False if aborted.
+        """
+        if not writer:
+            return True
+
+        async with window_changed:
+            while not writer.window_contains(index):
+                if self.event_abort.is_set():
+                    return False
+
+                # Check the abort event regularly, even if no segment is finished meanwhile.
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(window_changed.wait(), WAIT_TIMEOUT_SEC)
+
+        return True
+
+    @staticmethod
+    def _segment_identify(url: str, path_base: pathlib.Path) -> tuple[pathlib.Path, int]:
+        """Compute the path of the segment file and the segment ID of a segment URL.
+
+        Args:
+            url (str): URL of the segment.
+            path_base (pathlib.Path): Base path for segment file.
+
+        Returns:
+            tuple[pathlib.Path, int]: (Path of the segment file, segment ID)
+        """
+        path_segment: pathlib.Path = path_base / url_to_filename(url)
+        # Calculate the segment ID based on the file name within the URL.
+        filename_stem: str = str(path_segment.stem).split("_")[-1]
+        # CAUTION: This is a workaround, so BTS (LOW quality) track will work. They usually have only ONE link.
+        id_segment: int = int(filename_stem) if filename_stem.isdecimal() else 0
+
+        return path_segment, id_segment
+
+    def _segment_data_write(
+        self, fn_write: Callable, data: bytes, stats: SegmentStats, p_task: TaskID, block_size: int | None
+    ) -> int:
+        """Write a received chunk of a segment, measure it and advance the progress.
+
+        Args:
+            fn_write (Callable): Function to write the data with.
+            data (bytes): Received data.
+            stats (SegmentStats): Metrics of the current attempt.
+            p_task (TaskID): Progress bar task ID.
+            block_size (int | None): Block size for streaming. If None, the progress counts segments, not blocks.
+
+        Returns:
+            int: Number of blocks the progress was advanced by.
+        """
+        time_write: float = time.perf_counter()
+
+        fn_write(data)
+
+        stats.time_write += time.perf_counter() - time_write
+        stats.size += len(data)
+        self.scheduler.bytes_add(len(data))
+
+        # Chunks of unknown size are not blocks. The progress is advanced once per segment then.
+        if not block_size:
+            return 0
+
+        # Advance progress bar.
+        self.progress.advance(p_task)
+
+        return 1
+
+    def _segment_attempt_failed(
+        self,
+        p_task: TaskID,
+        index: int,
+        writer: SegmentWriter | None,
+        blocks_advanced: int,
+        error: Exception,
+    ) -> None:
+        """Roll back a failed download attempt and report congestion to the connection scheduler.
+
+        Args:
+            p_task (TaskID): Progress bar task ID.
+            index (int): Segment index.
+            writer (SegmentWriter | None): Ordered writer, if segments are written directly.
+            blocks_advanced (int): Number of blocks the progress was advanced by in this attempt.
+            error (Exception): Error, which made the attempt fail.
+        """
+        if error_is_congestion(error):
+            self.scheduler.congestion()
+
+        if writer:
+            # Drop partially written data, so following segments are not shifted.
+            writer.discard(index)
+
+        # The data of this attempt is thrown away, so is its progress.
+        if blocks_advanced:
+            self.progress.advance(p_task, -blocks_advanced)
+
+    def _segment_retry_delay(self, error: Exception | None, attempts: int, optional: bool) -> float | None:
+        """Decide if a failed segment is retried and compute the delay (capped exponential backoff, full jitter).
+
+        Args:
+            error (Exception | None): Error of the last attempt. None if it was aborted.
+            attempts (int): Number of attempts so far.
+            optional (bool): Whether the segment may fail without corrupting the file.
+
+        Returns:
+            float | None: Seconds to wait before the next attempt, or None if the segment is not retried.
+        """
+        if optional or attempts >= SEGMENT_ATTEMPTS_MAX or self.event_abort.is_set() or not error_is_transient(error):
+            return None
+
+        delay_max: float = min(SEGMENT_RETRY_DELAY_MAX_SEC, SEGMENT_RETRY_DELAY_SEC * 2 ** (attempts - 1))
+
+        return random.SystemRandom().uniform(0, delay_max)
+
+    def _segment_finish(
+        self,
+        p_task: TaskID,
+        block_size: int | None,
+        progress_to_stdout: bool,
+        index: int,
+        writer: SegmentWriter | None,
+        byte_range: tuple[int, int] | None,
+        result: bool,
+        stats: SegmentStats,
+    ) -> None:
+        """Finish a segment in the writer, the progress and the metrics, after its last attempt.
+
+        Args:
+            p_task (TaskID): Progress bar task ID.
+            block_size (int | None): Block size for streaming.
+            progress_to_stdout (bool): Whether to show progress in stdout.
+            index (int): Segment index.
+            writer (SegmentWriter | None): Ordered writer, if segments are written directly.
+            byte_range (tuple[int, int] | None): Byte range of the segment, if any.
+            result (bool): Whether the segment was downloaded successfully.
+            stats (SegmentStats): Metrics of the last attempt.
+        """
+        if result:
+            self.stats.segment_add(p_task, stats)
+
+            # Segments of unknown size count as one step.
+            if not block_size:
+                self.progress.advance(p_task)
+        elif byte_range and block_size:
+            # Account for the blocks of this range, which will not arrive, so the progress can finish.
+            self.progress.advance(p_task, math.ceil((byte_range[1] - byte_range[0] + 1) / block_size))
+        else:
+            self.progress.advance(p_task)
+
+        if writer:
+            # Failed segments are finished as well (empty), otherwise the following segments would wait forever.
+            writer.finish(index, success=result)
+
+        throughput: float = self.stats.throughput_track(p_task)
+
+        self.progress.update(p_task, throughput=throughput)
+
+        # To send the progress to the GUI, we need to emit the percentage.
+        if not progress_to_stdout:
+            self.progress_gui.item.emit(self.progress.tasks[p_task].percentage)
+
+            if self.progress_gui.item_throughput:
+                self.progress_gui.item_throughput.emit(throughput)
+
+    @staticmethod
+    def _range_response_check(response: requests.Response | httpx.Response, byte_range: tuple[int, int] | None) -> None:
+        """Raise if a byte range was requested, but the server ignored the `Range` header (whole file response).
+
+        Args:
+            response (requests.Response | httpx.Response): Response of the segment request.
+            byte_range (tuple[int, int] | None): Requested byte range, if any.
+
+        Raises:
+            RangeNotSupported: If the response is not a partial content response.
+        """
+        if byte_range and response.status_code != 206:
+            raise RangeNotSupported
+
+    def extension_guess(
+        self, quality_audio: Quality, metadata_tags: list[str], is_video: bool
+    ) -> AudioExtensions | VideoExtensions:
+        """Guess the file extension for a media item based on quality and type.
+
+        Args:
+            quality_audio (Quality): Audio quality.
+            metadata_tags (list[str]): Metadata tags for the media.
+            is_video (bool): Whether the media is a video.
+
+        Returns:
+            AudioExtensions | VideoExtensions: Guessed file extension.
+        """
+        result: AudioExtensions | VideoExtensions
+
+        if is_video:
+            result = AudioExtensions.MP4 if self.settings.data.video_convert_mp4 else VideoExtensions.TS
+        else:
+            result = (
+                AudioExtensions.FLAC
+                if (
+                    self.settings.data.extract_flac
+                    and quality_audio in (Quality.hi_res_lossless, Quality.high_lossless)
+                )
+                or ("HIRES_LOSSLESS" not in metadata_tags and quality_audio not in (Quality.low_96k, Quality.low_320k))
+                or quality_audio == Quality.high_lossless
+                else AudioExtensions.M4A
+            )
+
+        return result
+
+    def item(
+        self,
+        file_template: str,
+        media_id: str | None = None,
+        media_type: MediaType | None = None,
+        media: Track | Video | None = None,
+        video_download: bool = True,
+        download_delay: bool = False,
+        quality_audio: Quality | None = None,
+        quality_video: QualityVideo | None = None,
+        is_parent_album: bool = False,
+        list_position: int = 0,
+        list_total: int = 0,
+        futures_postprocess: list[futures.Future] | None = None,
+        look_ahead: LookAhead | None = None,
+        albums: AlbumCache | None = None,
+        requeue_throttled: bool = False,
+    ) -> tuple[bool, pathlib.Path | str]:
+        """Download a single media item, handling file naming, skipping, and post-processing.
+
+        Args:
+            file_template (str): Template for file naming.
+            media_id (str | None, optional): Media ID. Defaults to None.
+            media_type (MediaType | None, optional): Media type. Defaults to None.
+            media (Track | Video | None, optional): Media item. Defaults to None.
+            video_download (bool, optional): Whether to allow video downloads. Defaults to True.
+            download_delay (bool, optional): Whether to pace the start of the download by the rate limiter (see
+                `download_delay_sec_min` / `download_delay_sec_max`). Defaults to False.
+            quality_audio (Quality | None, optional): Audio quality. Defaults to None.
+            quality_video (QualityVideo | None, optional): Video quality. Defaults to None.
+            is_parent_album (bool, optional): Whether this is a parent album. Defaults to False.
+            list_position (int, optional): Position in list. Defaults to 0.
+            list_total (int, optional): Total items in list. Defaults to 0.
+            futures_postprocess (list[futures.Future] | None, optional): If given, the downloaded item is handed over
+                to the post-processing pool and the future of this job is appended to the list. So the calling
+                thread can continue with the next download, while this one is post-processed. Otherwise, the item
+                is post-processed right away. Defaults to None.
+            look_ahead (LookAhead | None, optional): Streams of the list items resolved ahead. Taking the stream of
+                this item (at `list_position`) requests the streams of the next items. Defaults to None.
+            albums (AlbumCache | None, optional): Full albums of the list. If given, the track is completed from it
+                instead of being requested once more with its album. Defaults to None.
+            requeue_throttled (bool, optional): If the TIDAL API throttles the requests of this item, raise
+                `TooManyRequests`, so the caller can requeue the item. Otherwise, the requests are retried after the
+                backoff. Defaults to False.
+
+        Returns:
+            tuple[bool, pathlib.Path | str]: (Downloaded, path to file)
+
+        Raises:
+            TooManyRequests: If `requeue_throttled` is set and the requests of this item were throttled.
+        """
+        # Step 1: Validate and prepare media
+        validated_media = self._validate_and_prepare_media(
+            media, media_id, media_type, video_download, albums, requeue_throttled
         )
+        if validated_media is None or not isinstance(validated_media, Track | Video):
+            return False, ""
+
+        media = validated_media
+
+        # Step 2: Create file paths and determine skip logic
+        path_media_dst, file_extension_dummy, skip_file, skip_download = self._prepare_file_paths_and_skip_logic(
+            media, file_template, quality_audio, list_position, list_total
+        )
+
+        if skip_file:
+            self.fn_logger.debug(f"Download skipped, since file exists: '{path_media_dst}'")
+
+            return True, path_media_dst
+
+        # Step 3: Wait for the rate limiter. Existing files are skipped right away.
+        if download_delay and not self.rate_limiter.acquire(self.event_abort):
+            return False, path_media_dst
+
+        # Step 4: Handle quality settings
+        quality_audio_old, quality_video_old = self._adjust_quality_settings(quality_audio, quality_video)
+
+        # Step 5: Download and process media
+        stream_prefetched: tuple[Quality, Stream, StreamManifest] | None = (
+            look_ahead.take(list_position - 1) if look_ahead else None
+        )
+        try:
+            download_success = self._download_and_process_media(
+                media,
+                path_media_dst,
+                skip_download,
+                is_parent_album,
+                file_extension_dummy,
+                futures_postprocess,
+                stream_prefetched,
+                requeue_throttled,
+            )
+        finally:
+            # Step 6: Post-processing. Quality settings are reset, even if the item is requeued.
+            self._perform_post_processing(
+                media,
+                path_media_dst,
+                quality_audio,
+                quality_video,
+                quality_audio_old,
+                quality_video_old,
+                skip_download,
+            )
 
         return download_success, path_media_dst
 
@@ -574,6 +1497,8 @@ class Download:
         media_id: str | None,
         media_type: MediaType | None,
         video_download: bool = True,
+        albums: AlbumCache | None = None,
+        requeue_throttled: bool = False,
     ) -> Track | Video | Album | Playlist | UserPlaylist | Mix | None:
         """Validate and prepare media instance for download.
 
@@ -582,34 +1507,35 @@ class Download:
             media_id (str | None): Media ID if creating new instance.
             media_type (MediaType | None): Media type if creating new instance.
             video_download (bool, optional): Whether video downloads are allowed. Defaults to True.
+            albums (AlbumCache | None, optional): Full albums of the list, the track belongs to. Defaults to None.
+            requeue_throttled (bool, optional): Raise `TooManyRequests`, if requests were throttled. Defaults to False.
 
         Returns:
             Track | Video | Album | Playlist | UserPlaylist | Mix | None: Prepared media instance or None if invalid.
+
+        Raises:
+            TooManyRequests: If `requeue_throttled` is set and requests were throttled.
         """
         try:
             if media_id and media_type:
                 # If no media instance is provided, we need to create the media instance.
                 # Throws `tidalapi.exceptions.ObjectNotFound` if item is not available anymore.
-                media = instantiate_media(self.session, media_type, media_id)
-            elif isinstance(media, Track | Video):
-                # Check if media is available not deactivated / removed from TIDAL.
-                if not media.available:
-                    self.fn_logger.info(
-                        f"This item is not available for listening anymore on TIDAL. Skipping: {name_builder_item(media)}"
-                    )
-                    return None
-                elif isinstance(media, Track):
-                    # Re-create media instance with full album information
-                    media = self.session.track(str(media.id), with_album=True)
-            elif isinstance(media, Album):
-                # Check if media is available not deactivated / removed from TIDAL.
-                if not media.available:
-                    self.fn_logger.info(
-                        f"This item is not available for listening anymore on TIDAL. Skipping: {name_builder_title(media)}"
-                    )
-                    return None
+                media = self._api_request(
+                    partial(instantiate_media, self.session, media_type, media_id), requeue_throttled
+                )
             elif not media:
                 raise MediaMissing
+            elif isinstance(media, Track | Video | Album) and not self._media_available(media):
+                return None
+            elif isinstance(media, Track):
+                media = self._api_request(partial(self._track_full, media, albums), requeue_throttled)
+        except TooManyRequests:
+            if requeue_throttled:
+                raise
+
+            self.fn_logger.exception(f"Too many requests against TIDAL backend. Skipping '{media_id or media.id}'.")
+
+            return None
         except:
             return None
 
@@ -622,6 +1548,39 @@ class Download:
 
         return media
 
+    def _media_available(self, media: Track | Video | Album) -> bool:
+        """Check if media is available, i.e. not deactivated / removed from TIDAL. Unavailable media is logged.
+
+        Args:
+            media (Track | Video | Album): Media item.
+
+        Returns:
+            bool: Whether the media is available.
+        """
+        if not media.available:
+            name: str = name_builder_title(media) if isinstance(media, Album) else name_builder_item(media)
+
+            self.fn_logger.info(f"This item is not available for listening anymore on TIDAL. Skipping: {name}")
+
+        return bool(media.available)
+
+    def _track_full(self, track: Track, albums: AlbumCache | None = None) -> Track:
+        """Get a track with full album information.
+
+        Args:
+            track (Track): Track object.
+            albums (AlbumCache | None, optional): Full albums of the list, the track belongs to. Defaults to None.
+
+        Returns:
+            Track: Track with full album information.
+        """
+        # Tracks of lists are complete, only their album data might be missing.
+        if albums:
+            return albums.track_complete(track)
+
+        # Re-create media instance with full album information
+        return self.session.track(str(track.id), with_album=True)
+
     def _prepare_file_paths_and_skip_logic(
         self,
         media: Track | Video,
@@ -682,86 +1641,406 @@ class Download:
                 )
                 skip_download = file_exists_playlist_dir or file_exists_track_dir
 
-                # If file exists in playlist dir but not in track dir, we don't skip the file itself
-                if skip_file and file_exists_playlist_dir:
-                    skip_file = False
-        else:
-            skip_file: bool = False
+                # If file exists in playlist dir but not in track dir, we don't skip the file itself
+                if skip_file and file_exists_playlist_dir:
+                    skip_file = False
+        else:
+            skip_file: bool = False
+
+        return path_media_dst, file_extension_dummy, skip_file, skip_download
+
+    def _adjust_quality_settings(
+        self, quality_audio: Quality | None, quality_video: QualityVideo | None
+    ) -> tuple[Quality | None, QualityVideo | None]:
+        """Adjust quality settings and return previous values.
+
+        Args:
+            quality_audio (Quality | None): Audio quality setting.
+            quality_video (QualityVideo | None): Video quality setting.
+
+        Returns:
+            tuple[Quality | None, QualityVideo | None]: Previous quality settings.
+        """
+        quality_audio_old: Quality | None = None
+        quality_video_old: QualityVideo | None = None
+
+        if quality_audio:
+            quality_audio_old = self.adjust_quality_audio(quality_audio)
+
+        if quality_video:
+            quality_video_old = self.adjust_quality_video(quality_video)
+
+        return quality_audio_old, quality_video_old
+
+    def _download_and_process_media(
+        self,
+        media: Track | Video,
+        path_media_dst: pathlib.Path,
+        skip_download: bool,
+        is_parent_album: bool,
+        file_extension_dummy: str,
+        futures_postprocess: list[futures.Future] | None = None,
+        stream_prefetched: tuple[Quality, Stream, StreamManifest] | None = None,
+        requeue_throttled: bool = False,
+    ) -> bool:
+        """Download and process media file.
+
+        Args:
+            media (Track | Video): Media item.
+            path_media_dst (pathlib.Path): Destination file path.
+            skip_download (bool): Whether to skip download.
+            is_parent_album (bool): Whether this is a parent album.
+            file_extension_dummy (str): Dummy file extension.
+            futures_postprocess (list[futures.Future] | None, optional): Collects the future of the post-processing
+                job, if it is pipelined. Defaults to None.
+            stream_prefetched (tuple[Quality, Stream, StreamManifest] | None, optional): Stream resolved ahead (see
+                `_stream_fetch`). Defaults to None.
+            requeue_throttled (bool, optional): Raise `TooManyRequests`, if the stream request was throttled.
+                Defaults to False.
+
+        Returns:
+            bool: Whether download was successful.
+        """
+        if skip_download:
+            return True
+
+        # Identical tracks (e.g. of several lists) are downloaded once. Further requests wait and link the result.
+        key_flight: tuple[int, Quality] | None = (
+            (media.id, self.session.audio_quality) if isinstance(media, Track) else None
+        )
+
+        if key_flight is not None:
+            result_joined: bool | None = self._inflight_join(media, key_flight, path_media_dst, futures_postprocess)
+
+            if result_joined is not None:
+                return result_joined
+
+        futures_item: list[futures.Future] | None = None if futures_postprocess is None else []
+        result: bool = False
+
+        try:
+            result, path_media_dst = self._download_media(
+                media, path_media_dst, is_parent_album, futures_item, stream_prefetched, requeue_throttled
+            )
+        finally:
+            if key_flight is not None:
+                self._inflight_finish(key_flight, path_media_dst if result else None, futures_item)
+
+        if futures_item:
+            futures_postprocess.extend(futures_item)
+
+        return result
+
+    def _download_media(
+        self,
+        media: Track | Video,
+        path_media_dst: pathlib.Path,
+        is_parent_album: bool,
+        futures_postprocess: list[futures.Future] | None = None,
+        stream_prefetched: tuple[Quality, Stream, StreamManifest] | None = None,
+        requeue_throttled: bool = False,
+    ) -> tuple[bool, pathlib.Path]:
+        """Resolve the stream of a media item, download it and hand it over to post-processing.
+
+        Args:
+            media (Track | Video): Media item.
+            path_media_dst (pathlib.Path): Destination file path.
+            is_parent_album (bool): Whether this is a parent album.
+            futures_postprocess (list[futures.Future] | None, optional): Collects the future of the post-processing
+                job, if it is pipelined. Defaults to None.
+            stream_prefetched (tuple[Quality, Stream, StreamManifest] | None, optional): Stream resolved ahead (see
+                `_stream_fetch`). Defaults to None.
+            requeue_throttled (bool, optional): Raise `TooManyRequests`, if the stream request was throttled.
+                Defaults to False.
+
+        Returns:
+            tuple[bool, pathlib.Path]: (Whether download was successful, destination file path with final extension)
+        """
+        # Get stream information and final file extension
+        stream_manifest, file_extension, do_flac_extract, media_stream = self._get_stream_info(
+            media, stream_prefetched, requeue_throttled
+        )
+
+        if stream_manifest is None and isinstance(media, Track):
+            return False, path_media_dst
+
+        # Update path if extension changed
+        if path_media_dst.suffix != file_extension:
+            path_media_dst = path_media_dst.with_suffix(file_extension)
+            path_media_dst = pathlib.Path(path_file_sanitize(path_media_dst, adapt=True))
+
+        os.makedirs(path_media_dst.parent, exist_ok=True)
+
+        # Perform actual download
+        result: bool = self._perform_actual_download(
+            media, path_media_dst, stream_manifest, do_flac_extract, is_parent_album, media_stream, futures_postprocess
+        )
+
+        return result, path_media_dst
+
+    def _inflight_join(
+        self,
+        media: Track,
+        key_flight: tuple[int, Quality],
+        path_media_dst: pathlib.Path,
+        futures_postprocess: list[futures.Future] | None = None,
+    ) -> bool | None:
+        """Register the download of a track or, if it is being downloaded already, link its result once it is done.
+
+        Args:
+            media (Track): Media item.
+            key_flight (tuple[int, Quality]): Track ID and quality.
+            path_media_dst (pathlib.Path): Destination file path of this request.
+            futures_postprocess (list[futures.Future] | None, optional): If given, the caller does not wait for the
+                other download. The result is linked, when it is done, and the future of this job is appended here
+                like a post-processing job. If the other download fails, the job fails and the item is left to a
+                retry. Otherwise, the caller waits and downloads the track on its own, if the other download fails.
+                Defaults to None.
+
+        Returns:
+            bool | None: None if the caller owns the download now and must call `_inflight_finish` afterward.
+                Otherwise, whether the result of the other download was (or is going to be) linked to the
+                destination.
+        """
+        while True:
+            is_owner, flight = self.inflight.claim(key_flight)
+
+            if is_owner:
+                return None
+
+            # Do not park a worker until the other download is done.
+            if futures_postprocess is not None:
+                future_link: futures.Future = futures.Future()
+
+                flight.add_done_callback(partial(self._inflight_linked, media, path_media_dst, future_link))
+                futures_postprocess.append(future_link)
+
+                return True
+
+            self.fn_logger.debug(f"Waiting for the running download of '{name_builder_item(media)}'.")
+
+            while not futures.wait([flight], timeout=WAIT_TIMEOUT_SEC).done:
+                if self.event_abort.is_set():
+                    return False
+
+            path_file_flight: pathlib.Path | None = flight.result()
+
+            if path_file_flight is not None:
+                return self._inflight_link(media, path_file_flight, path_media_dst)
+
+            # The other download has failed. Try on our own.
+
+    def _inflight_linked(
+        self, media: Track, path_media_dst: pathlib.Path, future_link: futures.Future, flight: futures.Future
+    ) -> None:
+        """Link the result of another download, once it is done, and resolve the future of this job.
+
+        Args:
+            media (Track): Media item.
+            path_media_dst (pathlib.Path): Destination file path of this request.
+            future_link (futures.Future): Future of this job. Resolves to whether the track is at the destination.
+            flight (futures.Future): Future of the other download.
+        """
+        path_file_flight: pathlib.Path | None = flight.result()
+
+        if path_file_flight is None:
+            self.fn_logger.error(
+                f"Running download of '{name_builder_item(media)}' has failed, nothing to link. It is retried later."
+            )
+            future_link.set_result(False)
+
+            return
+
+        try:
+            future_link.set_result(self._inflight_link(media, path_file_flight, path_media_dst))
+        except Exception as e:
+            future_link.set_exception(e)
+
+    def _inflight_finish(
+        self,
+        key_flight: tuple[int, Quality],
+        path_file: pathlib.Path | None,
+        futures_postprocess: list[futures.Future] | None,
+    ) -> None:
+        """Hand the result of a download to the requests, which wait for it, once the file is at its destination.
+
+        Args:
+            key_flight (tuple[int, Quality]): Track ID and quality.
+            path_file (pathlib.Path | None): Destination file or None, if the download has failed.
+            futures_postprocess (list[futures.Future] | None): Future of the post-processing job, if it is pipelined.
+        """
+        if path_file is not None and futures_postprocess:
+            futures_postprocess[0].add_done_callback(partial(self._inflight_postprocessed, key_flight, path_file))
+        else:
+            self.inflight.finish(key_flight, path_file)
+
+    def _inflight_postprocessed(
+        self, key_flight: tuple[int, Quality], path_file: pathlib.Path, future: futures.Future
+    ) -> None:
+        """Hand the result of a pipelined download to the waiting requests, once it has been post-processed.
+
+        Args:
+            key_flight (tuple[int, Quality]): Track ID and quality.
+            path_file (pathlib.Path): Destination file.
+            future (futures.Future): Future of the post-processing job.
+        """
+        done: bool = not future.cancelled() and future.exception() is None and bool(future.result())
+
+        self.inflight.finish(key_flight, path_file if done else None)
+
+    def _inflight_link(self, media: Track, path_file_src: pathlib.Path, path_media_dst: pathlib.Path) -> bool:
+        """Link or copy a track, which was downloaded by another request, and its sidecar files to this destination.
+
+        Args:
+            media (Track): Media item.
+            path_file_src (pathlib.Path): Destination file of the other download.
+            path_media_dst (pathlib.Path): Destination file path of this request.
+
+        Returns:
+            bool: Whether the track is at the destination.
+        """
+        # Same track and quality, so the final extension is the same.
+        if path_media_dst.suffix != path_file_src.suffix:
+            path_media_dst = pathlib.Path(
+                path_file_sanitize(path_media_dst.with_suffix(path_file_src.suffix), adapt=True)
+            )
+
+        if path_media_dst == path_file_src:
+            return True
+
+        # The lyrics file belongs to the track, the cover file to its directory.
+        paths_file: list[tuple[pathlib.Path, pathlib.Path]] = [
+            (path_file_src, path_media_dst),
+            (path_file_src.with_suffix(EXTENSION_LYRICS), path_media_dst.with_suffix(EXTENSION_LYRICS)),
+            (path_file_src.parent / COVER_NAME, path_media_dst.parent / COVER_NAME),
+        ]
+
+        try:
+            os.makedirs(path_media_dst.parent, exist_ok=True)
+
+            for path_src, path_dst in paths_file:
+                if path_src.exists() and (path_dst == path_media_dst or not path_dst.exists()):
+                    file_link(path_src, path_dst)
+        except OSError:
+            self.fn_logger.exception(f"Could not link '{path_file_src}' to '{path_media_dst}'.")
+
+            return False
+
+        self.fn_logger.info(
+            f"Linked item '{name_builder_item(media)}' from the download of the same track: '{path_file_src}'."
+        )
 
-        return path_media_dst, file_extension_dummy, skip_file, skip_download
+        return True
 
-    def _adjust_quality_settings(
-        self, quality_audio: Quality | None, quality_video: QualityVideo | None
-    ) -> tuple[Quality | None, QualityVideo | None]:
-        """Adjust quality settings and return previous values.
+    def _stream_fetch(
+        self,
+        position: int,
+        media: Track | Video,
+        file_template: str,
+        quality_audio: Quality | None,
+        list_total: int,
+        paced: bool,
+    ) -> tuple[Quality, Stream, StreamManifest] | None:
+        """Resolve the stream of a list item ahead of its download.
+
+        Items, whose file exists already, are not resolved. If paced, the requests take a token of the rate limiter,
+        like the start of a download. Since the prefetch pool must not be blocked, the stream is only resolved ahead
+        if a token is available right away.
 
         Args:
+            position (int): Index of the item in its list.
+            media (Track | Video): Media item.
+            file_template (str): Template for file naming of the list.
             quality_audio (Quality | None): Audio quality setting.
-            quality_video (QualityVideo | None): Video quality setting.
+            list_total (int): Total items in the list.
+            paced (bool): Whether the start of downloads is paced by the rate limiter.
 
         Returns:
-            tuple[Quality | None, QualityVideo | None]: Previous quality settings.
+            tuple[Quality, Stream, StreamManifest] | None: (Requested quality, stream, manifest), None if not
+                resolved (e.g. videos, existing files).
         """
-        quality_audio_old: Quality | None = None
-        quality_video_old: QualityVideo | None = None
+        if not isinstance(media, Track):
+            return None
 
-        if quality_audio:
-            quality_audio_old = self.adjust_quality_audio(quality_audio)
+        _, _, skip_file, _ = self._prepare_file_paths_and_skip_logic(
+            media, file_template, quality_audio, position + 1, list_total
+        )
 
-        if quality_video:
-            quality_video_old = self.adjust_quality_video(quality_video)
+        if skip_file or (paced and self.rate_limiter.try_acquire()):
+            return None
 
-        return quality_audio_old, quality_video_old
+        # The quality of the session might be changed, until the stream is used. Keep the one it was requested for.
+        quality: Quality = self.session.audio_quality
+        # Throttled requests are not retried: The worker of the item requests the stream on its own.
+        media_stream: Stream = self._api_request(media.get_stream, requeue=True)
 
-    def _download_and_process_media(
-        self,
-        media: Track | Video,
-        path_media_dst: pathlib.Path,
-        skip_download: bool,
-        is_parent_album: bool,
-        file_extension_dummy: str,
-    ) -> bool:
-        """Download and process media file.
+        return quality, media_stream, media_stream.get_stream_manifest()
+
+    def _api_request(self, fn_request: Callable[[], Any], requeue: bool = False) -> Any:
+        """Make a TIDAL API request, which backs off process-wide, if the API throttles requests.
+
+        The request waits until a pause caused by throttling is over. If it is throttled itself, all API requests are
+        paused (see `ThrottleController`) and the request is retried after the pause.
 
         Args:
-            media (Track | Video): Media item.
-            path_media_dst (pathlib.Path): Destination file path.
-            skip_download (bool): Whether to skip download.
-            is_parent_album (bool): Whether this is a parent album.
-            file_extension_dummy (str): Dummy file extension.
+            fn_request (Callable[[], Any]): Makes the request.
+            requeue (bool, optional): Do not retry a throttled request, but raise right away, so the caller can
+                requeue its item. Defaults to False.
 
         Returns:
-            bool: Whether download was successful.
+            Any: Result of the request.
+
+        Raises:
+            TooManyRequests: If the request was throttled and is not retried (anymore).
+            DownloadAborted: If aborted while requests are paused. The request is not made then.
         """
-        if skip_download:
-            return True
+        attempts: int = 0
 
-        # Get stream information and final file extension
-        stream_manifest, file_extension, do_flac_extract, media_stream = self._get_stream_info(media)
+        while True:
+            attempts += 1
 
-        if stream_manifest is None and isinstance(media, Track):
-            return False
+            if not self.throttle.wait(self.event_abort):
+                raise DownloadAborted
 
-        # Update path if extension changed
-        if path_media_dst.suffix != file_extension:
-            path_media_dst = path_media_dst.with_suffix(file_extension)
-            path_media_dst = pathlib.Path(path_file_sanitize(path_media_dst, adapt=True))
+            try:
+                result: Any = fn_request()
+            except TooManyRequests as e:
+                time_pause: float = self.throttle.throttled(e.retry_after)
 
-        os.makedirs(path_media_dst.parent, exist_ok=True)
+                # Throttling is congestion as well, so fewer segments are requested at once.
+                self.scheduler.congestion()
+                self.fn_logger.debug(f"TIDAL API throttles requests. Pausing requests for {time_pause:.1f}s.")
 
-        # Perform actual download
-        return self._perform_actual_download(
-            media, path_media_dst, stream_manifest, do_flac_extract, is_parent_album, media_stream
-        )
+                if requeue or attempts >= THROTTLE_ATTEMPTS_MAX or (self.event_abort and self.event_abort.is_set()):
+                    raise
+
+                continue
+
+            self.throttle.success()
+
+            return result
 
-    def _get_stream_info(self, media: Track | Video) -> tuple[StreamManifest | None, str, bool, Stream | None]:
+    def _get_stream_info(
+        self,
+        media: Track | Video,
+        stream_prefetched: tuple[Quality, Stream, StreamManifest] | None = None,
+        requeue_throttled: bool = False,
+    ) -> tuple[StreamManifest | None, str, bool, Stream | None]:
         """Get stream information for media.
 
         Args:
             media (Track | Video): Media item.
+            stream_prefetched (tuple[Quality, Stream, StreamManifest] | None, optional): Stream resolved ahead (see
+                `_stream_fetch`). It is used, if it was requested in the current quality. Defaults to None.
+            requeue_throttled (bool, optional): Raise `TooManyRequests`, if the stream request was throttled.
+                Otherwise, it is retried after the backoff and the item is skipped, if it is still throttled.
+                Defaults to False.
 
         Returns:
             tuple[StreamManifest | None, str, bool, Stream | None]: Stream info.
+
+        Raises:
+            TooManyRequests: If `requeue_throttled` is set and the stream request was throttled.
         """
         stream_manifest: StreamManifest | None = None
         media_stream: Stream | None = None
@@ -769,14 +2048,22 @@ class Download:
 
         if isinstance(media, Track):
             try:
-                media_stream = media.get_stream()
-                stream_manifest = media_stream.get_stream_manifest()
+                if stream_prefetched and stream_prefetched[0] == self.session.audio_quality:
+                    _, media_stream, stream_manifest = stream_prefetched
+                else:
+                    media_stream = self._api_request(media.get_stream, requeue_throttled)
+                    stream_manifest = media_stream.get_stream_manifest()
             except TooManyRequests:
+                if requeue_throttled:
+                    raise
+
                 self.fn_logger.exception(
                     f"Too many requests against TIDAL backend. Skipping '{name_builder_item(media)}'. "
                     f"Consider to activate delay between downloads."
                 )
 
+                return None, "", False, None
+            except DownloadAborted:
                 return None, "", False, None
             except Exception:
                 self.fn_logger.exception(f"Something went wrong. Skipping '{name_builder_item(media)}'.")
@@ -803,8 +2090,9 @@ class Download:
         do_flac_extract: bool,
         is_parent_album: bool,
         media_stream: Stream | None,
+        futures_postprocess: list[futures.Future] | None = None,
     ) -> bool:
-        """Perform the actual download and processing.
+        """Perform the actual download and hand it over to post-processing.
 
         Args:
             media (Track | Video): Media item.
@@ -813,40 +2101,290 @@ class Download:
             do_flac_extract (bool): Whether to extract FLAC.
             is_parent_album (bool): Whether this is a parent album.
             media_stream (Stream | None): Media stream.
+            futures_postprocess (list[futures.Future] | None, optional): If given, post-processing is queued in the
+                post-processing pool and its future is appended here. Otherwise, it is done right away. Defaults to
+                None.
 
         Returns:
-            bool: Whether download was successful.
+            bool: Whether download was successful (and post-processing was successful or has been queued).
         """
-        # Create a temp directory and file.
-        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp_path_dir:
-            tmp_path_file: pathlib.Path = pathlib.Path(tmp_path_dir) / str(uuid4())
+        # Small items are staged in RAM, if the memory budget allows it.
+        size_memory: int = self.staging_memory.reserve(
+            self._size_estimate(media, stream_manifest, media_stream),
+            copies=1 + int(do_flac_extract) + int(not self.settings.data.segments_write_direct),
+        )
+        # Items, which are piped into FFmpeg while downloading, cannot be resumed (see `_download`).
+        resume: bool = (
+            not size_memory
+            and self.settings.data.download_resume
+            and self.settings.data.segments_write_direct
+            and not self._remux_enabled(media)
+        )
+        path_dir_staging: pathlib.Path = self._staging_create(media, media_stream, resume, size_memory)
+        # Lyrics and covers are not needed before tagging, so fetch them while downloading.
+        extras: TrackExtras | None = self._extras_prefetch(media, is_parent_album)
+        # Once handed over, post-processing takes care of the staging directory.
+        handed_over: bool = False
+
+        try:
+            tmp_path_file: pathlib.Path = path_dir_staging / ("media" + EXTENSION_PART if resume else str(uuid4()))
             tmp_path_file.touch()
+            journal: DownloadJournal | None = DownloadJournal(path_dir_staging / JOURNAL_NAME) if resume else None
 
             # Download media.
             result_download, tmp_path_file = self._download(
-                media=media, stream_manifest=stream_manifest, path_file=tmp_path_file
+                media=media, stream_manifest=stream_manifest, path_file=tmp_path_file, journal=journal
             )
 
             if not result_download:
                 return False
 
-            # Convert video from TS to MP4
-            if isinstance(media, Video) and self.settings.data.video_convert_mp4:
+            fn_postprocess: Callable[[], bool] = partial(
+                self._postprocess_item,
+                media,
+                tmp_path_file,
+                path_media_dst,
+                do_flac_extract,
+                is_parent_album,
+                media_stream,
+                path_dir_staging,
+                resume,
+                size_memory,
+                extras,
+            )
+
+            if futures_postprocess is None:
+                handed_over = True
+
+                return fn_postprocess()
+
+            # Let the pool post-process the item, while this thread continues with the next download.
+            future: futures.Future | None = self.postprocess_pool.submit(fn_postprocess, self.event_abort)
+
+            if future is None:
+                return False
+
+            handed_over = True
+
+            futures_postprocess.append(future)
+
+            return True
+        finally:
+            if not handed_over:
+                self._staging_remove(path_dir_staging, resume, size_memory)
+
+                # Nobody is going to tag this item. Drop requests, which have not started yet.
+                if extras:
+                    extras.lyrics.cancel()
+                    extras.covers.cancel()
+
+    def _postprocess_item(
+        self,
+        media: Track | Video,
+        tmp_path_file: pathlib.Path,
+        path_media_dst: pathlib.Path,
+        do_flac_extract: bool,
+        is_parent_album: bool,
+        media_stream: Stream | None,
+        path_dir_staging: pathlib.Path,
+        resume: bool,
+        size_memory: int = 0,
+        extras: TrackExtras | None = None,
+    ) -> bool:
+        """Convert / extract, tag and move a downloaded item to its destination, then remove its staging directory.
+
+        Args:
+            media (Track | Video): Media item.
+            tmp_path_file (pathlib.Path): Downloaded file in the staging directory.
+            path_media_dst (pathlib.Path): Destination file path.
+            do_flac_extract (bool): Whether to extract FLAC.
+            is_parent_album (bool): Whether this is a parent album.
+            media_stream (Stream | None): Media stream.
+            path_dir_staging (pathlib.Path): Staging directory of the item.
+            resume (bool): Whether the staging directory is persistent. If so, it is kept on failure, so the
+                download can be resumed.
+            size_memory (int, optional): Bytes reserved in the memory tier, if staged in RAM. Defaults to 0.
+            extras (TrackExtras | None, optional): Lyrics and covers, which are being fetched in the background.
+                Defaults to None.
+
+        Returns:
+            bool: Whether the item was completed successfully.
+        """
+        result: bool = False
+        # Room reserved for the tags, when the file was created.
+        padding: int = 0
+
+        try:
+            # Convert video from TS to MP4, unless it was converted while downloading already.
+            if (
+                isinstance(media, Video)
+                and self.settings.data.video_convert_mp4
+                and tmp_path_file.suffix != AudioExtensions.MP4
+            ):
                 tmp_path_file = self._video_convert(tmp_path_file)
 
-            # Extract FLAC from MP4 container using ffmpeg
+            # Extract FLAC from MP4 container.
             if isinstance(media, Track) and self.settings.data.extract_flac and do_flac_extract:
-                tmp_path_file = self._extract_flac(tmp_path_file)
+                tmp_path_file, padding = self._extract_flac(tmp_path_file, self._padding_tags(media))
+
+                if not tmp_path_file:
+                    return False
 
             # Handle metadata, lyrics, and cover
-            self._handle_metadata_and_extras(media, tmp_path_file, path_media_dst, is_parent_album, media_stream)
+            self._handle_metadata_and_extras(
+                media, tmp_path_file, path_media_dst, is_parent_album, media_stream, extras, padding
+            )
 
             self.fn_logger.info(f"Downloaded item '{name_builder_item(media)}'.")
 
             # Move final file to the configured destination directory.
-            shutil.move(tmp_path_file, path_media_dst)
+            self._file_move(tmp_path_file, path_media_dst)
 
-            return True
+            # If files needs to be symlinked, do it once the file has reached its destination.
+            if self.settings.data.symlink_to_track and isinstance(media, Track):
+                self.media_move_and_symlink(media, path_media_dst, path_media_dst.suffix)
+
+            result = True
+        finally:
+            # Keep a failed resumable item. Otherwise, it is complete or the staging directory is temporary anyway.
+            self._staging_remove(path_dir_staging, resume and not result, size_memory)
+
+        return result
+
+    def _staging_create(
+        self, media: Track | Video, media_stream: Stream | None, resume: bool, size_memory: int
+    ) -> pathlib.Path:
+        """Create the staging directory of an item.
+
+        Args:
+            media (Track | Video): Media item.
+            media_stream (Stream | None): Media stream (tracks only).
+            resume (bool): Whether the item can be resumed.
+            size_memory (int): Bytes reserved in the memory tier. If not 0, the item is staged in RAM.
+
+        Returns:
+            pathlib.Path: Path to the staging directory.
+        """
+        # Resumable downloads are staged in a persistent directory per item, which survives crashes and aborts.
+        # Otherwise, a temp directory is used, which is removed right away.
+        if size_memory:
+            return self.staging_memory.mkdtemp()
+
+        if resume:
+            return self._path_staging_item(media, media_stream)
+
+        os.makedirs(self._path_staging_root(), exist_ok=True)
+
+        return pathlib.Path(tempfile.mkdtemp(prefix=STAGING_TEMP_PREFIX, dir=self._path_staging_root()))
+
+    def _staging_remove(self, path_dir_staging: pathlib.Path, keep: bool, size_memory: int) -> None:
+        """Remove the staging directory of an item and give back its memory reservation.
+
+        Args:
+            path_dir_staging (pathlib.Path): Staging directory.
+            keep (bool): Keep the directory (e.g. to resume the download later).
+            size_memory (int): Bytes reserved in the memory tier.
+        """
+        if not keep:
+            shutil.rmtree(path_dir_staging, ignore_errors=True)
+
+        if size_memory:
+            self.staging_memory.release(size_memory)
+
+    def _size_estimate(
+        self, media: Track | Video, stream_manifest: StreamManifest | None, media_stream: Stream | None
+    ) -> int:
+        """Estimate the max. size of a track from its duration and audio format, before it is downloaded.
+
+        Args:
+            media (Track | Video): Media item.
+            stream_manifest (StreamManifest | None): Stream manifest.
+            media_stream (Stream | None): Media stream.
+
+        Returns:
+            int: Upper bound of the size in bytes, or 0 if unknown (e.g. videos).
+        """
+        if not isinstance(media, Track) or not stream_manifest or not media_stream or not media.duration:
+            return 0
+
+        if stream_manifest.codecs.upper() == Codec.FLAC:
+            # FLAC is never bigger than uncompressed stereo PCM.
+            bitrate: int = (media_stream.sample_rate or 44100) * (media_stream.bit_depth or 16) * 2
+        else:
+            bitrate = BITRATE_LOSSY_MAX_BPS
+
+        return media.duration * bitrate // 8
+
+    def _path_staging_item(self, media: Track | Video, media_stream: Stream | None) -> pathlib.Path:
+        """Create the persistent staging directory of a media item. It is stable across restarts.
+
+        Args:
+            media (Track | Video): Media item.
+            media_stream (Stream | None): Media stream (tracks only).
+
+        Returns:
+            pathlib.Path: Path to the staging directory.
+        """
+        if isinstance(media, Video):
+            name_staging: str = f"video_{media.id}_{self.settings.data.quality_video}"
+        else:
+            name_staging = f"track_{media.id}_{media_stream.audio_quality if media_stream else ''}"
+
+        path_staging: pathlib.Path = self._path_staging_root() / sanitize_filename(name_staging)
+
+        os.makedirs(path_staging, exist_ok=True)
+
+        return path_staging
+
+    def _staging_prune(self) -> None:
+        """Remove staging directories of items, which have not been touched for a long time.
+
+        These are partial downloads of resumable items, which were never resumed, and temp directories, which were
+        left behind by a crash.
+        """
+        path_root: pathlib.Path = self._path_staging_root()
+        time_min: float = time.time() - STAGING_RESUME_MAX_AGE_SEC
+        prefixes: tuple[str, ...] = (*STAGING_RESUME_PREFIXES, STAGING_TEMP_PREFIX)
+
+        try:
+            paths_dir: list[pathlib.Path] = [
+                path for path in path_root.iterdir() if path.is_dir() and path.name.startswith(prefixes)
+            ]
+        except OSError:
+            return
+
+        for path_dir in paths_dir:
+            try:
+                # Files of running downloads are written to, so the newest change counts.
+                time_changed: float = max(path.stat().st_mtime for path in (path_dir, *path_dir.iterdir()))
+            except OSError:
+                continue
+
+            if time_changed < time_min:
+                self.fn_logger.debug(f"Removing stale staging directory '{path_dir}'.")
+                shutil.rmtree(path_dir, ignore_errors=True)
+
+    def _path_staging_root(self) -> pathlib.Path:
+        """Get the directory, in which all items are staged (`path_staging`). It is not created.
+
+        Returns:
+            pathlib.Path: Configured staging directory or, by default, a hidden directory inside `path_base`, so
+                finished items can be renamed into their destination.
+        """
+        if self.settings.data.path_staging:
+            return pathlib.Path(self.settings.data.path_staging).expanduser().absolute()
+
+        return (pathlib.Path(self.path_base).expanduser() / STAGING_DIR_NAME).absolute()
+
+    def _file_move(self, path_src: pathlib.Path, path_dst: pathlib.Path) -> None:
+        """Move a file into its destination. It is renamed, if possible.
+
+        Args:
+            path_src (pathlib.Path): File to move.
+            path_dst (pathlib.Path): Destination file path.
+        """
+        if not file_move(path_src, path_dst):
+            self.fn_logger.debug(f"Copied '{path_src.name}' across drives to '{path_dst}'.")
 
     def _handle_metadata_and_extras(
         self,
@@ -855,6 +2393,8 @@ class Download:
         path_media_dst: pathlib.Path,
         is_parent_album: bool,
         media_stream: Stream | None,
+        extras: TrackExtras | None = None,
+        padding: int = 0,
     ) -> None:
         """Handle metadata, lyrics, and cover processing.
 
@@ -864,6 +2404,9 @@ class Download:
             path_media_dst (pathlib.Path): Destination file path.
             is_parent_album (bool): Whether this is a parent album.
             media_stream (Stream | None): Media stream.
+            extras (TrackExtras | None, optional): Lyrics and covers, which are being fetched in the background.
+                Defaults to None.
+            padding (int, optional): Room reserved for the tags, when the file was created. Defaults to 0.
         """
         if isinstance(media, Video):
             return
@@ -874,7 +2417,7 @@ class Download:
         # Write metadata to file.
         if media_stream:
             result_metadata, tmp_path_lyrics, tmp_path_cover = self.metadata_write(
-                media, tmp_path_file, is_parent_album, media_stream
+                media, tmp_path_file, is_parent_album, media_stream, extras, padding
             )
 
         # Move lyrics file
@@ -893,8 +2436,7 @@ class Download:
         quality_video: QualityVideo | None,
         quality_audio_old: Quality | None,
         quality_video_old: QualityVideo | None,
-        download_delay: bool,
-        skip_file: bool,
+        skip_download: bool = False,
     ) -> None:
         """Perform post-processing tasks.
 
@@ -905,11 +2447,11 @@ class Download:
             quality_video (QualityVideo | None): Video quality setting.
             quality_audio_old (Quality | None): Previous audio quality.
             quality_video_old (QualityVideo | None): Previous video quality.
-            download_delay (bool): Whether to apply download delay.
-            skip_file (bool): Whether file was skipped.
+            skip_download (bool, optional): Whether the download was skipped. Downloaded items are symlinked while
+                they are post-processed. Defaults to False.
         """
-        # If files needs to be symlinked, do postprocessing here.
-        if self.settings.data.symlink_to_track and not isinstance(media, Video):
+        # If an existing file needs to be symlinked, do it here.
+        if skip_download and self.settings.data.symlink_to_track and not isinstance(media, Video):
             # Determine file extension for symlink
             file_extension = path_media_dst.suffix
             self.media_move_and_symlink(media, path_media_dst, file_extension)
@@ -921,18 +2463,6 @@ class Download:
         if quality_video_old is not None:
             self.adjust_quality_video(quality_video_old)
 
-        # Apply download delay if needed
-        if (download_delay and not skip_file) and not self.event_abort.is_set():
-            time_sleep: float = round(
-                random.SystemRandom().uniform(
-                    self.settings.data.download_delay_sec_min, self.settings.data.download_delay_sec_max
-                ),
-                1,
-            )
-
-            self.fn_logger.debug(f"Next download will start in {time_sleep} seconds.")
-            time.sleep(time_sleep)
-
     def media_move_and_symlink(
         self, media: Track | Video, path_media_src: pathlib.Path, file_extension: str
     ) -> pathlib.Path:
@@ -966,7 +2496,7 @@ class Download:
 
             if not skip_file:
                 self.fn_logger.debug(f"Move: {path_media_src} -> {path_media_dst}")
-                shutil.move(path_media_src, path_media_dst)
+                self._file_move(path_media_src, path_media_dst)
 
             if not skip_symlink:
                 self.fn_logger.debug(f"Symlink: {path_media_src} -> {path_media_dst}")
@@ -1022,7 +2552,7 @@ class Download:
         # Check if the file was downloaded
         if path_file_source and path_file_source.is_file():
             # Move it.
-            shutil.move(path_file_source, path_file_destination)
+            self._file_move(path_file_source, pathlib.Path(path_file_destination))
 
             result = True
         else:
@@ -1123,13 +2653,11 @@ class Download:
 
         if url:
             try:
-                response: requests.Response = requests.get(url, timeout=REQUESTS_TIMEOUT_SEC)
-                result = response.content
+                with SessionHttp().session.get(url, timeout=REQUESTS_TIMEOUT_SEC) as response:
+                    result = response.content
             except Exception as e:
                 # TODO: Implement propper logging.
                 print(e)
-            finally:
-                response.close()
         elif path_file:
             try:
                 with open(path_file, "rb") as f:
@@ -1140,37 +2668,53 @@ class Download:
 
         return result
 
-    def metadata_write(
-        self, track: Track, path_media: pathlib.Path, is_parent_album: bool, media_stream: Stream
-    ) -> tuple[bool, pathlib.Path | None, pathlib.Path | None]:
-        """Write metadata, lyrics, and cover to a media file.
+    def cover_album(self, album: Album, dimension: CoverDimensions) -> str | bytes:
+        """Retrieve the cover of an album. It is fetched once and then taken from the cover cache.
 
         Args:
-            track (Track): Track object.
-            path_media (pathlib.Path): Path to media file.
+            album (Album): Album object.
+            dimension (CoverDimensions): Dimension of the cover.
+
+        Returns:
+            str | bytes: Image data or empty string on failure.
+        """
+        url: str = album.image(int(dimension) if dimension != CoverDimensions.PxORIGIN else dimension)
+
+        return self.cover_cache.get((album.id, dimension), partial(self.cover_data, url=url))
+
+    def _extras_prefetch(self, media: Track | Video, is_parent_album: bool) -> TrackExtras | None:
+        """Start fetching the lyrics and covers of a track in the background.
+
+        Args:
+            media (Track | Video): Media item.
             is_parent_album (bool): Whether this is a parent album.
-            media_stream (Stream): Stream object.
 
         Returns:
-            tuple[bool, pathlib.Path | None, pathlib.Path | None]: (Success, path to lyrics, path to cover)
+            TrackExtras | None: Futures of lyrics and covers, None for videos.
         """
-        result: bool = False
-        path_lyrics: pathlib.Path | None = None
-        path_cover: pathlib.Path | None = None
-        release_date: str = (
-            track.album.available_release_date.strftime("%Y-%m-%d")
-            if track.album.available_release_date
-            else track.album.release_date.strftime("%Y-%m-%d") if track.album.release_date else ""
+        if not isinstance(media, Track):
+            return None
+
+        return TrackExtras(
+            lyrics=self.prefetch_pool.submit(self.lyrics_fetch, media),
+            covers=self.prefetch_pool.submit(self.covers_fetch, media, is_parent_album),
         )
-        copy_right: str = track.copyright if hasattr(track, "copyright") and track.copyright else ""
-        isrc: str = track.isrc if hasattr(track, "isrc") and track.isrc else ""
+
+    def lyrics_fetch(self, track: Track) -> str:
+        """Retrieve the lyrics of a track, if they are embedded or saved to a file.
+
+        Args:
+            track (Track): Track object.
+
+        Returns:
+            str: Synced lyrics if available, otherwise plain lyrics. Empty string, if there are none.
+        """
         lyrics: str = ""
-        cover_data: bytes = None
 
         if self.settings.data.lyrics_embed or self.settings.data.lyrics_file:
             # Try to retrieve lyrics.
             try:
-                lyrics_obj = track.lyrics()
+                lyrics_obj = self._api_request(track.lyrics)
 
                 if lyrics_obj.subtitles:
                     lyrics = lyrics_obj.subtitles
@@ -1181,25 +2725,81 @@ class Download:
                 # TODO: Implement proper logging.
                 print(f"Could not retrieve lyrics for `{name_builder_item(track)}`.")
 
+        return lyrics
+
+    def covers_fetch(self, track: Track, is_parent_album: bool) -> tuple[str | bytes | None, str | bytes | None]:
+        """Retrieve the covers of a track, if they are embedded or saved to a file.
+
+        Args:
+            track (Track): Track object.
+            is_parent_album (bool): Whether this is a parent album.
+
+        Returns:
+            tuple[str | bytes | None, str | bytes | None]: (Cover to embed, cover to save to the album directory)
+        """
+        cover_data: str | bytes | None = None
+        cover_data_album_file: str | bytes | None = None
+        cover_dimension = self.settings.data.metadata_cover_dimension
+
+        if self.settings.data.metadata_cover_embed or (self.settings.data.cover_album_file and is_parent_album):
+            # Do not write CoverDimensions.PxORIGIN to metadata, since it can exceed max metadata file size (>16Mb)
+            cover_data = self.cover_album(
+                track.album,
+                cover_dimension if cover_dimension != CoverDimensions.PxORIGIN else CoverDimensions.Px1280,
+            )
+
+        if cover_data and self.settings.data.cover_album_file and is_parent_album:
+            if cover_dimension == CoverDimensions.PxORIGIN:
+                cover_data_album_file = self.cover_album(track.album, CoverDimensions.PxORIGIN)
+            else:
+                cover_data_album_file = cover_data
+
+        return cover_data, cover_data_album_file
+
+    def metadata_write(
+        self,
+        track: Track,
+        path_media: pathlib.Path,
+        is_parent_album: bool,
+        media_stream: Stream,
+        extras: TrackExtras | None = None,
+        padding: int = 0,
+    ) -> tuple[bool, pathlib.Path | None, pathlib.Path | None]:
+        """Write metadata, lyrics, and cover to a media file.
+
+        Args:
+            track (Track): Track object.
+            path_media (pathlib.Path): Path to media file.
+            is_parent_album (bool): Whether this is a parent album.
+            media_stream (Stream): Stream object.
+            extras (TrackExtras | None, optional): Lyrics and covers, which are being fetched in the background. If
+                not given, they are fetched now. Defaults to None.
+            padding (int, optional): Room reserved for the tags, when the file was created. Only if there is
+                some, a full rewrite of the file is reported. Defaults to 0.
+
+        Returns:
+            tuple[bool, pathlib.Path | None, pathlib.Path | None]: (Success, path to lyrics, path to cover)
+        """
+        result: bool = False
+        path_lyrics: pathlib.Path | None = None
+        path_cover: pathlib.Path | None = None
+        release_date: str = (
+            track.album.available_release_date.strftime("%Y-%m-%d")
+            if track.album.available_release_date
+            else track.album.release_date.strftime("%Y-%m-%d") if track.album.release_date else ""
+        )
+        copy_right: str = track.copyright if hasattr(track, "copyright") and track.copyright else ""
+        isrc: str = track.isrc if hasattr(track, "isrc") and track.isrc else ""
+        # Join the background requests, if they have been started already.
+        lyrics: str = extras.lyrics.result() if extras else self.lyrics_fetch(track)
+        cover_data, cover_data_album_file = (
+            extras.covers.result() if extras else self.covers_fetch(track, is_parent_album)
+        )
+
         if lyrics and self.settings.data.lyrics_file:
             path_lyrics = self.lyrics_to_file(path_media.parent, lyrics)
 
-        cover_dimension = self.settings.data.metadata_cover_dimension
-
-        if self.settings.data.metadata_cover_embed or (self.settings.data.cover_album_file and is_parent_album):
-            # Do not write CoverDimensions.PxORIGIN to metadata, since it can exceed max metadata file size (>16Mb)
-            url_cover = track.album.image(
-                int(cover_dimension) if cover_dimension != CoverDimensions.PxORIGIN else int(CoverDimensions.Px1280)
-            )
-            cover_data = self.cover_data(url=url_cover)
-
-        if cover_data and self.settings.data.cover_album_file and is_parent_album:
-            if cover_dimension == CoverDimensions.PxORIGIN:
-                url_cover_album_file = track.album.image(CoverDimensions.PxORIGIN)
-                cover_data_album_file = self.cover_data(url=url_cover_album_file)
-            else:
-                cover_data_album_file = cover_data
-
+        if cover_data_album_file:
             path_cover = self.cover_to_file(path_media.parent, cover_data_album_file)
 
         # `None` values are not allowed.
@@ -1225,10 +2825,20 @@ class Download:
             url_share=track.share_url if track.share_url and self.settings.data.metadata_write_url else "",
             replay_gain_write=self.settings.data.metadata_replay_gain,
             upc=track.album.upc if track.album and track.album.upc else "",
+            padding_reserved=padding,
         )
 
         m.save()
 
+        # Tags should fit into the padding reserved while extracting. Otherwise, every byte of the file was copied.
+        # Files without reserved padding (e.g. M4A) are always rewritten, this is not reported.
+        if m.rewritten:
+            self.stats.rewrite_add()
+            self.fn_logger.debug(
+                f"Tags of '{name_builder_item(track)}' did not fit into the padding of the file: It was rewritten "
+                f"entirely ({path_media.stat().st_size / 1048576:.1f} MiB)."
+            )
+
         result = True
 
         return result, path_lyrics, path_cover
@@ -1256,10 +2866,154 @@ class Download:
             quality_audio (Quality | None, optional): Audio quality. Defaults to None.
             quality_video (QualityVideo | None, optional): Video quality. Defaults to None.
         """
+        self.items_many(
+            file_template,
+            [media_id if media_id and media_type else media],
+            media_type,
+            video_download,
+            download_delay,
+            quality_audio,
+            quality_video,
+        )
+
+    def items_many(
+        self,
+        file_template: str,
+        medias: Iterable[Album | Playlist | UserPlaylist | Mix | str | int | None],
+        media_type: MediaType | None = None,
+        video_download: bool = False,
+        download_delay: bool = True,
+        quality_audio: Quality | None = None,
+        quality_video: QualityVideo | None = None,
+    ) -> None:
+        """Download all items of several albums, playlists, or mixes (e.g. the discography of an artist).
+
+        The items of all lists are fed into one dispatcher, so the workers stay busy at list boundaries instead of
+        waiting for the last items of a list. The next list is resolved, once all items of the former ones have
+        been submitted. Every list keeps its own job queue, progress bar and playlist file.
+
+        Args:
+            file_template (str): Template for file naming.
+            medias (Iterable[Album | Playlist | UserPlaylist | Mix | str | int | None]): Lists to download, either
+                as media items or as IDs of `media_type`.
+            media_type (MediaType | None, optional): Media type of the IDs. Defaults to None.
+            video_download (bool, optional): Whether to allow video downloads. Defaults to False.
+            download_delay (bool, optional): Whether to delay between downloads. Defaults to True.
+            quality_audio (Quality | None, optional): Audio quality. Defaults to None.
+            quality_video (QualityVideo | None, optional): Video quality. Defaults to None.
+        """
+        progress: Progress = self.progress_overall if self.progress_overall else self.progress
+        # Lists are appended, as soon as they are resolved by the dispatcher.
+        lists: list[ListDownload] = []
+        fns_job: Iterable[Job] = self._lists_jobs(
+            medias, media_type, file_template, video_download, download_delay, quality_audio, quality_video, lists
+        )
+
+        # Pending items of all lists first, then failed items are retried.
+        for attempt in range(1 + JOBS_RETRIES):
+            if attempt:
+                fns_job = [
+                    fn_job
+                    for list_download in lists
+                    for fn_job in self._list_jobs(list_download, download_delay, quality_audio, quality_video)
+                ]
+
+                if not fns_job or self.event_abort.is_set():
+                    break
+
+                self.fn_logger.info(f"Retrying {len(fns_job)} failed item(s).")
+
+            # Retried items have been counted already.
+            self._jobs_dispatch(fns_job, download_delay, progress, progress_advance=not attempt)
+
+            # Files must have reached their destination before e.g. a playlist file is created. Failures of
+            # post-processing are known only then.
+            for list_download in lists:
+                self._postprocess_wait(list_download.futures_postprocess)
+                list_download.futures_postprocess.clear()
+
+        for list_download in lists:
+            self._list_finish(list_download)
+
+        if self.settings.data.downloads_connections_adaptive:
+            limits: ConcurrencyLimits = self.scheduler.limits()
+
+            self.fn_logger.debug(
+                f"Adaptive connection limit: {limits.limit} of max. {limits.limit_max} "
+                f"({limits.throughput / 1048576:.1f} MiB/s, {limits.decreases} decreases due to errors)."
+            )
+
+    def _lists_jobs(
+        self,
+        medias: Iterable[Album | Playlist | UserPlaylist | Mix | str | int | None],
+        media_type: MediaType | None,
+        file_template: str,
+        video_download: bool,
+        download_delay: bool,
+        quality_audio: Quality | None,
+        quality_video: QualityVideo | None,
+        lists: list[ListDownload],
+    ) -> Iterator[Job]:
+        """Resolve lists one after another and yield the jobs of their pending items.
+
+        Args:
+            medias (Iterable[Album | Playlist | UserPlaylist | Mix | str | int | None]): Lists as media items or IDs.
+            media_type (MediaType | None): Media type of the IDs.
+            file_template (str): Template for file naming.
+            video_download (bool): Whether to allow video downloads.
+            download_delay (bool): Whether to pace the start of downloads.
+            quality_audio (Quality | None): Audio quality setting.
+            quality_video (QualityVideo | None): Video quality setting.
+            lists (list[ListDownload]): Collects the resolved lists.
+
+        Yields:
+            Job: Job and progress task of its list.
+        """
+        for media in medias:
+            if self.event_abort.is_set():
+                return
+
+            list_download: ListDownload | None = self._list_prepare(
+                media, media_type, file_template, video_download, download_delay, quality_audio
+            )
+
+            if list_download is None:
+                continue
+
+            lists.append(list_download)
+
+            yield from self._list_jobs(list_download, download_delay, quality_audio, quality_video)
+
+    def _list_prepare(
+        self,
+        media: Album | Playlist | UserPlaylist | Mix | str | int | None,
+        media_type: MediaType | None,
+        file_template: str,
+        video_download: bool,
+        download_delay: bool,
+        quality_audio: Quality | None,
+    ) -> ListDownload | None:
+        """Resolve a list and set up its job queue and progress bar.
+
+        Args:
+            media (Album | Playlist | UserPlaylist | Mix | str | int | None): List as media item or ID.
+            media_type (MediaType | None): Media type of the ID.
+            file_template (str): Template for file naming.
+            video_download (bool): Whether to allow video downloads.
+            download_delay (bool): Whether to pace the start of downloads.
+            quality_audio (Quality | None): Audio quality setting.
+
+        Returns:
+            ListDownload | None: The list or None, if it is not available.
+        """
         # Validate and prepare media collection
-        validated_media = self._validate_and_prepare_media(media, media_id, media_type, video_download)
+        validated_media = (
+            self._validate_and_prepare_media(None, media, media_type, video_download)
+            if isinstance(media, str | int)
+            else self._validate_and_prepare_media(media, None, None, video_download)
+        )
         if validated_media is None or not isinstance(validated_media, Album | Playlist | UserPlaylist | Mix):
-            return
+            return None
 
         media = validated_media
 
@@ -1273,30 +3027,127 @@ class Download:
             f"[green]List '{list_media_name_short}'", total=len(items), visible=progress_stdout
         )
 
-        # Download configuration
-        is_album: bool = isinstance(media, Album)
-        sort_by_track_num: bool = bool("album_track_num" in file_name_relative or "list_pos" in file_name_relative)
-        list_total: int = len(items)
-
-        # Execute downloads
-        result_dirs: list[pathlib.Path] = self._execute_collection_downloads(
-            items,
-            file_name_relative,
-            quality_audio,
-            quality_video,
-            download_delay,
-            is_album,
-            list_total,
-            progress,
-            progress_task,
-            progress_stdout,
+        list_download: ListDownload = ListDownload(
+            media=media,
+            name=list_media_name,
+            file_name_relative=file_name_relative,
+            items=items,
+            # States of the items survive restarts. If existing files are skipped, done items are not checked again.
+            jobs=JobQueue(
+                self._path_jobs(media),
+                [job_key(count, item_media.id) for count, item_media in enumerate(items)],
+                resume=self.skip_existing,
+            ),
+            # Tracks are completed with the data of their albums, each album is requested once.
+            albums=AlbumCache(self.session, [media] if isinstance(media, Album) else []),
+            # Streams of the next items are resolved, while the current ones are downloading.
+            look_ahead=LookAhead(
+                items,
+                partial(
+                    self._stream_fetch,
+                    file_template=file_name_relative,
+                    quality_audio=quality_audio,
+                    list_total=len(items),
+                    paced=download_delay,
+                ),
+                self.settings.data.downloads_prefetch_items,
+                STREAM_PREFETCH_TTL_SEC,
+                self.prefetch_pool,
+            ),
+            progress_task=progress_task,
+            progress_stdout=progress_stdout,
         )
 
+        if not items:
+            # Mark progress as complete for empty lists
+            progress.update(progress_task, completed=progress.tasks[progress_task].total)
+
+            if not progress_stdout and self.progress_gui:
+                self.progress_gui.list_item.emit(100.0)
+        else:
+            # Items, which were done in a former run, are not walked through again.
+            progress.advance(progress_task, len(items) - list_download.jobs.count_todo())
+
+        return list_download
+
+    def _list_jobs(
+        self,
+        list_download: ListDownload,
+        download_delay: bool,
+        quality_audio: Quality | None,
+        quality_video: QualityVideo | None,
+    ) -> list[Job]:
+        """Create the jobs of the pending and failed items of a list.
+
+        Args:
+            list_download (ListDownload): The list.
+            download_delay (bool): Whether to pace the start of downloads.
+            quality_audio (Quality | None): Audio quality setting.
+            quality_video (QualityVideo | None): Video quality setting.
+
+        Returns:
+            list[Job]: Jobs and progress task of the list.
+        """
+        list_total: int = len(list_download.items)
+
+        # Downloads are paced, when they are dispatched, and not by the workers.
+        return [
+            (
+                partial(
+                    self._job_run,
+                    list_download.jobs,
+                    job_key(count, item_media.id),
+                    list_download.futures_postprocess,
+                    partial(
+                        self.item,
+                        media=item_media,
+                        file_template=list_download.file_name_relative,
+                        quality_audio=quality_audio,
+                        quality_video=quality_video,
+                        is_parent_album=list_download.is_album,
+                        list_position=count + 1,
+                        list_total=list_total,
+                        look_ahead=list_download.look_ahead,
+                        albums=list_download.albums,
+                        requeue_throttled=True,
+                    ),
+                    download_delay,
+                ),
+                list_download.progress_task,
+            )
+            for count, item_media in enumerate(list_download.items)
+            if list_download.jobs.todo(job_key(count, item_media.id))
+        ]
+
+    def _list_finish(self, list_download: ListDownload) -> None:
+        """Persist the job queue of a list and create its playlist file.
+
+        Args:
+            list_download (ListDownload): The list.
+        """
+        list_download.look_ahead.cancel()
+        list_download.jobs.close()
+
         # Create playlist file if requested
         if self.settings.data.playlist_create:
-            self.playlist_populate(set(result_dirs), list_media_name, is_album, sort_by_track_num)
+            result_dirs: set[pathlib.Path] = {path_file.parent for path_file in list_download.jobs.paths_file()}
+
+            self.playlist_populate(
+                result_dirs, list_download.name, list_download.is_album, list_download.sort_by_track_num
+            )
+
+        self.fn_logger.info(f"Finished list '{list_download.name}'.")
+
+    def _path_jobs(self, media: Album | Playlist | UserPlaylist | Mix) -> pathlib.Path:
+        """Get the path to the job queue of a list.
 
-        self.fn_logger.info(f"Finished list '{list_media_name}'.")
+        Args:
+            media (Album | Playlist | UserPlaylist | Mix): Media collection.
+
+        Returns:
+            pathlib.Path: Path to the JSON queue file in the staging root.
+        """
+        return self._path_staging_root() / JOBS_DIR_NAME / f"{type(media).__name__.lower()}_{media.id}.json"
 
     def _setup_collection_download_context(
         self,
@@ -1334,75 +3185,196 @@ class Download:
 
         return file_name_relative, list_media_name, list_media_name_short, items, progress_stdout
 
-    def _execute_collection_downloads(
+    def _job_run(
         self,
-        items: list,
-        file_name_relative: str,
-        quality_audio: Quality | None,
-        quality_video: QualityVideo | None,
-        download_delay: bool,
-        is_album: bool,
-        list_total: int,
+        jobs: JobQueue,
+        key: str,
+        futures_postprocess: list[futures.Future],
+        fn_item: Callable[..., tuple[bool, pathlib.Path | str]],
+        paced: bool = False,
+    ) -> tuple[bool, pathlib.Path | str]:
+        """Download an item of a list and track its state in the job queue.
+
+        Args:
+            jobs (JobQueue): Job queue of the list.
+            key (str): Key of the item in the job queue.
+            futures_postprocess (list[futures.Future]): Collects the future of the post-processing job.
+            fn_item (Callable[..., tuple[bool, pathlib.Path | str]]): Downloads the item (see `item`).
+            paced (bool, optional): Whether a token of the rate limiter was taken to start this job. Defaults to
+                False.
+
+        Returns:
+            tuple[bool, pathlib.Path | str]: (Downloaded, path to file)
+
+        Raises:
+            TooManyRequests: If the requests of the item were throttled. The item is requeued by the dispatcher.
+        """
+        futures_item: list[futures.Future] = []
+
+        jobs.status_set(key, QueueDownloadStatus.Downloading)
+
+        try:
+            result, path_file = fn_item(futures_postprocess=futures_item)
+        except TooManyRequests:
+            # Stays failed while the dispatcher requeues it, so the retry pass or a restart picks it up in any case.
+            jobs.status_set(key, QueueDownloadStatus.Failed)
+
+            if paced:
+                self.rate_limiter.refund()
+
+            raise
+        except Exception:
+            jobs.status_set(key, QueueDownloadStatus.Failed)
+
+            raise
+
+        if futures_item:
+            # The item is done, once it has been post-processed.
+            futures_item[0].add_done_callback(partial(self._job_postprocessed, jobs, key, path_file))
+            futures_postprocess.extend(futures_item)
+        elif result:
+            jobs.status_set(key, QueueDownloadStatus.Finished, path_file)
+        else:
+            # Items without a path are not available (anymore), retrying them is pointless.
+            jobs.status_set(key, QueueDownloadStatus.Failed if path_file else QueueDownloadStatus.Skipped, path_file)
+
+        # Existing and unavailable items are skipped without downloading: The next item can start right away.
+        if paced and not futures_item and (result or not path_file):
+            self.rate_limiter.refund()
+
+        return result, path_file
+
+    def _jobs_dispatch(
+        self,
+        fns_job: Iterable[Job],
+        paced: bool,
         progress: Progress,
-        progress_task: TaskID,
-        progress_stdout: bool,
-    ) -> list[pathlib.Path]:
-        """Execute downloads for all items in the collection.
+        progress_advance: bool = True,
+    ) -> None:
+        """Run download jobs in the worker pool and process their results as they complete.
+
+        A job is submitted only when a worker is free and, if paced, the rate limiter grants a token. So waiting for
+        the rate limiter never blocks a worker. While the TIDAL API throttles requests, no jobs are submitted and
+        afterward only as many run at once as the throttle controller allows. Throttled jobs are requeued at the
+        front, up to `THROTTLE_ATTEMPTS_MAX` times, then they are left to the retry pass. Their state in the job queue
+        is `Failed` from the first throttle on (also while requeued), so a restart picks them up in any case. Jobs
+        are taken from `fns_job` only when a worker is about to need them, so it can resolve further lists lazily.
 
         Args:
-            items (list): List of media items to download.
-            file_name_relative (str): Relative file name template.
-            quality_audio (Quality | None): Audio quality setting.
-            quality_video (QualityVideo | None): Video quality setting.
-            download_delay (bool): Whether to apply download delay.
-            is_album (bool): Whether this is an album.
-            list_total (int): Total number of items.
+            fns_job (Iterable[Job]): Jobs, which return (downloaded, path), and the progress task of their list.
+            paced (bool): Whether to pace the start of jobs by the rate limiter.
             progress (Progress): Progress bar instance.
-            progress_task (TaskID): Progress task ID.
-            progress_stdout (bool): Whether to show progress in stdout.
+            progress_advance (bool, optional): Advance the progress bar per finished job. Defaults to True.
+        """
+        workers: int = self.settings.data.downloads_concurrent_max
+        progress_stdout: bool = self.progress_gui is None
+        jobs_pending: Iterator[Job] = iter(fns_job)
+        # Requeued jobs and the next pending job.
+        jobs_waiting: deque[Job] = deque()
+        jobs_running: dict[futures.Future, Job] = {}
+        # Number of times each job was throttled.
+        throttles: Counter[Job] = Counter()
+
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                # If aborted (CTRL+C), do not start any further jobs.
+                if self.event_abort.is_set():
+                    jobs_waiting.clear()
+                    jobs_pending = iter(())
+
+                time_wait: float = self._jobs_submit(executor, jobs_pending, jobs_waiting, jobs_running, paced, workers)
+
+                if not jobs_waiting and not jobs_running:
+                    break
+
+                timeout: float = min(time_wait, WAIT_TIMEOUT_SEC) if time_wait else WAIT_TIMEOUT_SEC
+
+                if not jobs_running:
+                    self.event_abort.wait(timeout)
+
+                    continue
+
+                jobs_done, _ = futures.wait(jobs_running, timeout=timeout, return_when=futures.FIRST_COMPLETED)
+
+                for future in jobs_done:
+                    job: Job = jobs_running.pop(future)
+
+                    if isinstance(future.exception(), TooManyRequests):
+                        throttles[job] += 1
+
+                        if throttles[job] < THROTTLE_ATTEMPTS_MAX:
+                            jobs_waiting.appendleft(job)
+
+                            continue
+
+                    self._job_result_process(future, progress, job[1], progress_stdout, progress_advance)
+
+    def _jobs_submit(
+        self,
+        executor: futures.ThreadPoolExecutor,
+        jobs_pending: Iterator[Job],
+        jobs_waiting: deque[Job],
+        jobs_running: dict[futures.Future, Job],
+        paced: bool,
+        workers: int,
+    ) -> float:
+        """Submit waiting jobs, as long as workers are free and neither throttling nor the rate limiter holds them.
+
+        Args:
+            executor (futures.ThreadPoolExecutor): Worker pool.
+            jobs_pending (Iterator[Job]): Jobs, which have not been taken yet.
+            jobs_waiting (deque[Job]): Requeued jobs and the next pending job.
+            jobs_running (dict[futures.Future, Job]): Submitted jobs by their futures.
+            paced (bool): Whether to pace the start of jobs by the rate limiter.
+            workers (int): Number of workers.
 
         Returns:
-            list[pathlib.Path]: List of result directories.
+            float: Seconds until the next job can be submitted, 0 if no job is held back.
         """
-        result_dirs: list[pathlib.Path] = []
+        while len(jobs_running) < self.throttle.limit(workers):
+            if not jobs_waiting:
+                job_next: Job | None = next(jobs_pending, None)
 
-        # Check if items list is empty
-        if not items:
-            # Mark progress as complete for empty lists
-            progress.update(progress_task, completed=progress.tasks[progress_task].total)
+                if job_next is None:
+                    break
 
-            if not progress_stdout and self.progress_gui:
-                self.progress_gui.list_item.emit(100.0)
+                jobs_waiting.append(job_next)
 
-            return result_dirs
+            time_wait: float = self.throttle.time_wait() or (self.rate_limiter.try_acquire() if paced else 0.0)
 
-        # Iterate through list items
-        while not progress.finished:
-            with futures.ThreadPoolExecutor(max_workers=self.settings.data.downloads_concurrent_max) as executor:
-                # Dispatch all download tasks to worker threads
-                download_futures: list[futures.Future] = [
-                    executor.submit(
-                        self.item,
-                        media=item_media,
-                        file_template=file_name_relative,
-                        quality_audio=quality_audio,
-                        quality_video=quality_video,
-                        download_delay=download_delay,
-                        is_parent_album=is_album,
-                        list_position=count + 1,
-                        list_total=list_total,
-                    )
-                    for count, item_media in enumerate(items)
-                ]
+            if time_wait:
+                return time_wait
 
-                # Process download results
-                result_dirs = self._process_download_futures(download_futures, progress, progress_task, progress_stdout)
+            job: Job = jobs_waiting.popleft()
+            jobs_running[executor.submit(job[0])] = job
 
-                # Check for abort signal
-                if self.event_abort.is_set():
-                    return result_dirs
+        return 0.0
+
+    @staticmethod
+    def _job_postprocessed(jobs: JobQueue, key: str, path_file: pathlib.Path, future: futures.Future) -> None:
+        """Track the result of the post-processing of a list item.
 
-        return result_dirs
+        Args:
+            jobs (JobQueue): Job queue of the list.
+            key (str): Key of the item in the job queue.
+            path_file (pathlib.Path): Destination file of the item.
+            future (futures.Future): Future of the post-processing job.
+        """
+        done: bool = not future.cancelled() and future.exception() is None and bool(future.result())
+
+        jobs.status_set(key, QueueDownloadStatus.Finished if done else QueueDownloadStatus.Failed, path_file)
+
+    def _postprocess_wait(self, futures_postprocess: list[futures.Future]) -> None:
+        """Wait until all queued post-processing jobs are done and log their failures.
+
+        Args:
+            futures_postprocess (list[futures.Future]): Futures of the post-processing jobs.
+        """
+        for future in futures.as_completed(futures_postprocess):
+            try:
+                future.result()
+            except Exception:
+                self.fn_logger.exception("Post-processing of a downloaded item failed.")
 
     def _create_download_futures(
         self,
@@ -1444,49 +3416,37 @@ class Download:
                 for count, item_media in enumerate(items)
             ]
 
-    def _process_download_futures(
+    def _job_result_process(
         self,
-        futures_list: list[futures.Future],
+        future: futures.Future,
         progress: Progress,
         progress_task: TaskID,
         progress_stdout: bool,
-    ) -> list[pathlib.Path]:
-        """Process download futures and collect results.
+        progress_advance: bool = True,
+    ) -> None:
+        """Process the result of a finished download job.
 
         Args:
-            futures_list (list[futures.Future]): List of download futures.
+            future (futures.Future): Future of the download job.
             progress (Progress): Progress bar instance.
             progress_task (TaskID): Progress task ID.
             progress_stdout (bool): Whether to show progress in stdout.
-
-        Returns:
-            list[pathlib.Path]: List of result directories.
+            progress_advance (bool, optional): Advance the progress bar. Defaults to True.
         """
-        result_dirs: list[pathlib.Path] = []
-
-        # Report results as they become available
-        for future in futures.as_completed(futures_list):
-            # Retrieve result
-            status, result_path_file = future.result()
-
-            if result_path_file:
-                result_dirs.append(result_path_file.parent)
+        # Throttled jobs, which were not requeued (anymore), have failed. Raise other errors of the job.
+        if isinstance(future.exception(), TooManyRequests):
+            self.fn_logger.error("Too many requests against TIDAL backend. Item failed, it is retried later.")
+        else:
+            future.result()
 
-            # Advance progress bar.
+        # Advance progress bar.
+        if progress_advance:
             progress.advance(progress_task)
 
-            if not progress_stdout:
-                self.progress_gui.list_item.emit(progress.tasks[progress_task].percentage)
+        progress.update(progress_task, throughput=self.stats.throughput())
 
-            # If app is terminated (CTRL+C)
-            if self.event_abort.is_set():
-                # Cancel all not yet started tasks
-                for f in futures_list:
-                    f.cancel()
-
-                break
-
-        return result_dirs
+        if not progress_stdout:
+            self.progress_gui.list_item.emit(progress.tasks[progress_task].percentage)
 
     def playlist_populate(
         self, dirs_scoped: set[pathlib.Path], name_list: str, is_album: bool, sort_alphabetically: bool
@@ -1561,18 +3521,63 @@ class Download:
 
         return path_file_out
 
-    def _extract_flac(self, path_media_src: pathlib.Path) -> pathlib.Path:
-        """Extract FLAC audio from a media file using ffmpeg.
+    def _padding_tags(self, track: Track) -> int:
+        """Estimate the room needed for the tags of a track, which are written after it is downloaded.
+
+        Args:
+            track (Track): Track object.
+
+        Returns:
+            int: Upper bound of the size of the tags in bytes (text tags, embedded cover and lyrics).
+        """
+        padding: int = PADDING_TAGS_SIZE
+
+        if self.settings.data.metadata_cover_embed:
+            # Like in `metadata_write`, the original size is never embedded.
+            cover_dimension: CoverDimensions = self.settings.data.metadata_cover_dimension
+            size_cover: int = int(
+                cover_dimension if cover_dimension != CoverDimensions.PxORIGIN else CoverDimensions.Px1280
+            )
+            padding += size_cover * size_cover * PADDING_COVER_BITS_PER_PIXEL // 8
+
+        if self.settings.data.lyrics_embed:
+            padding += (track.duration or 0) * PADDING_LYRICS_BYTES_PER_SEC
+
+        return padding
+
+    def _extract_flac(self, path_media_src: pathlib.Path, padding: int = 0) -> tuple[pathlib.Path | None, int]:
+        """Extract FLAC audio from a media file.
+
+        The FLAC frames are remuxed in-process. Only MP4 layouts, which the remuxer cannot handle, are passed to
+        ffmpeg (if configured).
 
         Args:
             path_media_src (pathlib.Path): Path to the source media file.
+            padding (int, optional): Room to reserve for tags in bytes, so writing them does not rewrite the whole
+                file (in-process extraction only). Defaults to 0.
 
         Returns:
-            pathlib.Path: Path to the extracted FLAC file.
+            tuple[pathlib.Path | None, int]: (Path to the extracted FLAC file or None, if it could not be extracted,
+                room reserved for tags in bytes)
         """
         path_media_out = path_media_src.with_suffix(AudioExtensions.FLAC)
+
+        try:
+            return flac_extract(path_media_src, path_media_out, padding), padding
+        except Mp4LayoutUnsupported:
+            if not self.settings.data.path_binary_ffmpeg:
+                self.fn_logger.exception(
+                    f"Cannot extract FLAC from '{path_media_src}', since its MP4 layout is not supported. FFmpeg "
+                    "is needed for this file, but its path is not set (`path_binary_ffmpeg`)."
+                )
+
+                return None, 0
+
+            self.fn_logger.debug(f"MP4 layout of '{path_media_src}' is not supported. Using FFmpeg to extract FLAC.")
+
         ffmpeg = (
             FFmpeg(executable=self.settings.data.path_binary_ffmpeg)
+            .option("y")
             .input(url=path_media_src)
             .output(
                 url=path_media_out,
@@ -1586,7 +3591,8 @@ class Download:
 
         ffmpeg.execute()
 
-        return path_media_out
+        # FFmpeg uses its own padding, nothing has been reserved.
+        return path_media_out, 0
 
     def _extract_video_stream(self, m3u8_variant: m3u8.M3U8, quality: int) -> tuple[m3u8.M3U8 | bool, str]:
         """Extract the best matching video stream from an m3u8 variant playlist.
@@ -1606,7 +3612,7 @@ class Download:
             for playlist in m3u8_variant.playlists:
                 if resolution_best < playlist.stream_info.resolution[1]:
                     resolution_best = playlist.stream_info.resolution[1]
-                    m3u8_playlist = m3u8.load(playlist.uri)
+                    m3u8_playlist = m3u8.load(playlist.uri, http_client=RequestsClient())
                     mime_type = playlist.stream_info.codecs
 
                     if quality == playlist.stream_info.resolution[1]:
@@ -48,6 +48,7 @@ import math
 import sys
 import time
 from collections.abc import Callable, Iterable, Sequence
+from functools import partial
 from typing import Any
 
 from requests.exceptions import HTTPError
@@ -55,6 +56,7 @@ from tidalapi.session import LinkLogin
 
 from tidal_dl_ng import __version__, update_available
 from tidal_dl_ng.dialog import DialogLogin, DialogPreferences, DialogVersion
+from tidal_dl_ng.helper.cover import CoverCache
 from tidal_dl_ng.helper.gui import (
     FilterHeader,
     HumanProxyModel,
@@ -67,6 +69,7 @@ from tidal_dl_ng.helper.gui import (
     set_user_list_media,
 )
 from tidal_dl_ng.helper.path import get_format_template, resource_path
+from tidal_dl_ng.helper.stats import throughput_format
 from tidal_dl_ng.helper.tidal import (
     favorite_function_factory,
     get_tidal_media_id,
@@ -96,7 +99,7 @@ from tidalapi.artist import Artist
 from tidalapi.session import SearchTypes
 
 from tidal_dl_ng.config import HandlingApp, Settings, Tidal
-from tidal_dl_ng.constants import FAVORITES, QualityVideo, QueueDownloadStatus, TidalLists
+from tidal_dl_ng.constants import FAVORITES, CoverDimensions, QualityVideo, QueueDownloadStatus, TidalLists
 from tidal_dl_ng.download import Download
 from tidal_dl_ng.logger import XStream, logger_gui
 from tidal_dl_ng.model.gui_data import ProgressBars, QueueDownloadItem, ResultItem, StatusbarMessage
@@ -126,8 +129,10 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
     s_spinner_start: QtCore.Signal = QtCore.Signal(QtWidgets.QWidget)
     s_spinner_stop: QtCore.Signal = QtCore.Signal()
     pb_item: QtWidgets.QProgressBar
+    pb_item_name: str = ""
     s_item_advance: QtCore.Signal = QtCore.Signal(float)
     s_item_name: QtCore.Signal = QtCore.Signal(str)
+    s_item_throughput: QtCore.Signal = QtCore.Signal(float)
     s_list_name: QtCore.Signal = QtCore.Signal(str)
     pb_list: QtWidgets.QProgressBar
     s_list_advance: QtCore.Signal = QtCore.Signal(float)
@@ -247,6 +252,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
             list_item=self.s_list_advance,
             item_name=self.s_item_name,
             list_name=self.s_list_name,
+            item_throughput=self.s_item_throughput,
         )
         progress: Progress = Progress()
         handling_app: HandlingApp = HandlingApp()
@@ -1105,6 +1111,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.s_spinner_stop.connect(self.on_spinner_stop)
         self.s_item_advance.connect(self.on_progress_item)
         self.s_item_name.connect(self.on_progress_item_name)
+        self.s_item_throughput.connect(self.on_progress_item_throughput)
         self.s_list_name.connect(self.on_progress_list_name)
         self.s_list_advance.connect(self.on_progress_list)
         self.s_pb_reset.connect(self.on_progress_reset)
@@ -1168,8 +1175,18 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         Args:
             value (str): The item name.
         """
+        self.pb_item_name = value
+
         self.pb_item.setFormat(f"%p% {value}")
 
+    def on_progress_item_throughput(self, value: float) -> None:
+        """Show the current download throughput in the item progress bar.
+
+        Args:
+            value (float): The throughput in bytes per second.
+        """
+        self.pb_item.setFormat(f"%p% {self.pb_item_name} ({throughput_format(value)})")
+
     def on_progress_list_name(self, value: str) -> None:
         """Set the format of the list progress bar.
 
@@ -1265,6 +1282,8 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
             media (Album | Playlist | Track | Video | Album | Artist): The media item.
         """
         cover_url: str = ""
+        # Album covers are cached by album and dimension, other images by their URL.
+        cover_key: tuple | str = ""
         # Show spinner in the cover label itself
         parent_widget = self.l_pm_cover
 
@@ -1273,12 +1292,14 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
         try:
             try:
-                cover_url = media.album.image()
+                cover_url = media.album.image(int(CoverDimensions.Px320))
+                cover_key = (media.album.id, CoverDimensions.Px320)
             except Exception:
                 # Only call image() if it exists
                 if hasattr(media, "image") and callable(getattr(media, "image", None)):
                     try:
                         cover_url = media.image()
+                        cover_key = cover_url
                     except Exception:
                         logger_gui.info(f"No cover available (media ID: {getattr(media, 'id', 'unknown')}).")
                 else:
@@ -1288,7 +1309,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
             if cover_url and self.cover_url_current != cover_url:
                 self.cover_url_current = cover_url
-                data_cover: bytes = Download.cover_data(cover_url)
+                data_cover: bytes = CoverCache().get(cover_key, partial(Download.cover_data, cover_url))
                 pixmap: QtGui.QPixmap = QtGui.QPixmap()
                 pixmap.loadFromData(data_cover)
                 self.l_pm_cover.setPixmap(pixmap)
@@ -0,0 +1,158 @@
+"""
+cover.py
+
+Process-wide cache of cover images, so the cover of an album is fetched once and not once per track.
+
+Classes:
+    CoverCache: Thread-safe LRU cache of cover images in memory, with an optional tier on disk.
+"""
+
+import contextlib
+import hashlib
+import os
+import pathlib
+import tempfile
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent import futures
+from threading import Lock
+
+from tidal_dl_ng.config import Settings
+from tidal_dl_ng.helper.decorator import SingletonMeta
+from tidal_dl_ng.helper.path import path_config_base
+
+# Directory of the disk tier, relative to the config directory.
+PATH_CACHE_COVER: str = os.path.join("cache", "covers")
+
+
+class CoverCache(metaclass=SingletonMeta):
+    """Cache cover images by a key, e.g. (album ID, dimension).
+
+    Concurrent requests for the same key share one fetch (single flight): The first caller fetches the image, every
+    other caller waits for its result. The most recently used images are kept in memory. If the disk tier is
+    enabled, images are stored on disk as well, so they survive restarts and evictions from memory.
+
+    Failed fetches (empty results) are not cached, so they are retried by the next caller.
+    """
+
+    items_max: int
+    path_dir: pathlib.Path | None
+    lock: Lock
+    items: OrderedDict[Hashable, bytes]
+    fetches: dict[Hashable, futures.Future]
+
+    def __init__(self, items_max: int | None = None, path_dir: pathlib.Path | None = None):
+        """Create the cache.
+
+        Args:
+            items_max (int | None, optional): Max. number of images kept in memory. 0 disables the memory tier. If
+                not given, `cover_cache_items` is used. Defaults to None.
+            path_dir (pathlib.Path | None, optional): Directory of the disk tier. If not given, the disk tier is
+                located in the config directory, if `cover_cache_disk` is enabled. Defaults to None.
+        """
+        settings: Settings = Settings()
+
+        if items_max is None:
+            items_max = settings.data.cover_cache_items
+
+        if path_dir is None and settings.data.cover_cache_disk:
+            path_dir = pathlib.Path(path_config_base(), PATH_CACHE_COVER)
+
+        self.items_max = max(items_max, 0)
+        self.path_dir = path_dir
+        self.lock = Lock()
+        self.items = OrderedDict()
+        self.fetches = {}
+
+    def get(self, key: Hashable, fn_fetch: Callable[[], bytes | str]) -> bytes | str:
+        """Get a cover image from the cache, or fetch it if it is not cached yet.
+
+        Args:
+            key (Hashable): Key of the image, e.g. (album ID, dimension).
+            fn_fetch (Callable[[], bytes | str]): Fetches the image. Returns an empty value on failure.
+
+        Returns:
+            bytes | str: Image data or an empty value, if it could not be fetched.
+        """
+        with self.lock:
+            data: bytes | None = self.items.get(key)
+
+            if data is not None:
+                self.items.move_to_end(key)
+
+                return data
+
+            future: futures.Future | None = self.fetches.get(key)
+            # Only the first caller fetches the image, others wait for it.
+            is_owner: bool = future is None
+
+            if is_owner:
+                future = futures.Future()
+                self.fetches[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            data = self._disk_read(key) or fn_fetch()
+
+            if data:
+                self._memory_put(key, data)
+                self._disk_write(key, data)
+
+            future.set_result(data)
+        except BaseException as e:
+            future.set_exception(e)
+
+            raise
+        finally:
+            with self.lock:
+                del self.fetches[key]
+
+        return data
+
+    def _memory_put(self, key: Hashable, data: bytes) -> None:
+        # Insert as most recently used and evict the least recently used images.
+        with self.lock:
+            self.items[key] = data
+            self.items.move_to_end(key)
+
+            while len(self.items) > self.items_max:
+                self.items.popitem(last=False)
+
+    def _path_file(self, key: Hashable) -> pathlib.Path:
+        # Keys can contain anything, so hash them to get a valid file name.
+        return self.path_dir / (hashlib.sha256(repr(key).encode("utf-8")).hexdigest() + ".jpg")
+
+    def _disk_read(self, key: Hashable) -> bytes | None:
+        if not self.path_dir:
+            return None
+
+        try:
+            return self._path_file(key).read_bytes()
+        except OSError:
+            return None
+
+    def _disk_write(self, key: Hashable, data: bytes) -> None:
+        if not self.path_dir:
+            return
+
+        path_file: pathlib.Path = self._path_file(key)
+
+        if path_file.exists():
+            return
+
+        # Write to a temp file first, so readers never see a partially written image. The disk tier is optional,
+        # so errors are ignored.
+        with contextlib.suppress(OSError):
+            os.makedirs(self.path_dir, exist_ok=True)
+
+            fd, path_tmp = tempfile.mkstemp(dir=self.path_dir)
+
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+
+                os.replace(path_tmp, path_file)
+            finally:
+                pathlib.Path(path_tmp).unlink(missing_ok=True)
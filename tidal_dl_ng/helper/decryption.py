@@ -4,6 +4,8 @@ import pathlib
 from Crypto.Cipher import AES
 from Crypto.Util import Counter
 
+from tidal_dl_ng.constants import CHUNK_SIZE
+
 
 def decrypt_security_token(security_token: str) -> (str, str):
     """
@@ -44,20 +46,42 @@ def decrypt_security_token(security_token: str) -> (str, str):
     return key, nonce
 
 
+def decryptor_ctr(key: bytes, nonce: bytes, offset: int = 0):
+    """
+    Creates an AES-CTR decryptor, which is positioned at the given byte `offset` of the stream. The counter is
+    seeked to the block containing `offset` and the keystream is advanced to the exact byte within this block.
+    Thus, any part of an encrypted stream can be decrypted without processing the bytes before it.
+
+    Args:
+      key (bytes): The audio stream decryption key.
+      nonce (bytes): The audio stream nonce.
+      offset (int): Byte offset within the encrypted stream. Defaults to 0.
+
+    Returns:
+      The AES-CTR cipher object. Use its `decrypt` method for consecutive chunks of the stream.
+    """
+    block_index, block_offset = divmod(offset, AES.block_size)
+    counter = Counter.new(64, prefix=nonce, initial_value=block_index)
+    decryptor = AES.new(key, AES.MODE_CTR, counter=counter)
+
+    # Advance the keystream to the exact byte position within the block.
+    if block_offset:
+        decryptor.decrypt(bytes(block_offset))
+
+    return decryptor
+
+
 def decrypt_file(path_file_encrypted: pathlib.Path, path_file_destination: pathlib.Path, key: str, nonce: str) -> None:
     """
-    Decrypts an encrypted MQA file given the file, key and nonce.
+    Decrypts an encrypted MQA file given the file, key and nonce. The file is processed in chunks of
+    `CHUNK_SIZE`, so memory usage stays bounded regardless of the file size.
     TODO: Is it really only necessary for MQA of for all other formats, too?
     """
 
     # Initialize counter and file decryptor
-    counter = Counter.new(64, prefix=nonce, initial_value=0)
-    decryptor = AES.new(key, AES.MODE_CTR, counter=counter)
-
-    # Open and decrypt
-    with path_file_encrypted.open("rb") as f_src:
-        audio_decrypted = decryptor.decrypt(f_src.read())
+    decryptor = decryptor_ctr(key, nonce)
 
-        # Replace with decrypted file
-        with path_file_destination.open("wb") as f_dst:
-            f_dst.write(audio_decrypted)
+    # Open and decrypt chunk by chunk
+    with path_file_encrypted.open("rb") as f_src, path_file_destination.open("wb") as f_dst:
+        while chunk := f_src.read(CHUNK_SIZE):
+            f_dst.write(decryptor.decrypt(chunk))
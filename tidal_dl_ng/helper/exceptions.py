@@ -12,3 +12,15 @@ class UnknownManifestFormat(Exception):
 
 class MediaMissing(Exception):
     pass
+
+
+class RangeNotSupported(Exception):
+    pass
+
+
+class Mp4LayoutUnsupported(Exception):
+    pass
+
+
+class DownloadAborted(Exception):
+    pass
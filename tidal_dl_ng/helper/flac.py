@@ -0,0 +1,541 @@
+"""
+flac.py
+
+In-process extraction of FLAC audio from MP4 containers. The FLAC frames are copied as they are (no re-encoding),
+so no external process is needed.
+
+Classes:
+    FlacTrack: FLAC track of an MP4 container: stream info and the byte ranges of its frames.
+
+Functions:
+    flac_extract: Extract the FLAC stream of an MP4 file into a native FLAC file.
+    mp4_flac_track: Parse the box structure of an MP4 file and locate the FLAC frames (fragmented or plain).
+"""
+
+import os
+import pathlib
+import struct
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import partial
+from typing import BinaryIO
+
+from tidal_dl_ng.constants import CHUNK_SIZE
+from tidal_dl_ng.helper.exceptions import Mp4LayoutUnsupported
+
+FLAC_MARKER: bytes = b"fLaC"
+# Length of the generic part of an `AudioSampleEntry`, before its child boxes (ISO/IEC 14496-12).
+SAMPLE_ENTRY_AUDIO_SIZE: int = 28
+# Length of the STREAMINFO metadata block (without its header).
+STREAMINFO_SIZE: int = 34
+# Number of bits of the "total samples" field at the end of the packed STREAMINFO fields at offset 10.
+STREAMINFO_SAMPLES_BITS: int = 36
+# Metadata block type of PADDING and the max. length of a metadata block (24 bits).
+BLOCK_TYPE_PADDING: int = 1
+BLOCK_SIZE_MAX: int = 0xFFFFFF
+
+# `tfhd` flags.
+TFHD_BASE_DATA_OFFSET: int = 0x000001
+TFHD_SAMPLE_DESCRIPTION_INDEX: int = 0x000002
+TFHD_DEFAULT_SAMPLE_DURATION: int = 0x000008
+TFHD_DEFAULT_SAMPLE_SIZE: int = 0x000010
+TFHD_DEFAULT_SAMPLE_FLAGS: int = 0x000020
+TFHD_DEFAULT_BASE_IS_MOOF: int = 0x020000
+# `trun` flags.
+TRUN_DATA_OFFSET: int = 0x000001
+TRUN_FIRST_SAMPLE_FLAGS: int = 0x000004
+TRUN_SAMPLE_DURATION: int = 0x000100
+TRUN_SAMPLE_SIZE: int = 0x000200
+TRUN_SAMPLE_FLAGS: int = 0x000400
+TRUN_SAMPLE_COMPOSITION_TIME_OFFSET: int = 0x000800
+# Optional per sample fields of `trun`, in the order they are stored: (flag, name, struct format).
+TRUN_SAMPLE_FIELDS: tuple[tuple[int, str, str], ...] = (
+    (TRUN_SAMPLE_DURATION, "duration", "I"),
+    (TRUN_SAMPLE_SIZE, "size", "I"),
+    (TRUN_SAMPLE_FLAGS, "flags", "I"),
+    (TRUN_SAMPLE_COMPOSITION_TIME_OFFSET, "composition_time_offset", "i"),
+)
+
+
+@dataclass
+class _Box:
+    type: bytes
+    start: int
+    payload: int
+    end: int
+
+
+@dataclass
+class FlacTrack:
+    """FLAC track of an MP4 container.
+
+    Attributes:
+        track_id (int): ID of the MP4 track.
+        timescale (int): Time units per second of the sample durations.
+        metadata (bytes): FLAC metadata blocks (starting with STREAMINFO), as stored in the `dfLa` box.
+        duration (int): Sum of all sample durations, in `timescale` units.
+        sample_duration_default (int): Default sample duration of track fragments (`trex`).
+        sample_size_default (int): Default sample size of track fragments (`trex`).
+        runs (list[tuple[int, int]]): Byte ranges (offset, size) in the file, which hold the FLAC frames in order.
+    """
+
+    track_id: int = 0
+    timescale: int = 0
+    metadata: bytes = b""
+    duration: int = 0
+    sample_duration_default: int = 0
+    sample_size_default: int = 0
+    runs: list[tuple[int, int]] = field(default_factory=list)
+
+    def run_add(self, offset: int, size: int) -> None:
+        """Append a byte range of frames. Adjacent ranges are merged, so they are copied in one go.
+
+        Args:
+            offset (int): Offset in the file.
+            size (int): Number of bytes.
+        """
+        if size <= 0:
+            return
+
+        if self.runs and sum(self.runs[-1]) == offset:
+            self.runs[-1] = (self.runs[-1][0], self.runs[-1][1] + size)
+        else:
+            self.runs.append((offset, size))
+
+    def metadata_finalized(self) -> bytes:
+        """Get the metadata blocks to write into the FLAC file.
+
+        Encoders, which write fragmented MP4, often cannot know the total number of samples when the init segment
+        is written and leave it at 0. If so, it is filled in from the sample durations of the container.
+
+        Returns:
+            bytes: FLAC metadata blocks.
+        """
+        # STREAMINFO packs sample rate (20 bits), channels (3), bits per sample (5) and total samples (36).
+        offset_packed: int = 4 + 10
+        (packed,) = struct.unpack_from(">Q", self.metadata, offset_packed)
+        sample_rate: int = packed >> 44
+        mask_samples: int = (1 << STREAMINFO_SAMPLES_BITS) - 1
+
+        if packed & mask_samples or not self.duration or self.timescale != sample_rate:
+            return self.metadata
+
+        packed |= min(self.duration, mask_samples)
+
+        return self.metadata[:offset_packed] + struct.pack(">Q", packed) + self.metadata[offset_packed + 8 :]
+
+
+def _metadata_padded(metadata: bytes, padding: int) -> bytes:
+    # Append a PADDING block, which becomes the last metadata block.
+    if padding <= 0:
+        return metadata
+
+    blocks: bytearray = bytearray(metadata)
+    offset: int = 0
+
+    # Clear the "last block" flag of the former last block.
+    while offset + 4 <= len(blocks):
+        size: int = int.from_bytes(blocks[offset + 1 : offset + 4], "big")
+
+        if offset + 4 + size >= len(blocks):
+            blocks[offset] &= 0x7F
+
+            break
+
+        offset += 4 + size
+
+    size_padding: int = min(padding, BLOCK_SIZE_MAX)
+
+    return bytes(blocks) + bytes([0x80 | BLOCK_TYPE_PADDING]) + size_padding.to_bytes(3, "big") + bytes(size_padding)
+
+
+def _boxes(data: bytes, start: int = 0, end: int | None = None) -> Iterator[_Box]:
+    # Iterate over the boxes in `data[start:end]`. Offsets are relative to `data`.
+    end = len(data) if end is None else end
+    position: int = start
+
+    while position + 8 <= end:
+        size, box_type = struct.unpack_from(">I4s", data, position)
+        payload: int = position + 8
+
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", data, payload)
+            payload += 8
+        elif size == 0:
+            size = end - position
+
+        if size < payload - position or position + size > end:
+            # Invalid box size.
+            raise Mp4LayoutUnsupported
+
+        yield _Box(type=box_type, start=position, payload=payload, end=position + size)
+
+        position += size
+
+
+def _boxes_file(file: BinaryIO, size_file: int) -> Iterator[_Box]:
+    # Iterate over the top level boxes of a file, without reading their payload.
+    position: int = 0
+
+    while position + 8 <= size_file:
+        file.seek(position)
+        header: bytes = file.read(16)
+        size, box_type = struct.unpack_from(">I4s", header)
+        payload: int = position + 8
+
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", header, 8)
+            payload += 8
+        elif size == 0:
+            size = size_file - position
+
+        if size < payload - position:
+            # Invalid box size.
+            raise Mp4LayoutUnsupported
+
+        yield _Box(type=box_type, start=position, payload=payload, end=min(position + size, size_file))
+
+        position += size
+
+
+def _box_child(data: bytes, parent: _Box, *path: bytes) -> _Box | None:
+    # Descend along `path` and return the first matching box.
+    box: _Box | None = parent
+
+    for box_type in path:
+        box = next((child for child in _boxes(data, box.payload, box.end) if child.type == box_type), None)
+
+        if box is None:
+            return None
+
+    return box
+
+
+def _full_box(data: bytes, box: _Box) -> tuple[int, int]:
+    # Version and flags of a full box.
+    (version_flags,) = struct.unpack_from(">I", data, box.payload)
+
+    return version_flags >> 24, version_flags & 0xFFFFFF
+
+
+def _dfla_read(data: bytes, stbl: _Box) -> bytes | None:
+    # FLAC metadata blocks of the first `fLaC` sample entry, if there is one.
+    stsd: _Box | None = _box_child(data, stbl, b"stsd")
+
+    if stsd is None:
+        return None
+
+    for entry in _boxes(data, stsd.payload + 8, stsd.end):
+        if entry.type != FLAC_MARKER:
+            continue
+
+        for child in _boxes(data, entry.payload + SAMPLE_ENTRY_AUDIO_SIZE, entry.end):
+            if child.type == b"dfLa":
+                metadata: bytes = data[child.payload + 4 : child.end]
+                # STREAMINFO is mandatory and must be the first block.
+                if len(metadata) < 4 + STREAMINFO_SIZE or metadata[0] & 0x7F != 0:
+                    raise Mp4LayoutUnsupported
+
+                return metadata
+
+    return None
+
+
+def _stbl_runs(data: bytes, stbl: _Box, track: FlacTrack) -> None:
+    # Locate the frames of a plain (not fragmented) MP4 through its sample tables.
+    stsz: _Box | None = _box_child(data, stbl, b"stsz")
+    stsc: _Box | None = _box_child(data, stbl, b"stsc")
+    stco: _Box | None = _box_child(data, stbl, b"stco") or _box_child(data, stbl, b"co64")
+    stts: _Box | None = _box_child(data, stbl, b"stts")
+
+    if stsz is None or stsc is None or stco is None:
+        # Fragmented files have empty or no sample tables. Their frames are described by `moof` boxes.
+        return
+
+    size_sample, count_samples = struct.unpack_from(">II", data, stsz.payload + 4)
+    sizes: tuple[int, ...] = (
+        (size_sample,) * count_samples
+        if size_sample
+        else struct.unpack_from(f">{count_samples}I", data, stsz.payload + 12)
+    )
+    (count_chunks,) = struct.unpack_from(">I", data, stco.payload + 4)
+    offsets: tuple[int, ...] = struct.unpack_from(
+        f">{count_chunks}{'Q' if stco.type == b'co64' else 'I'}", data, stco.payload + 8
+    )
+    (count_entries,) = struct.unpack_from(">I", data, stsc.payload + 4)
+    entries: list[tuple[int, ...]] = [
+        struct.unpack_from(">III", data, stsc.payload + 8 + index * 12) for index in range(count_entries)
+    ]
+    index_sample: int = 0
+
+    for index_entry, (chunk_first, samples_per_chunk, _) in enumerate(entries):
+        chunk_last: int = entries[index_entry + 1][0] - 1 if index_entry + 1 < count_entries else count_chunks
+
+        for chunk in range(chunk_first, chunk_last + 1):
+            sizes_chunk: tuple[int, ...] = sizes[index_sample : index_sample + samples_per_chunk]
+            track.run_add(offsets[chunk - 1], sum(sizes_chunk))
+            index_sample += len(sizes_chunk)
+
+    if index_sample != count_samples:
+        # Sample tables are inconsistent.
+        raise Mp4LayoutUnsupported
+
+    if stts is not None:
+        (count_entries,) = struct.unpack_from(">I", data, stts.payload + 4)
+
+        for index in range(count_entries):
+            count, delta = struct.unpack_from(">II", data, stts.payload + 8 + index * 8)
+            track.duration += count * delta
+
+
+def _moov_parse(data: bytes) -> FlacTrack | None:
+    # Find the FLAC track in a `moov` box.
+    moov: _Box = next(_boxes(data))
+
+    for trak in _boxes(data, moov.payload, moov.end):
+        if trak.type != b"trak":
+            continue
+
+        stbl: _Box | None = _box_child(data, trak, b"mdia", b"minf", b"stbl")
+        metadata: bytes | None = _dfla_read(data, stbl) if stbl else None
+
+        if metadata is None:
+            continue
+
+        tkhd: _Box | None = _box_child(data, trak, b"tkhd")
+        mdhd: _Box | None = _box_child(data, trak, b"mdia", b"mdhd")
+
+        if tkhd is None or mdhd is None:
+            # Track header is missing.
+            raise Mp4LayoutUnsupported
+
+        version, _ = _full_box(data, tkhd)
+        (track_id,) = struct.unpack_from(">I", data, tkhd.payload + (20 if version == 1 else 12))
+        version, _ = _full_box(data, mdhd)
+        (timescale,) = struct.unpack_from(">I", data, mdhd.payload + (20 if version == 1 else 12))
+        track: FlacTrack = FlacTrack(track_id=track_id, timescale=timescale, metadata=metadata)
+
+        # Defaults for track fragments.
+        mvex: _Box | None = _box_child(data, moov, b"mvex")
+
+        for trex in _boxes(data, mvex.payload, mvex.end) if mvex else ():
+            if trex.type == b"trex" and struct.unpack_from(">I", data, trex.payload + 4)[0] == track_id:
+                track.sample_duration_default, track.sample_size_default = struct.unpack_from(
+                    ">II", data, trex.payload + 12
+                )
+
+        _stbl_runs(data, stbl, track)
+
+        return track
+
+    return None
+
+
+def _tfhd_read(data: bytes, tfhd: _Box, offset_moof: int, track: FlacTrack) -> tuple[int | None, int, int]:
+    # Base data offset (None if not given), default sample duration and size of a track fragment.
+    _, flags = _full_box(data, tfhd)
+    position: int = tfhd.payload + 8
+    offset_base: int | None = None
+    duration_default: int = track.sample_duration_default
+    size_default: int = track.sample_size_default
+
+    if flags & TFHD_BASE_DATA_OFFSET:
+        (offset_base,) = struct.unpack_from(">Q", data, position)
+        position += 8
+    elif flags & TFHD_DEFAULT_BASE_IS_MOOF:
+        offset_base = offset_moof
+
+    if flags & TFHD_SAMPLE_DESCRIPTION_INDEX:
+        position += 4
+
+    if flags & TFHD_DEFAULT_SAMPLE_DURATION:
+        (duration_default,) = struct.unpack_from(">I", data, position)
+        position += 4
+
+    if flags & TFHD_DEFAULT_SAMPLE_SIZE:
+        (size_default,) = struct.unpack_from(">I", data, position)
+
+    return offset_base, duration_default, size_default
+
+
+def _trun_read(
+    data: bytes, trun: _Box, offset_run: int, offset_base: int, duration_default: int, size_default: int
+) -> tuple[int, int, int]:
+    # Offset, size and duration of the samples of a track run. The samples of a run are stored back to back.
+    _, flags = _full_box(data, trun)
+    (count_samples,) = struct.unpack_from(">I", data, trun.payload + 4)
+    position: int = trun.payload + 8
+
+    if flags & TRUN_DATA_OFFSET:
+        (offset_data,) = struct.unpack_from(">i", data, position)
+        offset_run = offset_base + offset_data
+        position += 4
+
+    if flags & TRUN_FIRST_SAMPLE_FLAGS:
+        position += 4
+
+    fields: list[tuple[int, str, str]] = [entry for entry in TRUN_SAMPLE_FIELDS if flags & entry[0]]
+    names: list[str] = [name for _, name, _ in fields]
+    samples: Iterator[tuple[int, ...]] = (
+        struct.iter_unpack(
+            ">" + "".join(code for _, _, code in fields),
+            data[position : position + 4 * len(fields) * count_samples],
+        )
+        if fields
+        else iter([()] * count_samples)
+    )
+    size_run: int = 0
+    duration_run: int = 0
+
+    for values in samples:
+        sample: dict[str, int] = dict(zip(names, values, strict=True))
+        duration_run += sample.get("duration", duration_default)
+        size_run += sample.get("size", size_default)
+
+    if not size_run and count_samples:
+        # Neither the run nor any default states the sample sizes.
+        raise Mp4LayoutUnsupported
+
+    return offset_run, size_run, duration_run
+
+
+def _moof_parse(data: bytes, offset_moof: int, offset_mdat: int, track: FlacTrack) -> None:
+    # Locate the frames of a movie fragment. `data` is the `moof` box, which starts at `offset_moof` in the file.
+    for traf in _boxes(data, 8):
+        tfhd: _Box | None = _box_child(data, traf, b"tfhd") if traf.type == b"traf" else None
+
+        if tfhd is None or struct.unpack_from(">I", data, tfhd.payload + 4)[0] != track.track_id:
+            continue
+
+        offset_base, duration_default, size_default = _tfhd_read(data, tfhd, offset_moof, track)
+        # Without an explicit data offset, a run continues where the previous one ended. The first one starts at
+        # the base offset, which is assumed to be the payload of the following `mdat` if it is not given.
+        offset_run: int = offset_mdat if offset_base is None else offset_base
+
+        for trun in _boxes(data, traf.payload, traf.end):
+            if trun.type != b"trun":
+                continue
+
+            offset_run, size_run, duration_run = _trun_read(
+                data,
+                trun,
+                offset_run,
+                offset_moof if offset_base is None else offset_base,
+                duration_default,
+                size_default,
+            )
+            track.run_add(offset_run, size_run)
+            track.duration += duration_run
+            offset_run += size_run
+
+
+def _box_parse(file: BinaryIO, box: _Box, fn_parse: Callable[[bytes], FlacTrack | None]) -> FlacTrack | None:
+    # Read a whole box into memory and parse it.
+    file.seek(box.start)
+    data: bytes = file.read(box.end - box.start)
+
+    try:
+        return fn_parse(data)
+    except struct.error as e:
+        # The box is truncated.
+        raise Mp4LayoutUnsupported from e
+
+
+def mp4_flac_track(file: BinaryIO) -> FlacTrack:
+    """Parse the box structure of an MP4 file and locate the FLAC frames.
+
+    Fragmented files (`moov` followed by `moof` / `mdat` pairs, as delivered by DASH) and plain files (sample
+    tables in `stbl`) are supported. Only box headers and the (small) `moov` / `moof` boxes are read.
+
+    Args:
+        file (BinaryIO): Seekable MP4 file.
+
+    Raises:
+        Mp4LayoutUnsupported: The file has no FLAC track or a layout, which cannot be handled.
+
+    Returns:
+        FlacTrack: Stream info and byte ranges of the FLAC frames.
+    """
+    size_file: int = os.fstat(file.fileno()).st_size
+    track: FlacTrack | None = None
+    boxes: list[_Box] = list(_boxes_file(file, size_file))
+
+    for index, box in enumerate(boxes):
+        if box.type == b"moov":
+            track = _box_parse(file, box, _moov_parse)
+        elif box.type == b"moof":
+            if track is None:
+                # Movie fragment before the movie header.
+                raise Mp4LayoutUnsupported
+
+            box_next: _Box | None = boxes[index + 1] if index + 1 < len(boxes) else None
+            offset_mdat: int = box_next.payload if box_next and box_next.type == b"mdat" else box.end
+
+            _box_parse(file, box, partial(_moof_parse, offset_moof=box.start, offset_mdat=offset_mdat, track=track))
+
+    # No FLAC track, no frames or frames outside of the file.
+    if track is None or not track.runs or any(offset + size > size_file for offset, size in track.runs):
+        raise Mp4LayoutUnsupported
+
+    # Every sample must start with a FLAC frame header (sync code 0xFFF8 / 0xFFF9). If not, the file is either
+    # still encrypted or it was not parsed correctly.
+    file.seek(track.runs[0][0])
+    sync: bytes = file.read(2)
+
+    if len(sync) < 2 or sync[0] != 0xFF or sync[1] & 0xFE != 0xF8:
+        raise Mp4LayoutUnsupported
+
+    return track
+
+
+def flac_extract(path_src: pathlib.Path, path_dst: pathlib.Path, padding: int = 0) -> pathlib.Path:
+    """Extract the FLAC stream of an MP4 file into a native FLAC file, without re-encoding.
+
+    The stream info is taken from the `dfLa` box, the frames are copied byte by byte from the `mdat` boxes.
+    Tags are not copied, since they are written afterwards anyway. Room for them can be reserved with `padding`, so
+    writing them later does not move the audio frames (which would rewrite the whole file).
+
+    Args:
+        path_src (pathlib.Path): Path to the MP4 file.
+        path_dst (pathlib.Path): Path to the FLAC file to create. It is overwritten if it exists.
+        padding (int, optional): Size of the PADDING block to reserve for tags in bytes. Defaults to 0.
+
+    Raises:
+        Mp4LayoutUnsupported: The file has no FLAC track or a layout, which cannot be handled. `path_dst` is not
+            created in this case.
+
+    Returns:
+        pathlib.Path: `path_dst`
+    """
+    with open(path_src, "rb") as f_src:
+        track: FlacTrack = mp4_flac_track(f_src)
+
+        try:
+            with open(path_dst, "wb") as f_dst:
+                f_dst.write(FLAC_MARKER)
+                f_dst.write(_metadata_padded(track.metadata_finalized(), padding))
+                _runs_copy(f_src, f_dst, track.runs)
+        except BaseException:
+            path_dst.unlink(missing_ok=True)
+
+            raise
+
+    return path_dst
+
+
+def _runs_copy(f_src: BinaryIO, f_dst: BinaryIO, runs: list[tuple[int, int]]) -> None:
+    # Copy byte ranges through one reused buffer.
+    buffer: memoryview = memoryview(bytearray(CHUNK_SIZE))
+
+    for offset, size in runs:
+        f_src.seek(offset)
+
+        while size > 0:
+            size_read: int = f_src.readinto(buffer[: min(size, CHUNK_SIZE)])
+
+            if not size_read:
+                # The file has been truncated meanwhile.
+                raise Mp4LayoutUnsupported
+
+            f_dst.write(buffer[:size_read])
+            size -= size_read
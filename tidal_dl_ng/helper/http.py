@@ -0,0 +1,179 @@
+"""
+http.py
+
+Process-wide HTTP connection pool used by every network consumer of the downloader (segments, HEAD requests,
+cover art, m3u8 playlists), and the event loop of the asyncio download engine.
+
+Classes:
+    SessionHttp: Singleton holding a keep-alive `requests.Session` sized from the concurrency settings.
+    SessionHttpAsync: Singleton running an event loop in a background thread with a shared `httpx.AsyncClient`.
+
+Functions:
+    connections_max_default: Max. number of concurrent connections from the settings.
+    error_is_congestion: Check if a request error indicates an overloaded server or network.
+    error_is_transient: Check if a failed request is worth to be retried.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from threading import Thread
+from typing import Any, TypeVar
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from tidal_dl_ng.config import Settings
+from tidal_dl_ng.constants import REQUESTS_TIMEOUT_SEC
+from tidal_dl_ng.helper.decorator import SingletonMeta
+
+# Number of distinct hosts (CDN edges, image servers, API) to keep connection pools for.
+POOL_CONNECTIONS: int = 10
+# Number of retries for failed connection attempts. Failed responses and interrupted transfers are not retried by
+# the transport: The segment download retries them itself, while it is not holding a connection slot.
+RETRIES_MAX: int = 5
+
+T = TypeVar("T")
+
+
+def connections_max_default() -> int:
+    """Get the max. number of concurrent connections of the process from the settings.
+
+    Returns:
+        int: `downloads_connections_max`
+    """
+    return Settings().data.downloads_connections_max
+
+
+def error_is_congestion(error: BaseException | None) -> bool:
+    """Check if a request error indicates an overloaded server or network (HTTP 429 / 5xx, timeouts).
+
+    Args:
+        error (BaseException | None): Error raised by a `requests` or `httpx` request.
+
+    Returns:
+        bool: True if the error is a sign of congestion.
+    """
+    response: requests.Response | httpx.Response | None = (
+        error.response if isinstance(error, requests.HTTPError | httpx.HTTPStatusError) else None
+    )
+    status_code: int = response.status_code if response is not None else 0
+
+    # Connection errors of `requests` include read timeouts while streaming and exhausted retries.
+    is_timeout: bool = isinstance(error, requests.Timeout | requests.ConnectionError | httpx.TimeoutException)
+
+    return status_code == 429 or status_code >= 500 or is_timeout
+
+
+def error_is_transient(error: BaseException | None) -> bool:
+    """Check if a failed request is worth to be retried (congestion or an interrupted transfer).
+
+    Args:
+        error (BaseException | None): Error raised by a `requests` or `httpx` request.
+
+    Returns:
+        bool: True if a retry might succeed.
+    """
+    return error_is_congestion(error) or isinstance(
+        error, requests.exceptions.ChunkedEncodingError | httpx.TransportError
+    )
+
+
+class SessionHttp(metaclass=SingletonMeta):
+    """Shared `requests.Session` with a connection pool, so TCP / TLS handshakes are reused across requests."""
+
+    session: requests.Session
+    pool_size: int
+
+    def __init__(self, pool_size: int | None = None):
+        """Create the pooled session.
+
+        Args:
+            pool_size (int | None, optional): Max. number of keep-alive connections per host. If not given,
+                `downloads_connections_max` is used. Defaults to None.
+        """
+        if pool_size is None:
+            pool_size = connections_max_default()
+
+        self.pool_size = max(pool_size, 1)
+        self.session = self.session_create(self.pool_size)
+
+    @staticmethod
+    def session_create(pool_size: int) -> requests.Session:
+        """Create a session with keep-alive connection pools and connection retries mounted for HTTP and HTTPS.
+
+        Args:
+            pool_size (int): Max. number of keep-alive connections per host.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session: requests.Session = requests.Session()
+        # Only retry connection attempts right away, like the transport of the asyncio engine does. Responses (also
+        # with `Retry-After`) and read errors are passed on, so they are retried only once, by the caller.
+        retries: Retry = Retry(
+            total=RETRIES_MAX,
+            read=0,
+            status=0,
+            backoff_factor=0,
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=pool_size, max_retries=retries
+        )
+
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+
+class SessionHttpAsync(metaclass=SingletonMeta):
+    """Event loop in a dedicated background thread with a shared `httpx.AsyncClient`.
+
+    All segment requests of all items are run as coroutines on this one loop, instead of occupying one OS thread per
+    request. The number of simultaneous requests is limited by the `ConnectionScheduler`. Synchronous callers
+    (worker threads of `Download.items`) submit coroutines with `run`. Since the loop runs in its own thread,
+    callers, which already run inside an event loop (e.g. the MCP server), can use it too.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    client: httpx.AsyncClient
+    connections_max: int
+
+    def __init__(self, connections_max: int | None = None):
+        """Start the event loop thread and create the client.
+
+        Args:
+            connections_max (int | None, optional): Max. number of concurrent (and keep-alive) connections. If not
+                given, `downloads_connections_max` is used. Defaults to None.
+        """
+        if connections_max is None:
+            connections_max = connections_max_default()
+
+        self.connections_max = max(connections_max, 1)
+        self.loop = asyncio.new_event_loop()
+
+        Thread(target=self.loop.run_forever, name="tidal-dl-ng-asyncio", daemon=True).start()
+        # The client must be created on the loop it is used with.
+        self.run(self._setup())
+
+    async def _setup(self) -> None:
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=self.connections_max, max_keepalive_connections=self.connections_max
+        )
+        # Failed connection attempts are retried by the transport.
+        transport: httpx.AsyncHTTPTransport = httpx.AsyncHTTPTransport(limits=limits, retries=RETRIES_MAX)
+        self.client = httpx.AsyncClient(transport=transport, timeout=REQUESTS_TIMEOUT_SEC, follow_redirects=True)
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the event loop thread and block until it is done.
+
+        Args:
+            coroutine (Coroutine[Any, Any, T]): The coroutine to run.
+
+        Returns:
+            T: Result of the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
@@ -0,0 +1,66 @@
+"""
+inflight.py
+
+Process-wide registry of running downloads, so identical items (e.g. a track in several lists) are downloaded once.
+
+Classes:
+    InFlight: Single-flight registry of downloads by a key, e.g. (track ID, quality).
+"""
+
+import pathlib
+from collections.abc import Hashable
+from concurrent import futures
+from threading import Lock
+
+from tidal_dl_ng.helper.decorator import SingletonMeta
+
+
+class InFlight(metaclass=SingletonMeta):
+    """Register running downloads by a key, so concurrent requests for the same item share one download.
+
+    The first caller of `claim` owns the download and must call `finish` once the item has reached its destination
+    (or has failed). Every other caller gets the future of the owner, which resolves to the destination file, so it
+    can link or copy the result instead of downloading the item once more. If the owner fails, the future resolves
+    to None and the next caller of `claim` becomes the owner.
+    """
+
+    lock: Lock
+    flights: dict[Hashable, futures.Future]
+
+    def __init__(self):
+        """Create the registry without any running downloads."""
+        self.lock = Lock()
+        self.flights = {}
+
+    def claim(self, key: Hashable) -> tuple[bool, futures.Future]:
+        """Register a download, unless the same item is being downloaded already.
+
+        Args:
+            key (Hashable): Key of the item, e.g. (track ID, quality).
+
+        Returns:
+            tuple[bool, futures.Future]: (Whether the caller owns the download, future of the destination file)
+        """
+        with self.lock:
+            future: futures.Future | None = self.flights.get(key)
+
+            if future is not None:
+                return False, future
+
+            future = futures.Future()
+            self.flights[key] = future
+
+            return True, future
+
+    def finish(self, key: Hashable, path_file: pathlib.Path | None) -> None:
+        """Unregister a download and hand its result to the waiting callers.
+
+        Args:
+            key (Hashable): Key of the item.
+            path_file (pathlib.Path | None): Destination file or None, if the download has failed.
+        """
+        with self.lock:
+            future: futures.Future | None = self.flights.pop(key, None)
+
+        if future is not None:
+            future.set_result(path_file)
@@ -0,0 +1,194 @@
+"""
+jobs.py
+
+Persistent job queue of a list download (album, playlist, mix), which tracks the state of every item.
+
+Classes:
+    JobQueue: States of the items of a list, persisted in the staging directory, so they survive restarts.
+    ListDownload: State of a list, whose items are downloaded together with the items of other lists.
+
+Functions:
+    job_key: Key of a list item in the job queue.
+"""
+
+import os
+import pathlib
+import time
+from collections.abc import Iterable
+from concurrent import futures
+from dataclasses import dataclass, field
+from json import JSONDecodeError
+from threading import Lock
+
+from rich.progress import TaskID
+from tidalapi import Album, Mix, Playlist, UserPlaylist
+
+from tidal_dl_ng.constants import QueueDownloadStatus
+from tidal_dl_ng.helper.prefetch import LookAhead
+from tidal_dl_ng.helper.tidal import AlbumCache
+from tidal_dl_ng.model.downloader import JobItem, JobList
+
+# States, in which an item still needs to be downloaded.
+STATUS_TODO: tuple[QueueDownloadStatus, ...] = (QueueDownloadStatus.Waiting, QueueDownloadStatus.Failed)
+# Min. seconds between two writes of the queue file. Lost updates only cause items to be checked once more.
+SAVE_INTERVAL_SEC: float = 2.0
+
+
+def job_key(position: int, item_id: int | str) -> str:
+    """Get the key of a list item in the job queue.
+
+    A list can contain the same item more than once (e.g. a playlist), so the key includes the position.
+
+    Args:
+        position (int): Position of the item in the list, starting at 0.
+        item_id (int | str): ID of the item.
+
+    Returns:
+        str: Key of the item.
+    """
+    return f"{position}:{item_id}"
+
+
+class JobQueue:
+    """Track the state of every item of a list download.
+
+    An item is pending (`Waiting`), running (`Downloading`), done (`Finished`), `Failed` or `Skipped`. Only pending
+    and failed items are (re-)submitted, so a restart or a retry does not walk through the whole list again.
+    Items, which were running when the process died, are pending again. Once every item is done, the queue file is
+    removed.
+    """
+
+    path_file: pathlib.Path | None
+    data: JobList
+    lock: Lock
+    time_saved: float
+
+    def __init__(self, path_file: pathlib.Path | None, keys: Iterable[str], resume: bool = True):
+        """Create the queue and load the states of a former run.
+
+        Args:
+            path_file (pathlib.Path | None): Path to the JSON queue file. None keeps the queue in memory only.
+            keys (Iterable[str]): Keys of the list items (see `job_key`).
+            resume (bool, optional): Take over the states of a former run. Otherwise, all items are pending.
+                Defaults to True.
+        """
+        self.path_file = path_file
+        self.lock = Lock()
+        self.time_saved = 0.0
+        data_old: JobList = self._load() if resume else JobList()
+        self.data = JobList()
+
+        for key in keys:
+            item: JobItem = data_old.items.get(key) or JobItem()
+
+            if item.status == QueueDownloadStatus.Downloading:
+                item.status = QueueDownloadStatus.Waiting
+
+            self.data.items[key] = item
+
+    def _load(self) -> JobList:
+        if not self.path_file:
+            return JobList()
+
+        try:
+            return JobList.from_json(self.path_file.read_text(encoding="utf-8"))
+        except (OSError, JSONDecodeError, KeyError, TypeError, ValueError):
+            return JobList()
+
+    def todo(self, key: str) -> bool:
+        """Check, if an item still needs to be downloaded.
+
+        Args:
+            key (str): Key of the item.
+
+        Returns:
+            bool: True if the item is pending or has failed.
+        """
+        with self.lock:
+            return self.data.items[key].status in STATUS_TODO
+
+    def count_todo(self) -> int:
+        """Count the items, which still need to be downloaded.
+
+        Returns:
+            int: Number of pending and failed items.
+        """
+        with self.lock:
+            return sum(item.status in STATUS_TODO for item in self.data.items.values())
+
+    def status_set(self, key: str, status: QueueDownloadStatus, path_file: pathlib.Path | str = "") -> None:
+        """Update the state of an item and persist the queue from time to time.
+
+        Args:
+            key (str): Key of the item.
+            status (QueueDownloadStatus): New state.
+            path_file (pathlib.Path | str, optional): Destination file of the item, if known. Defaults to "".
+        """
+        with self.lock:
+            item: JobItem = self.data.items[key]
+            item.status = status
+
+            if path_file:
+                item.path_file = str(path_file)
+
+            if time.monotonic() - self.time_saved >= SAVE_INTERVAL_SEC:
+                self._save()
+
+    def paths_file(self) -> list[pathlib.Path]:
+        """Get the destination files of all items, including the ones of former runs.
+
+        Returns:
+            list[pathlib.Path]: Destination files.
+        """
+        with self.lock:
+            return [pathlib.Path(item.path_file) for item in self.data.items.values() if item.path_file]
+
+    def close(self) -> None:
+        """Persist the queue, or remove it if there is nothing left to do."""
+        with self.lock:
+            if not self.path_file:
+                return
+
+            if any(item.status in STATUS_TODO for item in self.data.items.values()):
+                self._save()
+            else:
+                self.path_file.unlink(missing_ok=True)
+
+    def _save(self) -> None:
+        # Write atomically, so a crash never leaves a half written queue behind.
+        self.time_saved = time.monotonic()
+
+        if not self.path_file:
+            return
+
+        os.makedirs(self.path_file.parent, exist_ok=True)
+
+        path_tmp: pathlib.Path = self.path_file.with_suffix(".tmp")
+
+        path_tmp.write_text(self.data.to_json(), encoding="utf-8")
+
+        os.replace(path_tmp, self.path_file)
+
+
+@dataclass
+class ListDownload:
+    """State of a list, whose items are downloaded through the shared dispatcher together with other lists."""
+
+    media: Album | Playlist | UserPlaylist | Mix
+    name: str
+    file_name_relative: str
+    items: list
+    jobs: JobQueue
+    albums: AlbumCache
+    look_ahead: LookAhead
+    progress_task: TaskID
+    progress_stdout: bool
+    futures_postprocess: list[futures.Future] = field(default_factory=list)
+
+    @property
+    def is_album(self) -> bool:
+        return isinstance(self.media, Album)
+
+    @property
+    def sort_by_track_num(self) -> bool:
+        return "album_track_num" in self.file_name_relative or "list_pos" in self.file_name_relative
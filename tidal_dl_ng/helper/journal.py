@@ -0,0 +1,128 @@
+"""
+journal.py
+
+On-disk journal of completed segments, which allows interrupted downloads to be resumed at segment granularity.
+
+Classes:
+    DownloadJournal: Loads, verifies and updates the journal of a single staged download.
+"""
+
+import hashlib
+import os
+import pathlib
+import time
+from json import JSONDecodeError
+from threading import Lock
+
+from tidal_dl_ng.constants import CHUNK_SIZE
+from tidal_dl_ng.model.downloader import Journal, JournalSegment
+
+# The journal is written after this many new segments or seconds, whichever comes first. Segments, which were not
+# journaled before a crash, are only downloaded once more.
+SAVE_SEGMENTS: int = 16
+SAVE_INTERVAL_SEC: float = 2.0
+
+
+class DownloadJournal:
+    """Journal of the gapless prefix of segments, which has already been written to a staged data file."""
+
+    path_file: pathlib.Path
+    data: Journal
+    lock: Lock
+    segments_unsaved: int
+    time_saved: float
+
+    def __init__(self, path_file: pathlib.Path):
+        """Initialize the journal.
+
+        Args:
+            path_file (pathlib.Path): Path to the JSON journal file.
+        """
+        self.path_file = path_file
+        self.data = Journal()
+        self.lock = Lock()
+        self.segments_unsaved = 0
+        self.time_saved = time.monotonic()
+
+    def load(self, fingerprint: str, segments_count: int) -> None:
+        """Load the journal from disk. It is reset, if it belongs to a different stream layout.
+
+        Args:
+            fingerprint (str): Identifies the stream (e.g. media, quality and size). Must be stable across restarts.
+            segments_count (int): Total number of segments of the stream.
+        """
+        try:
+            data: Journal = Journal.from_json(self.path_file.read_text(encoding="utf-8"))
+        except (OSError, JSONDecodeError, KeyError, TypeError, ValueError):
+            data = Journal()
+
+        if data.fingerprint != fingerprint or data.segments_count != segments_count:
+            data = Journal(fingerprint=fingerprint, segments_count=segments_count)
+
+        self.data = data
+
+    def verify(self, path_data: pathlib.Path) -> None:
+        """Check the journaled segments against the staged data file and drop everything from the first mismatch.
+
+        Args:
+            path_data (pathlib.Path): Path to the staged data file.
+        """
+        segments_valid: list[JournalSegment] = []
+
+        try:
+            with path_data.open("rb") as f:
+                for segment in self.data.segments:
+                    hash_segment = hashlib.sha256()
+                    size_remaining: int = segment.size
+
+                    while size_remaining > 0 and (chunk := f.read(min(size_remaining, CHUNK_SIZE))):
+                        hash_segment.update(chunk)
+                        size_remaining -= len(chunk)
+
+                    if size_remaining or hash_segment.hexdigest() != segment.checksum:
+                        break
+
+                    segments_valid.append(segment)
+        except OSError:
+            segments_valid = []
+
+        self.data.segments = segments_valid
+
+    def resume_point(self) -> tuple[int, int]:
+        """Get the position to resume the download from.
+
+        Returns:
+            tuple[int, int]: (Index of the next segment to download, byte offset in the data file)
+        """
+        return len(self.data.segments), sum(segment.size for segment in self.data.segments)
+
+    def segment_add(self, index: int, size: int, checksum: str) -> None:
+        """Record a completely written segment. The journal is persisted every few segments or seconds.
+
+        Args:
+            index (int): Segment index.
+            size (int): Size of the segment in bytes.
+            checksum (str): SHA-256 hex digest of the segment data.
+        """
+        with self.lock:
+            self.data.segments.append(JournalSegment(index=index, size=size, checksum=checksum))
+            self.segments_unsaved += 1
+
+            if self.segments_unsaved >= SAVE_SEGMENTS or time.monotonic() - self.time_saved >= SAVE_INTERVAL_SEC:
+                self.save()
+
+    def flush(self) -> None:
+        """Persist segments, which have been recorded since the last save."""
+        with self.lock:
+            if self.segments_unsaved:
+                self.save()
+
+    def save(self) -> None:
+        """Persist the journal atomically, so a crash never leaves a half written journal behind."""
+        self.segments_unsaved = 0
+        self.time_saved = time.monotonic()
+        path_tmp: pathlib.Path = self.path_file.with_suffix(".tmp")
+
+        path_tmp.write_text(self.data.to_json(), encoding="utf-8")
+
+        os.replace(path_tmp, self.path_file)
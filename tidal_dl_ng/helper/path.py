@@ -1,8 +1,10 @@
+import errno
 import math
 import os
 import pathlib
 import posixpath
 import re
+import shutil
 import sys
 from copy import deepcopy
 from urllib.parse import unquote, urlsplit
@@ -14,6 +16,7 @@ from tidalapi.media import AudioExtensions
 
 from tidal_dl_ng import __name_display__
 from tidal_dl_ng.constants import (
+    EXTENSION_PART,
     FILENAME_LENGTH_MAX,
     FILENAME_SANITIZE_PLACEHOLDER,
     FORMAT_TEMPLATE_EXPLICIT,
@@ -620,3 +623,111 @@ def url_to_filename(url: str) -> str:
         raise ValueError  # reject '%2f' or 'dir%5Cbasename.ext' on Windows
 
     return basename
+
+
+def path_existing_ancestor(path: pathlib.Path) -> pathlib.Path:
+    """Find the path itself or its nearest ancestor, which exists.
+
+    Args:
+        path (pathlib.Path): Path, which might not exist (yet).
+
+    Returns:
+        pathlib.Path: Existing path.
+    """
+    path = path.expanduser().absolute()
+
+    while not path.exists() and path != path.parent:
+        path = path.parent
+
+    return path
+
+
+def path_same_device(path_a: pathlib.Path, path_b: pathlib.Path) -> bool:
+    """Check if two paths are on the same file system, so files can be renamed (instead of copied) between them.
+
+    Paths, which do not exist yet, are checked by their nearest existing ancestor.
+
+    Args:
+        path_a (pathlib.Path): First path.
+        path_b (pathlib.Path): Second path.
+
+    Returns:
+        bool: True if both are on the same device.
+    """
+    return path_existing_ancestor(path_a).stat().st_dev == path_existing_ancestor(path_b).stat().st_dev
+
+
+def file_move(path_src: pathlib.Path, path_dst: pathlib.Path) -> bool:
+    """Move a file, replacing an existing destination file.
+
+    On the same file system the file is renamed, which is atomic. Across file systems it is copied next to the
+    destination first and renamed afterward, so an incomplete file never shows up under the destination name.
+
+    Args:
+        path_src (pathlib.Path): File to move.
+        path_dst (pathlib.Path): Destination file path.
+
+    Returns:
+        bool: True if the file was renamed, False if it had to be copied (cross-device).
+    """
+    try:
+        os.replace(path_src, path_dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    else:
+        return True
+
+    path_dst_part: pathlib.Path = path_dst.with_name(path_dst.name + EXTENSION_PART)
+
+    try:
+        shutil.copy2(path_src, path_dst_part)
+        os.replace(path_dst_part, path_dst)
+    except BaseException:
+        path_dst_part.unlink(missing_ok=True)
+
+        raise
+
+    os.unlink(path_src)
+
+    return False
+
+
+def file_link(path_src: pathlib.Path, path_dst: pathlib.Path) -> bool:
+    """Put the content of a file at another path, replacing an existing destination file.
+
+    A hard link is created if possible, otherwise the file is copied. A symlink is recreated, so it points to the
+    same target. The new file is created next to the destination first and renamed afterward, so an incomplete file
+    never shows up under the destination name.
+
+    Args:
+        path_src (pathlib.Path): Existing file.
+        path_dst (pathlib.Path): Destination file path.
+
+    Returns:
+        bool: True if the file was linked, False if it had to be copied.
+    """
+    path_dst_part: pathlib.Path = path_dst.with_name(path_dst.name + EXTENSION_PART)
+    linked: bool = True
+
+    path_dst_part.unlink(missing_ok=True)
+
+    try:
+        if path_src.is_symlink():
+            path_dst_part.symlink_to(path_src.resolve().relative_to(path_dst.parent, walk_up=True))
+        else:
+            try:
+                os.link(path_src, path_dst_part)
+            except OSError:
+                # Different file systems or no support for hard links.
+                shutil.copy2(path_src, path_dst_part)
+
+                linked = False
+
+        os.replace(path_dst_part, path_dst)
+    except BaseException:
+        path_dst_part.unlink(missing_ok=True)
+
+        raise
+
+    return linked
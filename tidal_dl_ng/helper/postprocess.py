@@ -0,0 +1,73 @@
+"""
+postprocess.py
+
+Process-wide worker pool for the post-processing stage of downloads, which runs in parallel to the network stage.
+
+Classes:
+    PostProcessPool: Bounded pool, which converts / remuxes, tags and moves downloaded items.
+"""
+
+import os
+from collections.abc import Callable
+from concurrent import futures
+from threading import Event, Semaphore
+from typing import Any
+
+from tidal_dl_ng.config import Settings
+from tidal_dl_ng.constants import WAIT_TIMEOUT_SEC
+from tidal_dl_ng.helper.decorator import SingletonMeta
+
+# Number of jobs per worker, which may be queued (including the running ones) before `submit` blocks.
+QUEUE_JOBS_PER_WORKER: int = 2
+
+
+class PostProcessPool(metaclass=SingletonMeta):
+    """Run the CPU / disk bound stage of downloads (FLAC extraction, video conversion, metadata, moving files).
+
+    A download worker hands its finished item over and continues with the next download right away, so the network
+    stage and the post-processing stage overlap instead of taking turns on the same thread.
+
+    The queue is bounded: If post-processing falls behind, `submit` blocks until a job is done (back pressure), so
+    downloaded items cannot pile up in the staging directories.
+    """
+
+    workers: int
+    executor: futures.ThreadPoolExecutor
+    slots: Semaphore
+
+    def __init__(self, workers: int | None = None):
+        """Create the pool.
+
+        Args:
+            workers (int | None, optional): Number of items post-processed at once. 0 means one per CPU core. If not
+                given, `downloads_postprocess_max` is used. Defaults to None.
+        """
+        if workers is None:
+            workers = Settings().data.downloads_postprocess_max
+
+        self.workers = workers if workers > 0 else os.cpu_count() or 1
+        self.executor = futures.ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="tidal-dl-ng-postprocess"
+        )
+        self.slots = Semaphore(self.workers * QUEUE_JOBS_PER_WORKER)
+
+    def submit(self, fn: Callable[[], Any], event_abort: Event | None = None) -> futures.Future | None:
+        """Queue a job. Blocks while the queue is full.
+
+        Args:
+            fn (Callable[[], Any]): Job to run.
+            event_abort (Event | None, optional): If set while waiting for a free place in the queue, give up.
+                Defaults to None.
+
+        Returns:
+            futures.Future | None: Future of the job, or None if aborted before it was queued.
+        """
+        while not self.slots.acquire(timeout=WAIT_TIMEOUT_SEC):
+            if event_abort and event_abort.is_set():
+                return None
+
+        future: futures.Future = self.executor.submit(fn)
+
+        future.add_done_callback(lambda _: self.slots.release())
+
+        return future
@@ -0,0 +1,139 @@
+"""
+prefetch.py
+
+Process-wide worker pool for requests, which are not on the critical path of a download (lyrics, cover art, stream
+manifests of the next items), so they run while the audio is downloading instead of before or after it.
+
+Classes:
+    PrefetchPool: Small pool, which fetches data of items in the background.
+    LookAhead: Resolve data of the next items of a list, while the current ones are downloading.
+"""
+
+import time
+from collections.abc import Callable, Sequence
+from concurrent import futures
+from threading import Lock
+from typing import Any
+
+from tidal_dl_ng.helper.decorator import SingletonMeta
+
+# Number of requests running at once. They are small and mostly wait for the network.
+PREFETCH_WORKERS: int = 4
+
+
+class PrefetchPool(metaclass=SingletonMeta):
+    """Fetch data, which is needed only after a download has finished, in parallel to the download.
+
+    The caller submits the requests as soon as an item is resolved and joins their futures, when it needs the data.
+    Errors are raised by `Future.result()`, so they surface where the data is used.
+    """
+
+    executor: futures.ThreadPoolExecutor
+
+    def __init__(self, workers: int = PREFETCH_WORKERS):
+        """Create the pool.
+
+        Args:
+            workers (int, optional): Number of requests running at once. Defaults to PREFETCH_WORKERS.
+        """
+        self.executor = futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tidal-dl-ng-prefetch")
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> futures.Future:
+        """Start fetching in the background.
+
+        Args:
+            fn (Callable[..., Any]): Function, which fetches the data.
+            *args (Any): Arguments of `fn`.
+
+        Returns:
+            futures.Future: Future of the data.
+        """
+        return self.executor.submit(fn, *args)
+
+
+class LookAhead:
+    """Resolve data of the next items of a list in the background, e.g. stream manifests.
+
+    Whenever a worker takes the data of an item, the data of the following `depth` items is requested, so it is
+    ready when their workers start. Data older than `ttl` seconds is dropped (e.g. signed URLs, which expire), then
+    the worker has to resolve it on its own.
+    """
+
+    items: Sequence[Any]
+    fn_fetch: Callable[[int, Any], Any]
+    depth: int
+    ttl: float
+    pool: PrefetchPool
+    lock: Lock
+    fetches: dict[int, tuple[float, futures.Future]]
+    position_next: int
+
+    def __init__(
+        self,
+        items: Sequence[Any],
+        fn_fetch: Callable[[int, Any], Any],
+        depth: int,
+        ttl: float,
+        pool: PrefetchPool | None = None,
+    ):
+        """Prepare the look-ahead. Nothing is requested before the first `take`.
+
+        Args:
+            items (Sequence[Any]): Items of the list in the order they are processed.
+            fn_fetch (Callable[[int, Any], Any]): Resolves the data of an item, given its index in `items` and the
+                item. It can return None, e.g. if the item does not need to be resolved.
+            depth (int): Number of items to resolve ahead of the current one. 0 disables the look-ahead.
+            ttl (float): Seconds, after which resolved data is considered expired.
+            pool (PrefetchPool | None, optional): Pool to run the requests in. Defaults to the shared pool.
+        """
+        self.items = items
+        self.fn_fetch = fn_fetch
+        self.depth = max(depth, 0)
+        self.ttl = ttl
+        self.pool = pool or PrefetchPool()
+        self.lock = Lock()
+        self.fetches = {}
+        self.position_next = 0
+
+    def take(self, position: int) -> Any | None:
+        """Get the resolved data of an item and request the data of the following items.
+
+        Args:
+            position (int): Index of the item in `items`.
+
+        Returns:
+            Any | None: Data of the item or None, if it was not requested ahead, has failed or has expired.
+        """
+        with self.lock:
+            fetch: tuple[float, futures.Future] | None = self.fetches.pop(position, None)
+
+            # Never request items, which have been taken already.
+            self.position_next = max(self.position_next, position + 1)
+
+            while self.position_next <= min(position + self.depth, len(self.items) - 1):
+                self.fetches[self.position_next] = (
+                    time.monotonic(),
+                    self.pool.submit(self.fn_fetch, self.position_next, self.items[self.position_next]),
+                )
+                self.position_next += 1
+
+        if fetch is None:
+            return None
+
+        time_start, future = fetch
+
+        try:
+            data: Any = future.result()
+        except Exception:
+            # The caller resolves the data once more and handles the error.
+            return None
+
+        return data if time.monotonic() - time_start < self.ttl else None
+
+    def cancel(self) -> None:
+        """Drop all requests, which have not been taken."""
+        with self.lock:
+            for _, future in self.fetches.values():
+                future.cancel()
+
+            self.fetches.clear()
@@ -0,0 +1,265 @@
+"""
+ratelimit.py
+
+Process-wide pacing of download starts and backoff from API throttling, shared by all workers, collections and
+`Download` instances.
+
+Classes:
+    RateLimiter: Token bucket, which is refilled in randomized intervals to mimic human behaviour.
+    ThrottleController: Pauses API requests after throttling and ramps the concurrency back up afterward.
+"""
+
+import random
+import time
+from threading import Event, Lock
+
+from tidal_dl_ng.config import Settings
+from tidal_dl_ng.constants import THROTTLE_BACKOFF_MAX_SEC, THROTTLE_BACKOFF_SEC, WAIT_TIMEOUT_SEC
+from tidal_dl_ng.helper.decorator import SingletonMeta
+
+
+class RateLimiter(metaclass=SingletonMeta):
+    """Limit the rate, at which downloads start, across all workers.
+
+    Every start takes a token. The bucket holds up to `capacity` tokens, so a few downloads can start at once, and
+    gets one token back after a random interval between `delay_min` and `delay_max` seconds. Callers, which pace at
+    dispatch time, ask with `try_acquire` how long to wait, instead of blocking a worker while sleeping. Tokens of
+    starts, which turned out to need no requests (e.g. existing files), are given back with `refund`.
+
+    Limits, which are not given explicitly, are read from the settings whenever they are used, so changes in the
+    preferences take effect without a restart.
+    """
+
+    settings: Settings
+    delay_min_fixed: float | None
+    delay_max_fixed: float | None
+    capacity_fixed: int | None
+    lock: Lock
+    tokens: float
+    time_next: float
+    random: random.SystemRandom
+
+    def __init__(self, delay_min: float | None = None, delay_max: float | None = None, capacity: int | None = None):
+        """Create the limiter with a full bucket.
+
+        Args:
+            delay_min (float | None, optional): Min. seconds until a token is refilled. If not given,
+                `download_delay_sec_min` is used. Defaults to None.
+            delay_max (float | None, optional): Max. seconds until a token is refilled. If not given,
+                `download_delay_sec_max` is used. Defaults to None.
+            capacity (int | None, optional): Max. number of tokens (burst). If not given,
+                `downloads_concurrent_max` is used. Defaults to None.
+        """
+        self.settings = Settings()
+        self.delay_min_fixed = delay_min
+        self.delay_max_fixed = delay_max
+        self.capacity_fixed = capacity
+        self.lock = Lock()
+        self.tokens = self.capacity
+        self.time_next = 0.0
+        self.random = random.SystemRandom()
+
+    @property
+    def delay_min(self) -> float:
+        """Min. seconds until a token is refilled."""
+        return self.settings.data.download_delay_sec_min if self.delay_min_fixed is None else self.delay_min_fixed
+
+    @property
+    def delay_max(self) -> float:
+        """Max. seconds until a token is refilled."""
+        return self.settings.data.download_delay_sec_max if self.delay_max_fixed is None else self.delay_max_fixed
+
+    @property
+    def capacity(self) -> int:
+        """Max. number of tokens (burst)."""
+        return max(
+            self.settings.data.downloads_concurrent_max if self.capacity_fixed is None else self.capacity_fixed, 1
+        )
+
+    def _interval(self) -> float:
+        return self.random.uniform(min(self.delay_min, self.delay_max), max(self.delay_min, self.delay_max))
+
+    def _refill(self, time_now: float) -> None:
+        # Add the tokens, which are due. A full bucket does not collect tokens for later. A lowered capacity drops
+        # the surplus.
+        self.tokens = min(self.tokens, self.capacity)
+
+        while self.tokens < self.capacity and time_now >= self.time_next:
+            self.tokens += 1
+            self.time_next += self._interval()
+
+    def try_acquire(self) -> float:
+        """Take a token, if there is one.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until the next token is available.
+        """
+        with self.lock:
+            time_now: float = time.monotonic()
+
+            self._refill(time_now)
+
+            if self.tokens < 1:
+                return max(self.time_next - time_now, 0.001)
+
+            # The refill interval starts with the first token taken from a full bucket.
+            if self.tokens >= self.capacity:
+                self.time_next = time_now + self._interval()
+
+            self.tokens -= 1
+
+            return 0.0
+
+    def acquire(self, event_abort: Event | None = None) -> bool:
+        """Take a token, wait for one if needed.
+
+        Args:
+            event_abort (Event | None, optional): If set while waiting, give up. Defaults to None.
+
+        Returns:
+            bool: True if a token was taken, False if aborted.
+        """
+        while time_wait := self.try_acquire():
+            if event_abort:
+                if event_abort.wait(min(time_wait, WAIT_TIMEOUT_SEC)):
+                    return False
+            else:
+                time.sleep(time_wait)
+
+        return True
+
+    def refund(self) -> None:
+        """Give a token back, which was not used for requests."""
+        with self.lock:
+            self.tokens = min(self.tokens + 1, self.capacity)
+
+
+class ThrottleController(metaclass=SingletonMeta):
+    """Back off from the TIDAL API process-wide, once it throttles requests (HTTP 429).
+
+    A throttled request pauses all API requests until the `Retry-After` time has passed, or, if the API does not
+    tell, for an exponential backoff, which grows with consecutive throttles. Throttles reported during a pause (e.g.
+    by other workers, which were throttled at the same time) only extend it. After the pause, the number of items
+    processed at once drops to one and grows by one with every successful request, until it reaches `limit_max`.
+    """
+
+    backoff_min: float
+    backoff_max: float
+    settings: Settings
+    limit_max_fixed: int | None
+    lock: Lock
+    time_resume: float
+    throttles: int
+    # Number of items processed at once while ramping up after a throttle, None if not limited.
+    limit_current: int | None
+
+    def __init__(
+        self,
+        backoff_min: float = THROTTLE_BACKOFF_SEC,
+        backoff_max: float = THROTTLE_BACKOFF_MAX_SEC,
+        limit_max: int | None = None,
+    ):
+        """Create the controller, nothing is throttled yet.
+
+        Args:
+            backoff_min (float, optional): Pause in seconds after the first throttle without `Retry-After`. Defaults
+                to THROTTLE_BACKOFF_SEC.
+            backoff_max (float, optional): Max. pause in seconds without `Retry-After`. Defaults to
+                THROTTLE_BACKOFF_MAX_SEC.
+            limit_max (int | None, optional): Number of items processed at once, if not throttled. If not given,
+                `downloads_concurrent_max` is read from the settings whenever it is used. Defaults to None.
+        """
+        self.settings = Settings()
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.limit_max_fixed = limit_max
+        self.lock = Lock()
+        self.time_resume = 0.0
+        self.throttles = 0
+        self.limit_current = None
+
+    @property
+    def limit_max(self) -> int:
+        """Number of items processed at once, if not throttled."""
+        return max(
+            self.settings.data.downloads_concurrent_max if self.limit_max_fixed is None else self.limit_max_fixed, 1
+        )
+
+    def throttled(self, retry_after: float | None = None) -> float:
+        """Report a throttled request and pause all requests.
+
+        Args:
+            retry_after (float | None, optional): Seconds to wait as told by the API (`Retry-After`). None or a
+                value <= 0, if it did not tell. Defaults to None.
+
+        Returns:
+            float: Seconds until requests are resumed.
+        """
+        with self.lock:
+            time_now: float = time.monotonic()
+
+            # Workers throttled at the same time report the same throttle.
+            if time_now >= self.time_resume:
+                self.throttles += 1
+
+            if retry_after and retry_after > 0:
+                pause: float = retry_after
+            else:
+                pause = min(self.backoff_min * 2 ** (self.throttles - 1), self.backoff_max)
+
+            self.time_resume = max(self.time_resume, time_now + pause)
+            self.limit_current = 1
+
+            return self.time_resume - time_now
+
+    def success(self) -> None:
+        """Report a successful request, so the number of items processed at once ramps back up."""
+        with self.lock:
+            self.throttles = 0
+
+            if self.limit_current is not None:
+                self.limit_current += 1
+
+                if self.limit_current >= self.limit_max:
+                    self.limit_current = None
+
+    def time_wait(self) -> float:
+        """Get the remaining pause.
+
+        Returns:
+            float: Seconds until requests are resumed, 0 if not paused.
+        """
+        with self.lock:
+            return max(self.time_resume - time.monotonic(), 0.0)
+
+    def wait(self, event_abort: Event | None = None) -> bool:
+        """Wait until the pause is over.
+
+        Args:
+            event_abort (Event | None, optional): If set while waiting, give up. Defaults to None.
+
+        Returns:
+            bool: True if requests can be made, False if aborted.
+        """
+        while time_wait := self.time_wait():
+            if event_abort:
+                if event_abort.wait(min(time_wait, WAIT_TIMEOUT_SEC)):
+                    return False
+            else:
+                time.sleep(time_wait)
+
+        return True
+
+    def limit(self, workers: int) -> int:
+        """Get the number of items, which can be processed at once.
+
+        Args:
+            workers (int): Number of workers available.
+
+        Returns:
+            int: Number of items to process at once, at least 1.
+        """
+        with self.lock:
+            limit_max: int = self.limit_max
+
+            return max(min(workers, limit_max if self.limit_current is None else self.limit_current, limit_max), 1)
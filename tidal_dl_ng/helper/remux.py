@@ -0,0 +1,135 @@
+"""
+remux.py
+
+Remuxing of a stream with FFmpeg, while it is being downloaded.
+
+Classes:
+    RemuxPipe: Writable stream, which pipes everything written into it into an FFmpeg process (no re-encoding).
+"""
+
+import contextlib
+import os
+import pathlib
+from concurrent import futures
+from types import TracebackType
+from typing import BinaryIO
+
+from ffmpeg import FFmpeg
+
+
+class RemuxPipe:
+    """Pipe a stream into FFmpeg, which copies it into another container (`-c copy`).
+
+    The stream is never written to disk: Only the output file of FFmpeg is. The input format must be given, since
+    FFmpeg cannot probe a pipe. Usage::
+
+        with RemuxPipe(path_binary_ffmpeg, path_out, "mpegts") as remux:
+            remux.write(data)
+
+        if remux.error: ...
+
+    The stream is not seekable, so data, which has been written, cannot be rolled back. If FFmpeg fails, further
+    data is dropped and the error is kept in `error`, instead of failing the writer.
+    """
+
+    ffmpeg: FFmpeg
+    path_out: pathlib.Path
+    error: Exception | None
+    _executor: futures.ThreadPoolExecutor | None
+    _future: futures.Future | None
+    _f_read: BinaryIO | None
+    _f_write: BinaryIO | None
+
+    def __init__(self, path_binary_ffmpeg: str, path_out: pathlib.Path, format_in: str):
+        """Prepare the FFmpeg call.
+
+        Args:
+            path_binary_ffmpeg (str): Path to the FFmpeg binary.
+            path_out (pathlib.Path): Output file. Its container is derived from the suffix.
+            format_in (str): FFmpeg name of the input format, e.g. "mpegts".
+        """
+        self.path_out = path_out
+        self.error = None
+        self._executor = None
+        self._future = None
+        self._f_read = None
+        self._f_write = None
+        self.ffmpeg = (
+            FFmpeg(executable=path_binary_ffmpeg)
+            .option("y")
+            .input(url="pipe:0", f=format_in)
+            .output(url=path_out, codec="copy", map=0, loglevel="quiet")
+        )
+
+    def __enter__(self) -> "RemuxPipe":
+        """Start FFmpeg, which reads from the pipe in a background thread.
+
+        Returns:
+            RemuxPipe: This stream.
+        """
+        fd_read, fd_write = os.pipe()
+        self._f_read = open(fd_read, "rb")
+        self._f_write = open(fd_write, "wb")
+        self._executor = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="tidal-dl-ng-remux")
+        self._future = self._executor.submit(self.ffmpeg.execute, self._f_read)
+        # If FFmpeg quits early, nobody reads the pipe anymore. Close it, so writes fail instead of blocking forever.
+        self._future.add_done_callback(lambda _: self._f_read.close())
+
+        return self
+
+    def write(self, data: bytes) -> int:
+        """Pipe data into FFmpeg.
+
+        Args:
+            data (bytes): Data in the input format.
+
+        Returns:
+            int: Number of bytes written (or dropped, if FFmpeg has failed).
+        """
+        if not self._f_write.closed:
+            try:
+                self._f_write.write(data)
+            except OSError as e:
+                # FFmpeg has quit. Its error is more meaningful, so keep this one only as a fallback.
+                self.error = e
+
+                with contextlib.suppress(OSError):
+                    self._f_write.close()
+
+        return len(data)
+
+    def flush(self) -> None:
+        """Flush the pipe."""
+        with contextlib.suppress(OSError):
+            if not self._f_write.closed:
+                self._f_write.flush()
+
+    def seekable(self) -> bool:
+        """A pipe cannot be rewound.
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the pipe, so FFmpeg sees the end of the stream, and wait until it has finished the output file.
+
+        An error of FFmpeg is not raised, but kept in `error`.
+        """
+        # FFmpeg might have quit already, e.g. because of invalid input.
+        with contextlib.suppress(OSError):
+            self._f_write.close()
+
+        try:
+            self._future.result()
+        except Exception as e:
+            self.error = e
+        finally:
+            self._f_read.close()
+            self._executor.shutdown()
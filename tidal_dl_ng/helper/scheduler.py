@@ -0,0 +1,336 @@
+"""
+scheduler.py
+
+Process-wide scheduler for connection slots, shared by all tracks, collections and `Download` instances (CLI, GUI,
+MCP server).
+
+Classes:
+    ConnectionScheduler: Hands out connection slots fairly across active tracks, with a hard global cap, which can
+        be tuned adaptively (AIMD).
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import count
+from threading import Event, Lock
+
+from tidal_dl_ng.config import Settings
+from tidal_dl_ng.constants import WAIT_TIMEOUT_SEC
+from tidal_dl_ng.helper.decorator import SingletonMeta
+from tidal_dl_ng.model.downloader import ConcurrencyLimits
+
+# Adaptive mode: Limit to start with, before it is increased step by step.
+ADAPTIVE_LIMIT_START: int = 4
+# Adaptive mode: Seconds of transferred data to measure the throughput over, before the limit is adjusted.
+ADAPTIVE_INTERVAL_SEC: float = 2.0
+# Adaptive mode: Relative throughput change, which is considered an improvement (or degradation).
+ADAPTIVE_GAIN_MIN: float = 0.05
+# Adaptive mode: Factor to cut the limit by on congestion.
+ADAPTIVE_DECREASE_FACTOR: float = 0.5
+
+
+@dataclass
+class _Waiter:
+    track: int
+    fn_grant: Callable[[], None]
+    granted: bool = False
+
+
+@dataclass
+class _Track:
+    slots_max: int
+    slots_used: int = 0
+
+
+class ConnectionScheduler(metaclass=SingletonMeta):
+    """Limit the number of simultaneous segment requests of the whole process.
+
+    Every track, which is downloading, registers itself. Slots are granted in request order, but a track can only
+    exceed its fair share (global limit divided by the number of active tracks) if no other track, which is below
+    its share, is waiting. So a track with many segments cannot starve the others, while no slot stays idle.
+
+    Slots can be requested from threads (`acquire`) as well as from coroutines on any event loop (`acquire_async`).
+
+    In adaptive mode the limit is tuned by additive increase / multiplicative decrease (AIMD): While the limit is
+    the bottleneck and the aggregate throughput keeps improving, it grows by one slot per interval. On congestion
+    (`congestion`), it is cut by `ADAPTIVE_DECREASE_FACTOR`. The configured limit is never exceeded.
+    """
+
+    limit: int
+    limit_max: int
+    adaptive: bool
+    lock: Lock
+    tracks: dict[int, _Track]
+    waiters: deque[_Waiter]
+    slots_used: int
+    saturated: bool
+    bytes_interval: int
+    time_interval: float
+    time_decrease: float
+    throughput: float
+    increased: bool
+    decreases: int
+    _ids: count
+
+    def __init__(self, limit: int | None = None, adaptive: bool | None = None):
+        """Initialize the scheduler.
+
+        Args:
+            limit (int | None, optional): Max. number of simultaneous connections in the whole process. If not given,
+                `downloads_connections_max` is used. Defaults to None.
+            adaptive (bool | None, optional): Tune the limit adaptively between 1 and `limit`. If not given,
+                `downloads_connections_adaptive` is used. Defaults to None.
+        """
+        settings: Settings = Settings()
+
+        if limit is None:
+            limit = settings.data.downloads_connections_max
+
+        if adaptive is None:
+            adaptive = settings.data.downloads_connections_adaptive
+
+        self.limit_max = max(limit, 1)
+        self.adaptive = adaptive
+        self.limit = min(ADAPTIVE_LIMIT_START, self.limit_max) if adaptive else self.limit_max
+        self.lock = Lock()
+        self.tracks = {}
+        self.waiters = deque()
+        self.slots_used = 0
+        self.saturated = False
+        self.bytes_interval = 0
+        self.time_interval = time.monotonic()
+        self.time_decrease = 0.0
+        self.throughput = 0.0
+        self.increased = False
+        self.decreases = 0
+        self._ids = count()
+
+    def track_register(self, slots_max: int) -> int:
+        """Register a track, which is about to download segments.
+
+        Args:
+            slots_max (int): Max. number of slots this track may use at once.
+
+        Returns:
+            int: ID of the track, to be used for all further calls.
+        """
+        with self.lock:
+            track_id: int = next(self._ids)
+            # The fair share of the other tracks shrinks. Slots they already hold are not revoked.
+            self.tracks[track_id] = _Track(slots_max=max(slots_max, 1))
+
+        return track_id
+
+    def track_unregister(self, track_id: int) -> None:
+        """Unregister a track, so its share is distributed among the remaining tracks.
+
+        Args:
+            track_id (int): ID of the track.
+        """
+        with self.lock:
+            self.tracks.pop(track_id, None)
+            self._grant()
+
+    def limit_set(self, limit: int) -> None:
+        """Change the global limit. Slots in use above a lowered limit are not revoked, but not granted again.
+
+        Args:
+            limit (int): New max. number of simultaneous connections.
+        """
+        with self.lock:
+            self.limit = max(limit, 1)
+            self._grant()
+
+    def limits(self) -> ConcurrencyLimits:
+        """Get the current state of the limits, e.g. to see what the adaptive mode has settled on.
+
+        Returns:
+            ConcurrencyLimits: Current limit, upper limit, usage and the last measured throughput (bytes / second).
+        """
+        with self.lock:
+            return ConcurrencyLimits(
+                adaptive=self.adaptive,
+                limit=self.limit,
+                limit_max=self.limit_max,
+                slots_used=self.slots_used,
+                tracks_active=len(self.tracks),
+                throughput=self.throughput,
+                decreases=self.decreases,
+            )
+
+    def bytes_add(self, size: int) -> None:
+        """Account transferred bytes for the throughput measurement of the adaptive mode.
+
+        Args:
+            size (int): Number of bytes received.
+        """
+        if not self.adaptive:
+            return
+
+        with self.lock:
+            self.bytes_interval += size
+            time_now: float = time.monotonic()
+            time_elapsed: float = time_now - self.time_interval
+
+            if time_elapsed < ADAPTIVE_INTERVAL_SEC:
+                return
+
+            throughput: float = self.bytes_interval / time_elapsed
+            throughput_before: float = self.throughput
+
+            # Changing the limit only has an effect, if it was the bottleneck in the last interval.
+            if self.saturated and throughput > throughput_before * (1 + ADAPTIVE_GAIN_MIN):
+                # Additive increase: The last step has paid off, try one more connection.
+                self.limit = min(self.limit + 1, self.limit_max)
+                self.increased = True
+            elif self.increased and throughput < throughput_before * (1 - ADAPTIVE_GAIN_MIN):
+                # The last additional connection made it worse. Step back.
+                self.limit = max(self.limit - 1, 1)
+                self.increased = False
+            else:
+                self.increased = False
+
+            self.throughput = throughput
+            self.bytes_interval = 0
+            self.time_interval = time_now
+            self.saturated = False
+
+            self._grant()
+
+    def congestion(self) -> None:
+        """Signal congestion (HTTP 429 / 5xx, timeouts, rate limiting by the API) to the adaptive mode.
+
+        The limit is cut multiplicatively, at most once per measurement interval, so a burst of failing requests
+        counts as one signal.
+        """
+        if not self.adaptive:
+            return
+
+        with self.lock:
+            time_now: float = time.monotonic()
+
+            if time_now - self.time_decrease < ADAPTIVE_INTERVAL_SEC:
+                return
+
+            self.limit = max(int(self.limit * ADAPTIVE_DECREASE_FACTOR), 1)
+            self.time_decrease = time_now
+            self.decreases += 1
+            # Start a new measurement at the reduced limit.
+            self.throughput = 0.0
+            self.bytes_interval = 0
+            self.time_interval = time_now
+            self.increased = False
+
+    def acquire(self, track_id: int, event_abort: Event | None = None) -> bool:
+        """Block until a slot for the track is granted.
+
+        Args:
+            track_id (int): ID of the track.
+            event_abort (Event | None, optional): If set while waiting, give up. Defaults to None.
+
+        Returns:
+            bool: True if a slot was granted (and must be released), False if aborted.
+        """
+        event_granted: Event = Event()
+        waiter: _Waiter = self._enqueue(track_id, event_granted.set)
+
+        while not event_granted.wait(timeout=WAIT_TIMEOUT_SEC):
+            if event_abort and event_abort.is_set():
+                self._dequeue(waiter)
+
+                return False
+
+        return True
+
+    async def acquire_async(self, track_id: int, event_abort: Event | None = None) -> bool:
+        """Wait, without blocking the event loop, until a slot for the track is granted.
+
+        Args:
+            track_id (int): ID of the track.
+            event_abort (Event | None, optional): If set while waiting, give up. Defaults to None.
+
+        Returns:
+            bool: True if a slot was granted (and must be released), False if aborted.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future_granted: asyncio.Future = loop.create_future()
+
+        def fn_grant() -> None:
+            # Slots are granted by whichever thread releases one, so hand the result over to the waiting loop.
+            loop.call_soon_threadsafe(lambda: future_granted.done() or future_granted.set_result(True))
+
+        waiter: _Waiter = self._enqueue(track_id, fn_grant)
+
+        while True:
+            try:
+                await asyncio.wait_for(asyncio.shield(future_granted), WAIT_TIMEOUT_SEC)
+            except TimeoutError:
+                if event_abort and event_abort.is_set():
+                    self._dequeue(waiter)
+
+                    return False
+            else:
+                return True
+
+    def release(self, track_id: int) -> None:
+        """Give back a slot and grant it to the next eligible waiter.
+
+        Args:
+            track_id (int): ID of the track.
+        """
+        with self.lock:
+            self.slots_used -= 1
+            track: _Track | None = self.tracks.get(track_id)
+
+            if track:
+                track.slots_used -= 1
+
+            self._grant()
+
+    def _enqueue(self, track_id: int, fn_grant: Callable[[], None]) -> _Waiter:
+        with self.lock:
+            waiter: _Waiter = _Waiter(track=track_id, fn_grant=fn_grant)
+            self.waiters.append(waiter)
+            self._grant()
+
+        return waiter
+
+    def _dequeue(self, waiter: _Waiter) -> None:
+        # Give up waiting. A slot, which has been granted meanwhile, is given back right away.
+        with self.lock:
+            if not waiter.granted:
+                self.waiters.remove(waiter)
+
+                return
+
+        self.release(waiter.track)
+
+    def _share(self) -> int:
+        return math.ceil(self.limit / max(len(self.tracks), 1))
+
+    def _grant(self) -> None:
+        # First serve the waiters of tracks below their fair share, then hand out the remaining slots in order.
+        share: int = self._share()
+
+        for fair_only in (True, False):
+            for waiter in list(self.waiters):
+                if self.slots_used >= self.limit:
+                    # Requests are waiting because of the limit.
+                    self.saturated = True
+
+                    return
+
+                track: _Track | None = self.tracks.get(waiter.track)
+
+                if not track or track.slots_used >= track.slots_max or (fair_only and track.slots_used >= share):
+                    continue
+
+                self.waiters.remove(waiter)
+                track.slots_used += 1
+                self.slots_used += 1
+                waiter.granted = True
+                waiter.fn_grant()
@@ -0,0 +1,116 @@
+"""
+staging.py
+
+Memory tier for staging small items, backed by a RAM file system (tmpfs), with a process-wide budget.
+
+Classes:
+    StagingMemory: Hands out space in the RAM file system, so concurrent items cannot exhaust the memory.
+
+Functions:
+    path_staging_memory_default: RAM file system of the OS, if there is a usable one.
+"""
+
+import os
+import pathlib
+import shutil
+import tempfile
+from threading import Lock
+
+from tidal_dl_ng.config import Settings
+from tidal_dl_ng.constants import PATH_STAGING_MEMORY, STAGING_DIR_NAME
+from tidal_dl_ng.helper.decorator import SingletonMeta
+
+
+def path_staging_memory_default() -> pathlib.Path | None:
+    """Get the RAM file system of the OS (e.g. `/dev/shm` on Linux).
+
+    Returns:
+        pathlib.Path | None: Path to the RAM file system or None, if the OS has no usable one.
+    """
+    path: pathlib.Path = pathlib.Path(PATH_STAGING_MEMORY)
+
+    return path if path.is_dir() and os.access(path, os.W_OK | os.X_OK) else None
+
+
+class StagingMemory(metaclass=SingletonMeta):
+    """Stage small items in RAM, so they are assembled, decrypted and tagged without touching the disk.
+
+    Every item reserves its expected size before it is staged in memory and releases it once its staging directory
+    is removed. If the budget (or the RAM file system) has not enough space left, the item is staged on disk
+    instead of waiting.
+    """
+
+    path: pathlib.Path | None
+    size_item_max: int
+    budget: int
+    used: int
+    lock: Lock
+
+    def __init__(self, size_item_max: int | None = None, budget: int | None = None):
+        """Initialize the memory tier.
+
+        Args:
+            size_item_max (int | None, optional): Max. expected size of an item in bytes to be staged in memory. 0
+                disables the memory tier. If not given, `staging_memory_item_max_mb` is used. Defaults to None.
+            budget (int | None, optional): Max. number of bytes of all items staged in memory at once. If not
+                given, `staging_memory_budget_mb` is used. Defaults to None.
+        """
+        settings: Settings = Settings()
+
+        if size_item_max is None:
+            size_item_max = settings.data.staging_memory_item_max_mb * 1024 * 1024
+
+        if budget is None:
+            budget = settings.data.staging_memory_budget_mb * 1024 * 1024
+
+        self.path = path_staging_memory_default()
+        self.size_item_max = max(size_item_max, 0)
+        self.budget = max(budget, 0)
+        self.used = 0
+        self.lock = Lock()
+
+    def reserve(self, size_item: int, copies: int = 1) -> int:
+        """Reserve space for an item, if it is small enough and the budget allows it.
+
+        Args:
+            size_item (int): Expected size of the item in bytes.
+            copies (int, optional): Number of copies of the item, which exist at once while it is processed (e.g.
+                the MP4 file and the extracted FLAC file). Defaults to 1.
+
+        Returns:
+            int: Number of bytes reserved. If not 0, the item can be staged in memory and `release` must be called
+                with this number afterward.
+        """
+        size: int = size_item * copies
+
+        if not self.path or not 0 < size_item <= self.size_item_max:
+            return 0
+
+        with self.lock:
+            if self.used + size > self.budget or size > shutil.disk_usage(self.path).free:
+                return 0
+
+            self.used += size
+
+        return size
+
+    def release(self, size: int) -> None:
+        """Give back the space of an item, whose staging directory has been removed.
+
+        Args:
+            size (int): Number of bytes, which were reserved.
+        """
+        with self.lock:
+            self.used = max(self.used - size, 0)
+
+    def mkdtemp(self) -> pathlib.Path:
+        """Create a staging directory for an item in memory.
+
+        Returns:
+            pathlib.Path: Path to the new directory.
+        """
+        path_root: pathlib.Path = self.path / STAGING_DIR_NAME
+
+        os.makedirs(path_root, exist_ok=True)
+
+        return pathlib.Path(tempfile.mkdtemp(dir=path_root))
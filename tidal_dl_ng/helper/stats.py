@@ -0,0 +1,174 @@
+"""
+stats.py
+
+Throughput metrics of the download engine: Per segment, rolled up per track and per session (lifetime of a
+`Download` instance).
+
+Classes:
+    DownloadStats: Thread-safe collector of segment metrics, which are aggregated per track and per session.
+    ThroughputColumn: `rich` progress column, which renders the throughput of a task.
+"""
+
+import time
+from threading import Lock
+
+from rich.progress import ProgressColumn, Task
+from rich.text import Text
+
+from tidal_dl_ng.model.downloader import SegmentStats, SessionStats, TrackStats
+
+
+def throughput_format(throughput: float) -> str:
+    """Format a throughput for humans.
+
+    Args:
+        throughput (float): Bytes per second.
+
+    Returns:
+        str: E.g. "3.2 MiB/s".
+    """
+    return f"{throughput / 1048576:.1f} MiB/s"
+
+
+class DownloadStats:
+    """Collect segment metrics and aggregate them per track and per session.
+
+    Tracks are identified by a key (the progress task ID of the track). The session duration only counts the time,
+    in which at least one track was downloading, so idle time between downloads does not lower the throughput.
+    """
+
+    lock: Lock
+    session: SessionStats
+    tracks_active: dict[int, TrackStats]
+    tracks_start: dict[int, float]
+    tracks: list[TrackStats]
+    time_active_start: float
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.lock = Lock()
+        self.session = SessionStats()
+        self.tracks_active = {}
+        self.tracks_start = {}
+        self.tracks = []
+        self.time_active_start = 0.0
+
+    def track_begin(self, key: int, name: str) -> None:
+        """Start measuring a track.
+
+        Args:
+            key (int): Key of the track (e.g. its progress task ID).
+            name (str): Name of the track.
+        """
+        with self.lock:
+            time_now: float = time.perf_counter()
+
+            if not self.tracks_active:
+                self.time_active_start = time_now
+
+            self.tracks_active[key] = TrackStats(name=name)
+            self.tracks_start[key] = time_now
+
+    def segment_add(self, key: int, stats: SegmentStats) -> None:
+        """Add the metrics of a finished segment to its track and the session.
+
+        Args:
+            key (int): Key of the track.
+            stats (SegmentStats): Metrics of the segment.
+        """
+        with self.lock:
+            track: TrackStats | None = self.tracks_active.get(key)
+
+            if track is None:
+                return
+
+            track.size += stats.size
+            track.segments += 1
+            track.ttfb_sum += stats.ttfb
+            track.time_wait_sum += stats.time_wait
+            track.time_write_sum += stats.time_write
+            self.session.size += stats.size
+            self.session.segments += 1
+
+    def track_end(self, key: int) -> TrackStats | None:
+        """Stop measuring a track.
+
+        Args:
+            key (int): Key of the track.
+
+        Returns:
+            TrackStats | None: Final metrics of the track, None if it was not measured.
+        """
+        with self.lock:
+            track: TrackStats | None = self.tracks_active.pop(key, None)
+
+            if track is None:
+                return None
+
+            time_now: float = time.perf_counter()
+            track.duration = time_now - self.tracks_start.pop(key)
+            self.tracks.append(track)
+            self.session.items += 1
+
+            if not self.tracks_active:
+                self.session.duration += time_now - self.time_active_start
+
+            return track
+
+    def rewrite_add(self) -> None:
+        """Count a tag write, which rewrote the whole file."""
+        with self.lock:
+            self.session.rewrites += 1
+
+    def throughput_track(self, key: int) -> float:
+        """Get the current throughput of an active track.
+
+        Args:
+            key (int): Key of the track.
+
+        Returns:
+            float: Bytes per second, 0 if the track is not active.
+        """
+        with self.lock:
+            track: TrackStats | None = self.tracks_active.get(key)
+
+            if track is None:
+                return 0.0
+
+            duration: float = time.perf_counter() - self.tracks_start[key]
+
+            return track.size / duration if duration else 0.0
+
+    def throughput(self) -> float:
+        """Get the throughput of the session, including the tracks, which are currently downloading.
+
+        Returns:
+            float: Bytes per second.
+        """
+        with self.lock:
+            duration: float = self.session.duration
+
+            if self.tracks_active:
+                duration += time.perf_counter() - self.time_active_start
+
+            return self.session.size / duration if duration else 0.0
+
+
+class ThroughputColumn(ProgressColumn):
+    """Render the `throughput` field (bytes per second) of a progress task, if set."""
+
+    def render(self, task: Task) -> Text:
+        """Render the throughput of the task.
+
+        Args:
+            task (Task): The progress task.
+
+        Returns:
+            Text: The formatted throughput, or empty.
+        """
+        throughput: float | None = task.fields.get("throughput")
+
+        if not throughput:
+            return Text("")
+
+        return Text(throughput_format(throughput), style="progress.data.speed")
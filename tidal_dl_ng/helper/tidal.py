@@ -1,4 +1,6 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent import futures
+from threading import Lock
 
 from tidalapi import Album, Mix, Playlist, Session, Track, UserPlaylist, Video
 from tidalapi.artist import Artist, Role
@@ -219,3 +221,87 @@ def favorite_function_factory(tidal, favorite_item: str):
     function_list: Callable = getattr(tidal.session.user.favorites, function_name)
 
     return function_list
+
+
+def album_complete(album: Album | None) -> bool:
+    # Albums embedded in track data (e.g. of playlists) lack e.g. the number of tracks, release date and UPC.
+    return album is not None and album.num_tracks is not None
+
+
+class AlbumCache:
+    """Full albums of a list download by ID, so tracks are completed with album data once per album.
+
+    Tracks of the same album share one request (single flight), instead of re-fetching every track with its album.
+    Failed requests are not cached, so they are retried by the next caller.
+    """
+
+    session: Session
+    lock: Lock
+    albums: dict[int | str, futures.Future]
+
+    def __init__(self, session: Session, albums: Iterable[Album] = ()):
+        """Create the cache.
+
+        Args:
+            session (Session): TIDAL session.
+            albums (Iterable[Album], optional): Full albums, which are known already (e.g. the album, which is
+                downloaded). Defaults to ().
+        """
+        self.session = session
+        self.lock = Lock()
+        self.albums = {}
+
+        for album in albums:
+            future: futures.Future = futures.Future()
+
+            future.set_result(album)
+            self.albums[album.id] = future
+
+    def album(self, album_id: int | str) -> Album:
+        """Get a full album, it is requested once.
+
+        Args:
+            album_id (int | str): ID of the album.
+
+        Returns:
+            Album: Full album.
+        """
+        with self.lock:
+            future: futures.Future | None = self.albums.get(album_id)
+            # Only the first caller requests the album, others wait for it.
+            is_owner: bool = future is None
+
+            if is_owner:
+                future = futures.Future()
+                self.albums[album_id] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            album: Album = self.session.album(album_id)
+        except Exception as e:
+            with self.lock:
+                del self.albums[album_id]
+
+            future.set_exception(e)
+
+            raise
+
+        future.set_result(album)
+
+        return album
+
+    def track_complete(self, track: Track) -> Track:
+        """Complete the album data of a track, if it is missing.
+
+        Args:
+            track (Track): Track of a list.
+
+        Returns:
+            Track: The same track with its full album.
+        """
+        if track.album and not album_complete(track.album):
+            track.album = self.album(track.album.id)
+
+        return track
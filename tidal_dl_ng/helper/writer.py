@@ -0,0 +1,216 @@
+"""
+writer.py
+
+Ordered writer for concurrently downloaded media segments, with optional inline decryption and journaling.
+
+Classes:
+    SegmentWriter: Streams segments into a single target in their original order using a bounded reorder buffer.
+"""
+
+import hashlib
+from collections.abc import Callable
+from threading import Condition, Event
+from typing import Any, BinaryIO
+
+from tidal_dl_ng.constants import WAIT_TIMEOUT_SEC
+
+
+class SegmentWriter:
+    """Write segments, which arrive out of order, sequentially into one target.
+
+    The segment at the head of the queue (the next one in order) is streamed straight into the target. All other
+    segments are kept in memory until it is their turn. The amount of buffered segments is limited by `window`:
+    A segment can only be started if its index is smaller than `index_next + window`.
+
+    Since data reaches the target strictly in order, a stream cipher (AES-CTR) can decrypt it on the fly. If the
+    head segment is rolled back, the decryptor is re-created at the rolled back byte offset.
+
+    Every segment, which has been completely written, is reported to `fn_segment_written` (e.g. a journal), so a
+    download can be resumed later by starting the writer at `index_start` / `offset_start`.
+
+    If the target is not seekable (e.g. a pipe into a remuxing process), written data cannot be rolled back. Then
+    the head segment is buffered as well, until it is finished.
+    """
+
+    target: BinaryIO
+    window: int
+    index_next: int
+    bytes_written: int
+    offset_head: int
+    buffers: dict[int, list[bytes]]
+    finished: set[int]
+    condition: Condition
+    failed: set[int]
+    fn_decryptor: Callable[[int], Any] | None
+    decryptor: Any
+    fn_segment_written: Callable[[int, int, str], None] | None
+    hash_head: Any
+    head_direct: bool
+
+    def __init__(
+        self,
+        target: BinaryIO,
+        window: int,
+        fn_decryptor: Callable[[int], Any] | None = None,
+        fn_segment_written: Callable[[int, int, str], None] | None = None,
+        index_start: int = 0,
+        offset_start: int = 0,
+    ):
+        """Initialize the writer.
+
+        Args:
+            target (BinaryIO): Writable binary stream to write the segments into. It must be positioned at
+                `offset_start`.
+            window (int): Max. number of segments, which can be in flight (downloading or buffered) at once.
+            fn_decryptor (Callable[[int], Any] | None, optional): Factory, which returns a decryptor (object with a
+                `decrypt(bytes)` method) positioned at the given byte offset. If set, all data is decrypted before
+                it is written. Defaults to None.
+            fn_segment_written (Callable[[int, int, str], None] | None, optional): Called with (index, size,
+                SHA-256 hex digest) for every segment, which was completely written. Reporting stops at the first
+                failed segment, so only a gapless prefix of the target is reported. Defaults to None.
+            index_start (int, optional): Index of the first segment to expect (resume). Defaults to 0.
+            offset_start (int, optional): Byte offset in `target` where segment `index_start` starts. Defaults to 0.
+        """
+        self.target = target
+        self.window = max(window, 1)
+        self.index_next = index_start
+        self.bytes_written = offset_start
+        self.offset_head = offset_start
+        self.buffers = {}
+        self.finished = set()
+        self.failed = set()
+        self.condition = Condition()
+        self.fn_decryptor = fn_decryptor
+        self.decryptor = fn_decryptor(offset_start) if fn_decryptor else None
+        self.fn_segment_written = fn_segment_written
+        self.hash_head = hashlib.sha256()
+        # Only stream the head segment into the target, if it can be rolled back.
+        self.head_direct = target.seekable()
+
+    def acquire(self, index: int, event_abort: Event | None = None) -> bool:
+        """Block until the segment with `index` is within the reorder window.
+
+        Args:
+            index (int): Segment index.
+            event_abort (Event | None, optional): If set while waiting, give up. Defaults to None.
+
+        Returns:
+            bool: True if the segment can be downloaded, False if aborted.
+        """
+        with self.condition:
+            while not self.window_contains(index):
+                if event_abort and event_abort.is_set():
+                    return False
+
+                self.condition.wait(timeout=WAIT_TIMEOUT_SEC)
+
+        return True
+
+    def window_contains(self, index: int) -> bool:
+        """Check, without blocking, if the segment with `index` is within the reorder window.
+
+        Args:
+            index (int): Segment index.
+
+        Returns:
+            bool: True if the segment can be downloaded now.
+        """
+        return index < self.index_next + self.window
+
+    def write(self, index: int, data: bytes) -> None:
+        """Write a chunk of a segment. Chunks of one segment must be written in order.
+
+        Args:
+            index (int): Segment index.
+            data (bytes): Chunk of segment data.
+        """
+        with self.condition:
+            if index == self.index_next and self.head_direct:
+                self._target_write(data)
+            else:
+                self.buffers.setdefault(index, []).append(data)
+
+    def finish(self, index: int, success: bool = True) -> None:
+        """Mark a segment as completely written and flush buffered successors.
+
+        Args:
+            index (int): Segment index.
+            success (bool, optional): Whether the segment was downloaded successfully. A failed segment is skipped
+                (it must be discarded before), so the following segments do not wait forever. Defaults to True.
+        """
+        with self.condition:
+            self.finished.add(index)
+
+            if not success:
+                self.failed.add(index)
+
+            self._advance()
+            self.condition.notify_all()
+
+    def discard(self, index: int) -> None:
+        """Throw away everything written for a segment so far, e.g. before it is downloaded again.
+
+        Args:
+            index (int): Segment index.
+        """
+        with self.condition:
+            self.buffers.pop(index, None)
+
+            # The head segment is written directly into the target. Roll it back.
+            if index == self.index_next and self.bytes_written != self.offset_head:
+                self.target.seek(self.offset_head)
+                self.target.truncate()
+                self.bytes_written = self.offset_head
+                self.hash_head = hashlib.sha256()
+
+                if self.fn_decryptor:
+                    self.decryptor = self.fn_decryptor(self.offset_head)
+
+    def is_complete(self, count: int) -> bool:
+        """Check if all segments up to `count` have been written to the target.
+
+        Args:
+            count (int): Total number of segments.
+
+        Returns:
+            bool: True if all segments were written.
+        """
+        with self.condition:
+            return self.index_next >= count
+
+    def _target_write(self, data: bytes) -> None:
+        if self.decryptor:
+            data = self.decryptor.decrypt(data)
+
+        self.target.write(data)
+        self.bytes_written += len(data)
+
+        if self.fn_segment_written:
+            self.hash_head.update(data)
+
+    def _advance(self) -> None:
+        # Move the head forward as long as the next segments are already finished. The first unfinished segment
+        # becomes the new head: Its buffered data is flushed, so it can stream directly into the target.
+        while True:
+            if self.head_direct or self.index_next in self.finished:
+                for data in self.buffers.pop(self.index_next, []):
+                    self._target_write(data)
+
+            if self.index_next not in self.finished:
+                break
+
+            if self.index_next in self.failed:
+                # Everything after a failed segment is not gapless anymore.
+                self.fn_segment_written = None
+            elif self.fn_segment_written:
+                # Make sure the segment has reached the file before it is reported.
+                self.target.flush()
+                self.fn_segment_written(
+                    self.index_next, self.bytes_written - self.offset_head, self.hash_head.hexdigest()
+                )
+
+            self.finished.discard(self.index_next)
+            self.failed.discard(self.index_next)
+            self.index_next += 1
+            self.offset_head = self.bytes_written
+            self.hash_head = hashlib.sha256()
@@ -29,6 +29,8 @@ class Metadata:
     url_share: str
     replay_gain_write: bool
     upc: str
+    padding_reserved: int
+    rewritten: bool
     m: mutagen.mp4.MP4 | mutagen.mp4.MP4 | mutagen.flac.FLAC
 
     def __init__(
@@ -55,6 +57,7 @@ class Metadata:
         url_share: str = "",
         replay_gain_write: bool = True,
         upc: str = "",
+        padding_reserved: int = 0,
     ):
         self.path_file = path_file
         self.title = title
@@ -78,6 +81,8 @@ class Metadata:
         self.url_share = url_share
         self.replay_gain_write = replay_gain_write
         self.upc = upc
+        self.padding_reserved = padding_reserved
+        self.rewritten = False
         self.m: mutagen.FileType = mutagen.File(self.path_file)
 
     def _cover(self) -> bool:
@@ -115,10 +120,21 @@ class Metadata:
 
         self._cover()
         self.cleanup_tags()
-        self.m.save()
+        self.m.save(padding=self._padding)
 
         return True
 
+    def _padding(self, info: mutagen.PaddingInfo) -> int:
+        # Keep the reserved padding as it is, so the tags are updated in place. If they do not fit, the audio data
+        # has to be moved anyway (the whole file is rewritten), so use the default padding of mutagen then. Only
+        # files, which had padding reserved for the tags, count as rewritten: Others never fit.
+        if info.padding >= 0:
+            return info.padding
+
+        self.rewritten = self.padding_reserved > 0
+
+        return info.get_default_padding()
+
     def set_flac(self):
         self.m.tags["TITLE"] = self.title
         self.m.tags["ALBUM"] = self.album
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from tidalapi import Quality
 
-from tidal_dl_ng.constants import CoverDimensions, QualityVideo
+from tidal_dl_ng.constants import CoverDimensions, DownloadEngine, QualityVideo
 
 
 @dataclass_json
@@ -32,20 +32,33 @@ class Settings:
     format_track: str = "Tracks/{artist_name} - {track_title}{track_explicit}"
     format_video: str = "Videos/{artist_name} - {track_title}{track_explicit}"
     video_convert_mp4: bool = True
+    video_convert_stream: bool = True
     path_binary_ffmpeg: str = ""
     metadata_cover_dimension: CoverDimensions = CoverDimensions.Px320
     metadata_cover_embed: bool = True
     cover_album_file: bool = True
+    cover_cache_items: int = 32
+    cover_cache_disk: bool = False
     extract_flac: bool = True
     downloads_simultaneous_per_track_max: int = 20
     download_delay_sec_min: float = 3.0
     download_delay_sec_max: float = 5.0
     album_track_num_pad_min: int = 1
     downloads_concurrent_max: int = 3
+    downloads_connections_max: int = 60
+    downloads_connections_adaptive: bool = False
+    downloads_postprocess_max: int = 0
+    downloads_prefetch_items: int = 4
     symlink_to_track: bool = False
     playlist_create: bool = False
     metadata_replay_gain: bool = False
     metadata_write_url: bool = True
+    segments_write_direct: bool = True
+    download_resume: bool = True
+    path_staging: str = ""
+    staging_memory_item_max_mb: int = 64
+    staging_memory_budget_mb: int = 512
+    download_engine: DownloadEngine = DownloadEngine.THREADS
     window_x: int = 50
     window_y: int = 50
     window_w: int = 1200
@@ -63,7 +76,10 @@ class HelpSettings:
     album_info_save: str = "Save album info to track?"
     video_download: str = "Allow download of videos."
     multi_thread: str = "Download several tracks in parallel."
-    download_delay: str = "Activate randomized download delay to mimic human behaviour."
+    download_delay: str = (
+        "Activate randomized download delay to mimic human behaviour. Download starts of all workers are paced "
+        "together: After a burst of `downloads_concurrent_max` downloads, the next one starts after the delay."
+    )
     download_base_path: str = "Where to store the downloaded media."
     quality_audio: str = (
         'Desired audio download quality: "LOW" (96kbps), "HIGH" (320kbps), '
@@ -81,6 +97,10 @@ class HelpSettings:
         "Videos are downloaded as MPEG Transport Stream (TS) files. With this option each video "
         "will be converted to MP4. FFmpeg must be installed."
     )
+    video_convert_stream: str = (
+        "Convert videos to MP4 while they are downloading, by piping the chunks into FFmpeg. Only the MP4 file is "
+        "written to disk. Requires `video_convert_mp4` and `segments_write_direct`. Such downloads cannot be resumed."
+    )
     path_binary_ffmpeg: str = (
         "Path to FFmpeg binary file (executable). Only necessary if FFmpeg not set in $PATH. Mandatory for Windows: "
         "The directory of `ffmpeg.exe`must be set in %PATH%."
@@ -90,7 +110,13 @@ class HelpSettings:
     )
     metadata_cover_embed: str = "Embed album cover into file."
     cover_album_file: str = "Save cover to 'cover.jpg', if an album is downloaded."
-    extract_flac: str = "Extract FLAC audio tracks from MP4 containers and save them as `*.flac` (uses FFmpeg)."
+    cover_cache_items: str = (
+        "Number of cover images kept in memory, so the cover of an album is downloaded once and not once per track."
+    )
+    cover_cache_disk: str = (
+        "Cache cover images on disk (in the config directory) as well, so they are reused across restarts."
+    )
+    extract_flac: str = "Extract FLAC audio tracks from MP4 containers and save them as `*.flac`. FFmpeg is only needed for unusual MP4 layouts."
     downloads_simultaneous_per_track_max: str = "Maximum number of simultaneous chunk downloads per track."
     download_delay_sec_min: str = "Lower boundary for the calculation of the download delay in seconds."
     download_delay_sec_max: str = "Upper boundary for the calculation of the download delay in seconds."
@@ -98,6 +124,24 @@ class HelpSettings:
         "Minimum length of the album track count, will be padded with zeroes (0). To disable padding set this to 1."
     )
     downloads_concurrent_max: str = "Maximum concurrent number of downloads (threads)."
+    downloads_connections_max: str = (
+        "Maximum number of simultaneous chunk downloads of the whole application. The connections are shared fairly "
+        "among all items, which are downloaded at the same time. The default matches the former limit of "
+        "`downloads_concurrent_max` times `downloads_simultaneous_per_track_max` (3 * 20)."
+    )
+    downloads_connections_adaptive: str = (
+        "Tune the number of simultaneous chunk downloads automatically: It is increased as long as the overall "
+        "download speed improves and halved on errors (HTTP 429 / 5xx, timeouts, too many requests). "
+        "`downloads_connections_max` is the upper limit."
+    )
+    downloads_postprocess_max: str = (
+        "Maximum number of downloaded items, which are post-processed (FLAC extraction, video conversion, "
+        "metadata, moving) at once, while the next items of a list are already downloading. 0 = number of CPU cores."
+    )
+    downloads_prefetch_items: str = (
+        "Number of list items, whose streams are resolved ahead, while the current items are downloading. So the "
+        "next downloads start transferring right away. 0 = disabled."
+    )
     symlink_to_track: str = (
         "If enabled the tracks of albums, playlists and mixes will be downloaded to the track directory but symlinked "
         "accordingly."
@@ -105,6 +149,31 @@ class HelpSettings:
     playlist_create: str = "Creates a '_playlist.m3u8' file for downloaded albums, playlists and mixes."
     metadata_replay_gain: str = "Replay gain information will be written to metadata."
     metadata_write_url: str = "URL of the media file will be written to metadata."
+    segments_write_direct: str = (
+        "Write downloaded chunks in order directly into the target file. If disabled, every chunk is saved to a "
+        "separate temporary file first and all chunks are merged afterward (slower, more disk I/O)."
+    )
+    download_resume: str = (
+        "Keep partially downloaded items in the staging directory (see `path_staging`) "
+        "together with a journal of finished chunks. Interrupted downloads continue where they stopped. "
+        "Requires `segments_write_direct`."
+    )
+    path_staging: str = (
+        "Where items are downloaded to and post-processed, before they are moved to their destination. If empty, a "
+        "hidden directory inside `download_base_path` is used. It should be on the same drive as "
+        "`download_base_path`: Then finished files are just renamed, otherwise every file is copied once more."
+    )
+    staging_memory_item_max_mb: str = (
+        "Tracks, which are expected to be smaller than this (in MiB), are downloaded, tagged and post-processed in "
+        "RAM (tmpfs, e.g. `/dev/shm`) and written to disk only once. Such downloads cannot be resumed. 0 = disabled."
+    )
+    staging_memory_budget_mb: str = (
+        "Maximum RAM (in MiB) used by all tracks staged in memory at once. Tracks exceeding it are staged on disk."
+    )
+    download_engine: str = (
+        'How chunks are downloaded: "threads" (one thread per simultaneous chunk download) or "asyncio" (all chunk '
+        "downloads run as coroutines on a single event loop)."
+    )
     window_x: str = "X-Coordinate of saved window location."
     window_y: str = "Y-Coordinate of saved window location."
     window_w: str = "Width of saved window size."
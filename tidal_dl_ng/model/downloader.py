@@ -1,7 +1,69 @@
 import pathlib
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent import futures
+from dataclasses import dataclass, field
 
-from requests import HTTPError
+from dataclasses_json import dataclass_json
+from rich.progress import TaskID
+
+from tidal_dl_ng.constants import QueueDownloadStatus
+
+
+@dataclass
+class SegmentStats:
+    # Bytes received.
+    size: int = 0
+    # Seconds spent waiting for a connection slot.
+    time_wait: float = 0.0
+    # Seconds from sending the request until the response headers arrived (time to first byte).
+    ttfb: float = 0.0
+    # Seconds from sending the request until the last byte was written.
+    duration: float = 0.0
+    # Seconds spent writing (and decrypting) received data.
+    time_write: float = 0.0
+
+
+@dataclass
+class TrackStats:
+    name: str = ""
+    size: int = 0
+    segments: int = 0
+    # Wall-clock seconds of the download, from the first request until the last segment.
+    duration: float = 0.0
+    ttfb_sum: float = 0.0
+    time_wait_sum: float = 0.0
+    time_write_sum: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.size / self.duration if self.duration else 0.0
+
+    @property
+    def ttfb_avg(self) -> float:
+        return self.ttfb_sum / self.segments if self.segments else 0.0
+
+
+@dataclass
+class SessionStats:
+    items: int = 0
+    size: int = 0
+    segments: int = 0
+    # Wall-clock seconds, in which at least one item was downloading.
+    duration: float = 0.0
+    # Tag writes, which did not fit into the padding and rewrote the whole file.
+    rewrites: int = 0
+
+    @property
+    def throughput(self) -> float:
+        return self.size / self.duration if self.duration else 0.0
+
+
+@dataclass
+class TrackExtras:
+    # Futures of data, which is fetched while the track is downloading: lyrics (str) and covers (embedded cover and
+    # cover of the album file, see `Download.covers_fetch`).
+    lyrics: futures.Future
+    covers: futures.Future
 
 
 @dataclass
@@ -10,4 +72,53 @@ class DownloadSegmentResult:
     url: str
     path_segment: pathlib.Path
     id_segment: int
-    error: HTTPError | None = None
+    error: Exception | None = None
+    index: int = 0
+    attempts: int = 0
+    stats: SegmentStats = field(default_factory=SegmentStats)
+
+
+@dataclass_json
+@dataclass
+class JournalSegment:
+    index: int
+    size: int
+    checksum: str
+
+
+@dataclass_json
+@dataclass
+class Journal:
+    fingerprint: str = ""
+    segments_count: int = 0
+    segments: list[JournalSegment] = field(default_factory=list)
+
+
+@dataclass_json
+@dataclass
+class JobItem:
+    status: QueueDownloadStatus = QueueDownloadStatus.Waiting
+    # Destination file, once known.
+    path_file: str = ""
+
+
+# Download job of a list item and the progress task of its list. The job returns its result and the destination file.
+Job = tuple[Callable[[], tuple[bool, pathlib.Path | str]], TaskID]
+
+
+@dataclass_json
+@dataclass
+class JobList:
+    # Jobs by ID of the list item.
+    items: dict[str, JobItem] = field(default_factory=dict)
+
+
+@dataclass
+class ConcurrencyLimits:
+    adaptive: bool
+    limit: int
+    limit_max: int
+    slots_used: int
+    tracks_active: int
+    throughput: float = 0.0
+    decreases: int = 0
@@ -13,6 +13,7 @@ try:
         item_name: QtCore.Signal
         list_item: QtCore.Signal
         list_name: QtCore.Signal
+        item_throughput: QtCore.Signal | None = None
 
 except ModuleNotFoundError:
 
@@ -10,6 +10,7 @@ from tidalapi.media import Quality
 
 from tidal_dl_ng.download import Download
 from tidal_dl_ng.constants import MediaType, QualityVideo
+from tidal_dl_ng.helper.scheduler import ConnectionScheduler
 from tidal_dl_ng.helper.wrapper import LoggerWrapped
 from tidal_dl_ng_mcp.utils.auth import get_tidal_instance, require_auth
 
@@ -381,10 +382,19 @@ async def get_download_settings() -> str:
         # Get default download path
         default_path = str(pathlib.Path.home() / "Music" / "TIDAL")
 
+        # Get the connection limit (chosen by the adaptive mode, if enabled)
+        limits = ConnectionScheduler().limits()
+        connections = f"{limits.limit} of max. {limits.limit_max}" + (
+            f" (adaptive, {limits.throughput / 1048576:.1f} MiB/s, {limits.decreases} decreases)"
+            if limits.adaptive
+            else ""
+        )
+
         return f"""=== TIDAL DOWNLOAD SETTINGS ===
 
 Current Quality: {quality_name}
 Default Location: {default_path}
+Simultaneous Connections: {connections}
 
 Available Quality Options:
 - Low: 320 kbps AAC